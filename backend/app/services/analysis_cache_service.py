@@ -0,0 +1,236 @@
+"""
+Analysis Result Cache - content-addressed cache for hybrid clause analysis.
+
+Re-opening a document that was already analyzed would otherwise re-run
+Legal-BERT inference and all 28 regex clauses on the same text. Results are
+cached under a key derived from:
+
+- a SHA-256 hash of the cleaned text (and the ML max_length),
+- the ML model version (checkpoint identity + inference settings),
+- the regex pattern-set version (changes with CLAUSE_DEFINITIONS),
+
+so a changed checkpoint or pattern set can never return a stale result.
+
+Two tiers, both size-bounded LRU:
+- memory: the most recently used results (ANALYSIS_CACHE_MEMORY_ENTRIES)
+- disk:   one JSON file per result under uploads/.analysis_cache
+          (ANALYSIS_CACHE_DISK_MB; least recently used files are evicted,
+          file mtime tracks recency)
+
+Exports:
+ - ANALYSIS_CACHE_ENABLED
+ - AnalysisResultCache
+ - make_cache_key(clean_text, max_length, model_version, pattern_version) -> str
+ - get_analysis_cache() -> AnalysisResultCache
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_CACHE_ENABLED = os.getenv("ANALYSIS_CACHE_ENABLED", "true").lower() == "true"
+ANALYSIS_CACHE_MEMORY_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MEMORY_ENTRIES", "64"))
+ANALYSIS_CACHE_DISK_MB = float(os.getenv("ANALYSIS_CACHE_DISK_MB", "256"))
+
+# Storage directory for cached analysis results
+ANALYSIS_CACHE_DIR = Path(__file__).parent.parent.parent / "uploads" / ".analysis_cache"
+
+
+def make_cache_key(clean_text: str, max_length: int, model_version: str, pattern_version: str) -> str:
+    """
+    Build the content-addressed cache key for one analysis.
+
+    Args:
+        clean_text: Text after formatting tags were stripped
+        max_length: Max tokens for the ML model
+        model_version: ML model identity (or "regex-only")
+        pattern_version: Regex pattern-set version
+
+    Returns:
+        str: Hex SHA-256 key
+    """
+    digest = hashlib.sha256()
+    digest.update(clean_text.encode("utf-8", errors="surrogatepass"))
+    digest.update(f"\x00{max_length}\x00{model_version}\x00{pattern_version}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class AnalysisResultCache:
+    """Two-tier (memory + disk) LRU cache of analysis results, keyed by content hash."""
+
+    def __init__(self, cache_dir: Path = ANALYSIS_CACHE_DIR,
+                 memory_entries: int = ANALYSIS_CACHE_MEMORY_ENTRIES,
+                 disk_limit_mb: float = ANALYSIS_CACHE_DISK_MB):
+        self.cache_dir = Path(cache_dir)
+        self.memory_entries = max(0, memory_entries)
+        self.disk_limit_bytes = int(disk_limit_mb * 1024 * 1024)
+
+        # key -> serialized result (kept serialized so callers never share objects)
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._disk_bytes = sum(p.stat().st_size for p in self.cache_dir.glob("*.json"))
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Look up a cached result.
+
+        Returns:
+            (result, "memory" | "disk") on a hit, (None, None) on a miss
+        """
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return json.loads(payload), "memory"
+
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = f.read()
+            result = json.loads(payload)
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            with self._lock:
+                self._stats["misses"] += 1
+            return None, None
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Dropping unreadable cache entry {path.name}: {e}")
+            self._remove_file(path)
+            with self._lock:
+                self._stats["misses"] += 1
+            return None, None
+
+        with self._lock:
+            self._stats["disk_hits"] += 1
+            self._remember(key, payload)
+        return result, "disk"
+
+    def put(self, key: str, result: Dict) -> None:
+        """Store a result in both tiers, evicting least recently used entries."""
+        payload = json.dumps(result, ensure_ascii=False, default=str)
+
+        path = self._path(key)
+        tmp_path = None
+        try:
+            # One temp file per writer: concurrent puts of the same key must
+            # not write into (or rename away) each other's file
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.cache_dir, prefix=f"{key}.", suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = Path(f.name)
+                f.write(payload)
+            with self._lock:
+                previous_size = path.stat().st_size if path.exists() else 0
+                os.replace(tmp_path, path)
+                size = path.stat().st_size
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write analysis cache entry: {e}")
+            if tmp_path is not None:
+                self._remove_file(tmp_path)
+            size = previous_size = 0
+
+        with self._lock:
+            self._remember(key, payload)
+            self._stats["stores"] += 1
+            self._disk_bytes += size - previous_size
+            over_limit = self._disk_bytes > self.disk_limit_bytes
+
+        if over_limit:
+            self._evict_disk()
+
+    def _remember(self, key: str, payload: str) -> None:
+        """Insert into the memory tier (caller holds the lock)."""
+        if self.memory_entries == 0:
+            return
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _remove_file(self, path: Path) -> int:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+            return size
+        except OSError:
+            return 0
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used files until the disk tier is within its limit."""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= self.disk_limit_bytes:
+                break
+            total -= self._remove_file(path)
+            evicted += 1
+
+        with self._lock:
+            self._disk_bytes = total
+            self._stats["evictions"] += evicted
+        if evicted:
+            logger.info(f"🧹 Evicted {evicted} analysis cache entries ({total / 1024 / 1024:.1f} MB kept)")
+
+    def clear(self) -> None:
+        """Remove every cached result from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._disk_bytes = 0
+        for path in self.cache_dir.glob("*.json"):
+            self._remove_file(path)
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and current tier sizes."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_bytes"] = self._disk_bytes
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+
+# Global cache instance (lazy loaded)
+_analysis_cache_instance = None
+_analysis_cache_lock = threading.Lock()
+
+
+def get_analysis_cache() -> AnalysisResultCache:
+    """
+    Get or create the global analysis result cache.
+
+    Returns:
+        AnalysisResultCache: Shared cache instance
+    """
+    global _analysis_cache_instance
+
+    if _analysis_cache_instance is None:
+        with _analysis_cache_lock:
+            if _analysis_cache_instance is None:
+                _analysis_cache_instance = AnalysisResultCache()
+
+    return _analysis_cache_instance
@@ -12,7 +12,12 @@ Future enhancements: ML model integration, LLM suggestions for missing clauses
 """
 
 from typing import Dict, List, Tuple, Optional
-from .clause_patterns import detect_all_clauses, get_corrupted_regions, CLAUSE_DEFINITIONS
+from .clause_patterns import (
+    detect_all_clauses,
+    detect_clauses_incremental,
+    get_corrupted_regions,
+    CLAUSE_DEFINITIONS,
+)
 
 
 class ClauseStatus:
@@ -20,6 +25,8 @@ class ClauseStatus:
     PRESENT = "Present"
     MISSING = "Missing"
     CORRUPT = "Corrupted"
+    TIMEOUT = "Timeout"
+    TRUNCATED = "Truncated"
 
 
 def analyze_clause_detection(text: str) -> Dict:
@@ -30,6 +37,9 @@ def analyze_clause_detection(text: str) -> Dict:
     - Present: Clause found and valid
     - Missing: Clause not found in document
     - Corrupted: Clause found but contains corruption indicators
+    - Timeout: A pattern exceeded its time budget, so the result is undetermined
+    - Truncated: Not found in the capped part of a longer search region, so the
+      result is undetermined
     
     Args:
         text: Extracted and cleaned text from legal judgment PDF
@@ -41,6 +51,37 @@ def analyze_clause_detection(text: str) -> Dict:
     # Detect all clauses using regex patterns
     clause_results = detect_all_clauses(text)
     
+    return _build_analysis(text, clause_results)
+
+
+def reanalyze_clause_detection(previous_analysis: Dict, old_text: str, new_text: str,
+                               changes: Optional[List] = None) -> Dict:
+    """
+    Re-analyze a judgment after an edit (e.g. through /save-text).
+    
+    Only clauses whose search region or previously matched span overlaps the
+    edited range are detected again; the rest are carried over from
+    previous_analysis with their offsets shifted. The result is the same as
+    analyze_clause_detection(new_text).
+    
+    Args:
+        previous_analysis: analyze_clause_detection() result for old_text
+        old_text: Text previous_analysis was computed on
+        new_text: Edited text
+        changes: Optional edit diff of the clean text (TextChange list)
+        
+    Returns:
+        Dict: Same structure as analyze_clause_detection
+    """
+    clause_results = detect_clauses_incremental(
+        previous_analysis.get("clauses", []), old_text, new_text, changes=changes
+    )
+    
+    return _build_analysis(new_text, clause_results)
+
+
+def _build_analysis(text: str, clause_results: List[Dict]) -> Dict:
+    """Assemble the analysis response from clause results."""
     # Get corrupted regions for highlighting
     corrupted_regions = get_corrupted_regions(text, clause_results)
     
@@ -76,12 +117,16 @@ def get_clause_statistics(clauses: List[Dict]) -> Dict:
     present = sum(1 for c in clauses if c["status"] == ClauseStatus.PRESENT)
     missing = sum(1 for c in clauses if c["status"] == ClauseStatus.MISSING)
     corrupted = sum(1 for c in clauses if c["status"] == ClauseStatus.CORRUPT)
+    timeout = sum(1 for c in clauses if c["status"] == ClauseStatus.TIMEOUT)
+    truncated = sum(1 for c in clauses if c["status"] == ClauseStatus.TRUNCATED)
     
     return {
         "total_clauses": total,
         "present": present,
         "missing": missing,
         "corrupted": corrupted,
+        "timeout": timeout,
+        "truncated": truncated,
         "completion_percentage": round((present / total) * 100, 2) if total > 0 else 0
     }
 
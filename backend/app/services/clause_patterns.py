@@ -7,10 +7,33 @@ Uses position-based detection for accurate clause identification.
 Each clause has patterns to detect its presence and potential corruption.
 """
 
+import hashlib
+import json
+import os
 import re
 import logging
+import time
 from typing import List, Dict, Tuple, Optional
 
+from .document_index import DocumentIndex, get_document_index
+from .text_merge_service import get_text_diff
+
+try:
+    import regex as _regex
+except ImportError:  # pragma: no cover - optional dependency
+    _regex = None
+
+# Private parser/compiler used to derive literal prefilters; any problem with
+# them only disables the prefilters (see _pattern_prefilter)
+try:
+    from re import _parser as _sre_parse, _compiler as _sre_compile  # Python 3.11+
+except ImportError:  # pragma: no cover - older interpreters
+    try:
+        import sre_parse as _sre_parse
+        import sre_compile as _sre_compile
+    except ImportError:
+        _sre_parse = _sre_compile = None
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -34,6 +57,46 @@ _WORDED_DATE = r"\d{1,2}(?:st|nd|rd|th)?\s+" + _MONTHS + r"[\s,]+\d{2,4}"
 # Combined date pattern
 _ANY_DATE = rf"(?:{_NUMERIC_DATE}|{_WORDED_DATE})"
 
+# Date value directly following a keyword such as "Argued on:" (requires_value clauses)
+_VALUE_NUMERIC_DATE_RE = re.compile(r"\s*" + _NUMERIC_DATE, re.IGNORECASE)
+_VALUE_WORDED_DATE_RE = re.compile(r"\s*" + _WORDED_DATE, re.IGNORECASE)
+
+# Flags used for every main/fallback clause pattern
+_PATTERN_FLAGS = re.MULTILINE | re.IGNORECASE
+
+# Opt-in hard time budget (CLAUSE_PATTERN_BUDGET=true, needs the `regex`
+# package). With it, every main/fallback pattern runs through `regex` with a
+# per-search timeout over its whole search region, and a clause whose pattern
+# overruns reports TIMEOUT_STATUS instead of being silently treated as
+# Missing. Without it, patterns run on the stdlib engine (~1.7x faster, no
+# timeouts) and each search is capped at _MAX_SEARCH_LEN chars; a clause not
+# found in a capped region reports TRUNCATED_STATUS. The default timeout sits
+# just above the profiled worst case on the `regex` engine (JudgeNames main
+# #2, ~240 ms on the bundled casefiles; every other pattern is under 100 ms,
+# see scripts/profile_clause_patterns.py). Whether a budget fires depends on
+# machine load, hence opt-in.
+PATTERN_TIMEOUT_MS = float(os.getenv("CLAUSE_PATTERN_TIMEOUT_MS", "250"))
+PATTERN_BUDGET_REQUESTED = os.getenv("CLAUSE_PATTERN_BUDGET", "false").lower() == "true"
+PATTERN_BUDGET_ENABLED = PATTERN_BUDGET_REQUESTED and _regex is not None and PATTERN_TIMEOUT_MS > 0
+
+if PATTERN_BUDGET_REQUESTED and _regex is None:
+    logger.warning("⚠️ CLAUSE_PATTERN_BUDGET is set but the `regex` package is not installed; "
+                   "clause searches stay capped at the first 50,000 chars of their region")
+
+# Clause status for a pattern that exceeded its time budget
+TIMEOUT_STATUS = "Timeout"
+
+# Clause status when nothing matched but the capped search did not reach the
+# end of the clause's region (the clause may be in the unsearched part)
+TRUNCATED_STATUS = "Truncated"
+
+# Without a time budget (stdlib engine), cap the number of chars a single
+# clause search may scan to limit catastrophic backtracking
+_MAX_SEARCH_LEN = 50000
+
+# Chars after a keyword inspected for its value (requires_value clauses)
+_VALUE_LOOKAHEAD = 150
+
 
 def _get_line_context(
     text: str, start_pos: int, end_pos: int
@@ -48,49 +111,37 @@ def _get_line_context(
     Returns:
         Tuple (line_text, line_start, line_end).
     """
-    line_start = text.rfind('\n', 0, start_pos)
-    line_start = line_start + 1 if line_start != -1 else 0
+    return get_document_index(text).line_context(start_pos, end_pos)
 
-    line_end = text.find('\n', end_pos)
-    if line_end == -1:
-        line_end = len(text)
 
-    return text[line_start:line_end].strip(), line_start, line_end
+# General corruption heuristics fused into one compiled scanner.
+# Same signals as corruption_detection_service plus targeted extras.
+_ANY_CORRUPTION_RE = re.compile(
+    r'\uFFFD'                       # Unicode replacement char
+    r'|\[CORRUPTED:'                # Explicit corruption marker
+    r'|\b#{2,}'                     # Two or more consecutive # chars
+    r'|[#*%]{2,}'                   # Two or more of # * % in a row (OCR garble)
+    r'|[^\w\s]{3,}'                 # 3+ consecutive non-word, non-space chars
+)
 
 
 def _has_any_corruption(text: str) -> bool:
     """Comprehensive corruption check using layered heuristics.
 
     Uses the same signals as corruption_detection_service plus targeted extras.
-    Returns True as soon as any corruption signal is found.
+    Returns True as soon as any corruption signal is found. Whole lines of an
+    indexed document are better checked with DocumentIndex.lines_corrupted().
     """
     if not text:
         return False
-
-    _CORRUPTION_PATTERNS = [
-        r'\uFFFD',                   # Unicode replacement char
-        r'\[CORRUPTED:',             # Explicit corruption marker
-        r'\b#{2,}',                  # Two or more consecutive # chars
-        r'[#*%]{2,}',                # Two or more of # * % in a row (OCR garble)
-        r'[^\w\s]{3,}',              # 3+ consecutive non-word, non-space chars
-    ]
-    for pat in _CORRUPTION_PATTERNS:
-        try:
-            if re.search(pat, text):
-                return True
-        except re.error:
-            pass
-    return False
+    return _ANY_CORRUPTION_RE.search(text) is not None
 
 
-def _clause_specific_corrupted(text: str, indicators: list) -> bool:
-    """Check clause-specific corruption indicators against text."""
+def _clause_specific_corrupted(text: str, indicators: List[re.Pattern]) -> bool:
+    """Check precompiled clause-specific corruption indicators against text."""
     for indicator in indicators:
-        try:
-            if re.search(indicator, text):
-                return True
-        except re.error:
-            pass
+        if indicator.search(text):
+            return True
     return False
 
 
@@ -123,6 +174,65 @@ def preprocess_text(text: str) -> str:
     return text.strip()
 
 
+# Search-region rules: clause_key -> (start, end_cap).
+# A negative start means "this many chars before the end of the text";
+# an end_cap of None means "to the end of the text".
+_REGION_RULES: Dict[str, Tuple[int, Optional[int]]] = {
+    # HEADER (always in first ~500 chars)
+    "CourtTitle": (0, 500),
+    "MatterDescription": (0, 500),
+
+    # HEADER/CASE IDENTIFIERS ✅ Verified
+    "CaseNumber": (0, 5000),  # Verified: max=1138, avg=458
+    "CaseYear": (0, 6000),
+    "LowerCourtNumber": (0, 3000),
+    "AppealType": (0, 8000),
+
+    # PARTY BLOCKS (chars 0-5000)
+    "Petitioner": (0, 5000),
+    "Respondent": (0, 5000),
+    "Plaintiff": (0, 5000),
+    "Defendant": (0, 5000),
+    "PetitionerBlock": (0, 5000),
+    "RespondentBlock": (0, 5000),
+    "PlaintiffBlock": (0, 5000),
+    "DefendantBlock": (0, 5000),
+
+    # PROCEDURAL SECTION ✅ VERIFIED (450 files)
+    # Measured: BeforeBench avg=1835, max=13212; JudgeNames avg=2891, max=14258
+    "BeforeBench": (400, 15000),  # Verified expansion
+    "JudgeNames": (400, 15000),  # Verified expansion
+    "CounselForAppellant": (400, 15000),
+    "CounselForRespondent": (400, 15000),
+    "InstructedBy": (400, 15000),
+    "CounselSection": (400, 15000),
+
+    # DATES ✅ VERIFIED (450 files)
+    # Measured: ArguedOn avg=2197, max=13087; DecidedOn avg=2226, max=13134
+    "ArguedOn": (500, 15000),  # Verified expansion
+    "DecidedOn": (500, 15000),  # Verified expansion
+
+    # BODY (search full document)
+    "Jurisdiction": (0, None),
+    "LegalProvisionsCited": (0, None),
+
+    # FOOTER ✅ VERIFIED (450 files)
+    # Measured: avg position 98.72% of document
+    "JudgeSignature": (-3000, None),  # Last 3000 chars for safety
+}
+
+_DEFAULT_REGION_RULE: Tuple[int, Optional[int]] = (0, None)
+
+
+def _resolve_region(text_len: int, rule: Tuple[int, Optional[int]]) -> Tuple[int, int]:
+    """Turn a (start, end_cap) region rule into absolute offsets for a text length."""
+    start, end_cap = rule
+    if start < 0:
+        start = max(0, text_len + start)
+    end = text_len if end_cap is None else min(end_cap, text_len)
+    return start, end
+
+
 def get_search_region(text: str, clause_name: str) -> Tuple[int, int]:
     """
     Return (start, end) char indices to search for this clause.
@@ -137,51 +247,7 @@ def get_search_region(text: str, clause_name: str) -> Tuple[int, int]:
     Returns:
         Tuple of (start_position, end_position) in characters
     """
-    L = len(text)
-    regions = {
-        # HEADER (always in first ~500 chars)
-        "CourtTitle": (0, min(500, L)),
-        "MatterDescription": (0, min(500, L)),
-        
-        # HEADER/CASE IDENTIFIERS ✅ Verified
-        "CaseNumber": (0, min(5000, L)),  # Verified: max=1138, avg=458
-        "CaseYear": (0, min(6000, L)),
-        "LowerCourtNumber": (0, min(3000, L)),
-        "AppealType": (0, min(8000, L)),
-        
-        # PARTY BLOCKS (chars 0-5000)
-        "Petitioner": (0, min(5000, L)),
-        "Respondent": (0, min(5000, L)),
-        "Plaintiff": (0, min(5000, L)),
-        "Defendant": (0, min(5000, L)),
-        "PetitionerBlock": (0, min(5000, L)),
-        "RespondentBlock": (0, min(5000, L)),
-        "PlaintiffBlock": (0, min(5000, L)),
-        "DefendantBlock": (0, min(5000, L)),
-        
-        # PROCEDURAL SECTION ✅ VERIFIED (450 files)
-        # Measured: BeforeBench avg=1835, max=13212; JudgeNames avg=2891, max=14258
-        "BeforeBench": (400, min(15000, L)),  # Verified expansion
-        "JudgeNames": (400, min(15000, L)),  # Verified expansion
-        "CounselForAppellant": (400, min(15000, L)),
-        "CounselForRespondent": (400, min(15000, L)),
-        "InstructedBy": (400, min(15000, L)),
-        "CounselSection": (400, min(15000, L)),
-        
-        # DATES ✅ VERIFIED (450 files)
-        # Measured: ArguedOn avg=2197, max=13087; DecidedOn avg=2226, max=13134
-        "ArguedOn": (500, min(15000, L)),  # Verified expansion
-        "DecidedOn": (500, min(15000, L)),  # Verified expansion
-        
-        # BODY (search full document)
-        "Jurisdiction": (0, L),
-        "LegalProvisionsCited": (0, L),
-        
-        # FOOTER ✅ VERIFIED (450 files)
-        # Measured: avg position 98.72% of document
-        "JudgeSignature": (max(0, L - 3000), L),  # Last 3000 chars for safety
-    }
-    return regions.get(clause_name, (0, L))
+    return _resolve_region(len(text), _REGION_RULES.get(clause_name, _DEFAULT_REGION_RULE))
 
 # 28 Legal Clauses for Supreme Court Judgments
 # ✅ VERIFIED patterns from clause_regrexs.md (Version 4.0)
@@ -599,6 +665,276 @@ CLAUSE_DEFINITIONS = {
 }
 
 
+def _compile_patterns(clause_key: str, patterns: List[str], flags: int = 0) -> List[re.Pattern]:
+    """Compile a clause's pattern list, logging and skipping invalid entries."""
+    compiled = []
+    for idx, pattern in enumerate(patterns):
+        try:
+            compiled.append(re.compile(pattern, flags))
+        except re.error as e:
+            logger.warning(f"⚠️ Skipping invalid pattern {idx+1} for {clause_key}: {e}")
+    return compiled
+
+
+# ─── Literal keyword prefilters ──────────────────────────────────────────────
+# Every main/fallback pattern is parsed once to find what any match MUST
+# contain, so patterns that cannot match in a search region are skipped
+# without running the (possibly backtracking-heavy) regex:
+#   * literal keywords, e.g. "argued" | "heard" for the Argued-on patterns;
+#   * a required fragment: the last top-level run of cheap, literal-anchored
+#     nodes, e.g. "(?:J\.|CJ\.|PCJ)\b" at the end of the judge-name pattern.
+
+# Shortest literal worth using as a prefilter
+_MIN_PREFILTER_LITERAL = 3
+
+# Non-ASCII chars that IGNORECASE matching folds onto ASCII letters but
+# str.lower() does not (dotted/dotless i, long s). Documents containing any of
+# them skip the keyword check so the lower-cased lookup stays exact.
+_FOLD_UNSAFE_RE = re.compile('[\u0130\u0131\u017f]')
+
+try:
+    _REPEAT_OPS = tuple(
+        getattr(_sre_parse, name)
+        for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+        if hasattr(_sre_parse, name)
+    )
+
+    # Single-character atoms (cheap to match, never backtrack on their own)
+    _ATOM_OPS = (_sre_parse.LITERAL, _sre_parse.NOT_LITERAL, _sre_parse.IN, _sre_parse.ANY)
+except Exception:  # pragma: no cover - parser internals changed or unavailable
+    _sre_parse = _sre_compile = None
+    _REPEAT_OPS = _ATOM_OPS = ()
+
+if _sre_parse is None:  # pragma: no cover
+    logger.warning("⚠️ Regex parser internals unavailable; clause patterns run without prefilters")
+
+
+def _required_literals(items, min_length: int = _MIN_PREFILTER_LITERAL) -> List[Tuple[str, ...]]:
+    """
+    Collect the literal requirements of a parsed (sub)pattern.
+
+    Returns a list of alternatives groups: every match contains at least one
+    literal (lower-cased) from EACH group. Lookarounds, optional repeats and
+    non-literal atoms contribute nothing, so the result is always a necessary
+    condition for a match (possibly an empty, i.e. trivially true, one).
+    """
+    requirements = []
+    run = []
+
+    def flush():
+        literal = "".join(run)
+        if len(literal) >= min_length and literal.isascii():
+            requirements.append((literal.lower(),))
+        run.clear()
+
+    for op, av in items:
+        if op is _sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        flush()
+
+        if op is _sre_parse.SUBPATTERN:
+            requirements.extend(_required_literals(av[-1], min_length))
+        elif op is getattr(_sre_parse, "ATOMIC_GROUP", None):
+            requirements.extend(_required_literals(av, min_length))
+        elif op in _REPEAT_OPS:
+            min_count, _, body = av
+            if min_count >= 1:
+                requirements.extend(_required_literals(body, min_length))
+        elif op is _sre_parse.BRANCH:
+            # Any one alternative may match: keep the longest requirement of
+            # each alternative and accept whichever shows up.
+            choices = []
+            for alternative in av[1]:
+                alt_requirements = _required_literals(alternative, min_length)
+                if not alt_requirements:
+                    choices = None
+                    break
+                choices.extend(max(alt_requirements, key=lambda g: min(map(len, g))))
+            if choices:
+                requirements.append(tuple(dict.fromkeys(choices)))
+    flush()
+    return requirements
+
+
+def _is_cheap(items) -> bool:
+    """True if the parsed nodes only use atoms, anchors, groups/branches of
+    those, and repeats of a single atom (no nested backtracking)."""
+    for op, av in items:
+        if op in _ATOM_OPS or op is _sre_parse.AT:
+            continue
+        if op is _sre_parse.SUBPATTERN:
+            if not _is_cheap(av[-1]):
+                return False
+        elif op is _sre_parse.BRANCH:
+            if not all(_is_cheap(alternative) for alternative in av[1]):
+                return False
+        elif op in _REPEAT_OPS:
+            body = av[2]
+            if len(body) != 1 or body[0][0] not in _ATOM_OPS:
+                return False
+        else:
+            return False
+    return True
+
+
+def _required_fragment(pattern: re.Pattern, parsed) -> Optional[re.Pattern]:
+    """
+    Compile the last top-level run of cheap nodes that contains a literal.
+
+    Any match of `pattern` contains a match of this fragment evaluated at the
+    same positions, so a fragment miss over a region proves the full pattern
+    cannot match there. Returns None when the pattern is cheap as a whole
+    (the fragment would not be any faster) or has no such run.
+    """
+    runs = [[]]
+    for item in parsed.data:
+        if _is_cheap([item]):
+            runs[-1].append(item)
+        elif runs[-1]:
+            runs.append([])
+
+    candidates = [run for run in runs if run and _required_literals(run, min_length=1)]
+    if not candidates or len(candidates[-1]) == len(parsed.data):
+        return None
+    return _sre_compile.compile(_sre_parse.SubPattern(parsed.state, candidates[-1]), pattern.flags)
+
+
+def _pattern_prefilter(pattern: re.Pattern) -> Tuple[Tuple[Tuple[str, ...], ...], Optional[re.Pattern]]:
+    """Return (literal keyword groups, required fragment) for a compiled pattern.
+
+    Built on the private re parser/compiler, whose internals change between
+    CPython releases: if they are missing or anything goes wrong the pattern
+    gets no prefilter and is always executed.
+    """
+    if _sre_parse is None:
+        return (), None
+    try:
+        parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+        return tuple(_required_literals(parsed)), _required_fragment(pattern, parsed)
+    except Exception as e:
+        logger.debug(f"No prefilter for {pattern.pattern[:60]!r}: {e}")
+        return (), None
+
+
+class _PrefilterIndex:
+    """Memoised prefilter checks over one document.
+
+    Keyword lookups are case-insensitive and keyed by (keyword, region), so
+    clauses that share a search region share every keyword check made for it.
+    """
+
+    def __init__(self, text: str):
+        self._text = text
+        self._lowered = None if _FOLD_UNSAFE_RE.search(text) else text.lower()
+        self._hits: Dict[Tuple[str, int, int], bool] = {}
+
+    def may_match(self, prefilter, start: int, end: int) -> bool:
+        """False only if the pattern provably cannot match inside [start, end)."""
+        keyword_groups, fragment = prefilter
+        if self._lowered is not None:
+            for group in keyword_groups:
+                if not any(self._contains(keyword, start, end) for keyword in group):
+                    return False
+        if fragment is not None and fragment.search(self._text, start, end) is None:
+            return False
+        return True
+
+    def _contains(self, keyword: str, start: int, end: int) -> bool:
+        key = (keyword, start, end)
+        hit = self._hits.get(key)
+        if hit is None:
+            hit = self._lowered.find(keyword, start, end) != -1
+            self._hits[key] = hit
+        return hit
+
+
+def _budgeted(pattern: re.Pattern):
+    """Return the pattern detection executes: its `regex` twin when the budget is enabled."""
+    if PATTERN_BUDGET_ENABLED:
+        return _regex.compile(pattern.pattern, pattern.flags & _PATTERN_FLAGS)
+    return pattern
+
+
+def _search_pattern(pattern, text: str, pos: int, endpos: int):
+    """Search one clause pattern within [pos, endpos), enforcing the time budget.
+
+    Raises:
+        TimeoutError: If the budget is enabled and the search overruns it.
+    """
+    if isinstance(pattern, re.Pattern):
+        return pattern.search(text, pos, endpos)
+    return pattern.search(text, pos, endpos, timeout=PATTERN_TIMEOUT_MS / 1000.0)
+
+
+def _with_prefilters(patterns: List[re.Pattern]) -> List[Tuple[re.Pattern, Tuple]]:
+    """Pair each (executed) pattern with the prefilter derived from it."""
+    return [(_budgeted(pattern), _pattern_prefilter(pattern)) for pattern in patterns]
+
+
+def _build_clause_registry() -> Dict[str, Dict]:
+    """
+    Precompile every clause definition once at import time.
+
+    Each entry carries the compiled main/fallback patterns (with the
+    MULTILINE | IGNORECASE flags detection uses) paired with their
+    prefilters, the compiled corruption indicators, the
+    requires_value flag and the clause's search-region rule.
+    """
+    registry = {}
+    for clause_key, clause_def in CLAUSE_DEFINITIONS.items():
+        registry[clause_key] = {
+            "patterns": _with_prefilters(
+                _compile_patterns(clause_key, clause_def["patterns"], _PATTERN_FLAGS)
+            ),
+            "fallback_patterns": _with_prefilters(
+                _compile_patterns(clause_key, clause_def.get("fallback_patterns", []), _PATTERN_FLAGS)
+            ),
+            "corruption_indicators": _compile_patterns(
+                clause_key, clause_def.get("corruption_indicators", [])
+            ),
+            "requires_value": clause_def.get("requires_value", False),
+            "region": _REGION_RULES.get(clause_key, _DEFAULT_REGION_RULE),
+        }
+    return registry
+
+
+def _group_clauses_by_region(registry: Dict[str, Dict]) -> Dict[Tuple[int, Optional[int]], List[str]]:
+    """Group clause keys that share a search-region rule (definition order kept)."""
+    groups: Dict[Tuple[int, Optional[int]], List[str]] = {}
+    for clause_key, compiled in registry.items():
+        groups.setdefault(compiled["region"], []).append(clause_key)
+    return groups
+
+
+# Compiled clause registry (clause_key -> compiled patterns + region rule)
+_COMPILED_CLAUSES = _build_clause_registry()
+
+# Clauses grouped by search region for single-pass scanning
+_REGION_GROUPS = _group_clauses_by_region(_COMPILED_CLAUSES)
+
+
+def _compute_pattern_set_version() -> str:
+    """
+    Fingerprint everything that determines regex detection results: the
+    clause definitions, the search-region rules and this module's code.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(CLAUSE_DEFINITIONS, sort_keys=True, default=str).encode("utf-8"))
+    digest.update(json.dumps({"regions": _REGION_RULES, "default": _DEFAULT_REGION_RULE},
+                             sort_keys=True).encode("utf-8"))
+    try:
+        with open(__file__, "rb") as f:
+            digest.update(f.read())
+    except OSError:
+        pass
+    return digest.hexdigest()[:16]
+
+
+# Pattern-set version (changes with CLAUSE_DEFINITIONS); part of result cache keys
+PATTERN_SET_VERSION = _compute_pattern_set_version()
+
+
 def detect_clause(text: str, clause_key: str, use_preprocessing: bool = True) -> Tuple[str, Optional[str], Optional[int], Optional[int]]:
     """
     Detect a specific clause in the text using position-based search strategy.
@@ -614,31 +950,61 @@ def detect_clause(text: str, clause_key: str, use_preprocessing: bool = True) ->
 
     Returns:
         Tuple of (status, content, start_pos, end_pos)
-        status: "Present", "Missing", or "Corrupted"
+        status: "Present", "Missing", "Corrupted", "Timeout" (a pattern
+            exceeded its time budget) or "Truncated" (no match in the capped
+            part of a longer region); for the last two the outcome is undetermined
         content: Extracted content if found
         start_pos: Start position of the clause in cleaned text
         end_pos: End position of the clause in cleaned text
     """
-    if clause_key not in CLAUSE_DEFINITIONS:
+    compiled = _COMPILED_CLAUSES.get(clause_key)
+    if compiled is None:
         return ("Missing", None, None, None)
 
     # Preprocess text to remove PDF formatting markers
     if use_preprocessing:
         text = preprocess_text(text)
 
-    clause_def = CLAUSE_DEFINITIONS[clause_key]
-    patterns = clause_def["patterns"]
-    corruption_indicators = clause_def.get("corruption_indicators", [])
-
     # Get the search region for this clause (position-based optimisation)
-    region_start, region_end = get_search_region(text, clause_key)
-    search_text = text[region_start:region_end]
+    region_start, region_end = _resolve_region(len(text), compiled["region"])
+
+    return _detect_in_region(text, clause_key, compiled, region_start, region_end,
+                             _PrefilterIndex(text), get_document_index(text))
 
-    logger.debug(f"Detecting clause: {clause_key} (region: {region_start}-{region_end}, {len(search_text)} chars)")
 
-    # Cap search chunk to avoid catastrophic backtracking
-    max_search_len = 50000
-    search_chunk = search_text[:max_search_len] if len(search_text) > max_search_len else search_text
+def _search_end(region_start: int, region_end: int) -> int:
+    """End offset clause patterns actually search up to within a region.
+
+    With the time budget enabled the whole region is searched (every pattern
+    runs under the timeout); otherwise the search window is capped to avoid
+    catastrophic backtracking.
+    """
+    if PATTERN_BUDGET_ENABLED:
+        return region_end
+    return min(region_end, region_start + _MAX_SEARCH_LEN)
+
+
+def _detect_in_region(text: str, clause_key: str, compiled: Dict,
+                      region_start: int, region_end: int,
+                      prefilters: _PrefilterIndex,
+                      doc_index: DocumentIndex) -> Tuple[str, Optional[str], Optional[int], Optional[int]]:
+    """
+    Run one clause's compiled patterns over [region_start, region_end) of text.
+
+    Patterns search the full text between pos/endpos instead of a sliced
+    copy, so match offsets are already absolute. Patterns whose prefilter
+    proves they cannot match in the region are skipped. Line context and
+    the general corruption verdict come from the shared document index.
+
+    Returns the same 4-tuple as detect_clause.
+    """
+    patterns = compiled["patterns"]
+    corruption_indicators = compiled["corruption_indicators"]
+
+    logger.debug(f"Detecting clause: {clause_key} (region: {region_start}-{region_end}, "
+                 f"{max(0, region_end - region_start)} chars)")
+
+    search_end = _search_end(region_start, region_end)
 
     # ── Helper: decide Present / Corrupted for a successful match ──────────
     def _evaluate_match(matched_text: str, abs_start: int, abs_end: int,
@@ -655,8 +1021,8 @@ def detect_clause(text: str, clause_key: str, use_preprocessing: bool = True) ->
         specific_corrupt = _clause_specific_corrupted(matched_text, corruption_indicators)
 
         # 2. General corruption check on the line context
-        line_ctx, lc_start, lc_end = _get_line_context(text, abs_start, abs_end)
-        general_corrupt = _has_any_corruption(line_ctx)
+        line_ctx, lc_start, lc_end = doc_index.line_context(abs_start, abs_end)
+        general_corrupt = doc_index.lines_corrupted(abs_start, abs_end)
 
         if specific_corrupt or general_corrupt:
             logger.debug(f"  ⚠️ Corruption detected in {clause_key} "
@@ -680,19 +1046,11 @@ def detect_clause(text: str, clause_key: str, use_preprocessing: bool = True) ->
                              or _has_any_corruption(matched_text))
 
         # Inspect the text coming after the keyword (up to 150 chars)
-        context_after = text[abs_end:min(abs_end + 150, len(text))]
-
-        # Numeric date: tolerates optional spaces around separators
-        numeric_date_pat = r"\s*\d{1,2}\s*[.\/-]\s*\d{1,2}\s*[.\/-]\s*\d{2,4}"
-        # Worded date: "14th January 2020" / "4th August, 2010"
-        worded_date_pat = (
-            r"\s*\d{1,2}(?:st|nd|rd|th)?\s+"
-            r"(?:January|February|March|April|May|June|July|August|"
-            r"September|October|November|December)[\s,]+\d{2,4}"
-        )
+        context_after = text[abs_end:min(abs_end + _VALUE_LOOKAHEAD, len(text))]
 
-        num_m = re.match(numeric_date_pat, context_after, re.IGNORECASE)
-        wrd_m = re.match(worded_date_pat, context_after, re.IGNORECASE)
+        # Numeric date ("18. 05. 2010") or worded date ("14th January 2020")
+        num_m = _VALUE_NUMERIC_DATE_RE.match(context_after)
+        wrd_m = _VALUE_WORDED_DATE_RE.match(context_after)
         date_match = num_m or wrd_m
         has_valid_date = date_match is not None
 
@@ -725,42 +1083,48 @@ def detect_clause(text: str, clause_key: str, use_preprocessing: bool = True) ->
         return ("Present", full_content, abs_start, abs_end + date_match.end())
 
     # ── MAIN PATTERNS ────────────────────────────────────────────────────────
-    requires_value = clause_def.get("requires_value", False)
+    requires_value = compiled["requires_value"]
 
-    for idx, pattern in enumerate(patterns):
+    for idx, (pattern, prefilter) in enumerate(patterns):
+        if not prefilters.may_match(prefilter, region_start, search_end):
+            continue
         try:
-            logger.debug(f"  Pattern {idx+1}/{len(patterns)}: {pattern[:100]}...")
-            match = re.search(pattern, search_chunk, re.MULTILINE | re.IGNORECASE)
+            logger.debug(f"  Pattern {idx+1}/{len(patterns)}: {pattern.pattern[:100]}...")
+            match = _search_pattern(pattern, text, region_start, search_end)
 
             if match:
                 logger.debug(f"  ✅ Main pattern match for {clause_key}")
                 matched_text = match.group(0)
-                abs_start = region_start + match.start()
-                abs_end = region_start + match.end()
+                abs_start, abs_end = match.span()
 
                 # For clauses that already embed the date in the strict pattern,
                 # requires_value is irrelevant — just do corruption check.
                 return _evaluate_match(matched_text, abs_start, abs_end)
 
+        except TimeoutError:
+            logger.warning(f"  ⏱️ Pattern {idx+1} for {clause_key} exceeded "
+                           f"its {PATTERN_TIMEOUT_MS:g} ms budget")
+            return (TIMEOUT_STATUS, None, None, None)
         except Exception as e:
             logger.warning(f"  ⚠️ Pattern {idx+1} failed for {clause_key}: {str(e)[:100]}")
             continue
 
     # ── FALLBACK PATTERNS ────────────────────────────────────────────────────
-    fallback_patterns = clause_def.get("fallback_patterns", [])
+    fallback_patterns = compiled["fallback_patterns"]
     if fallback_patterns:
         logger.debug(f"  ⚠️ Trying {len(fallback_patterns)} fallback patterns for {clause_key}...")
 
-        for idx, pattern in enumerate(fallback_patterns):
+        for idx, (pattern, prefilter) in enumerate(fallback_patterns):
+            if not prefilters.may_match(prefilter, region_start, search_end):
+                continue
             try:
                 logger.debug(f"  Fallback pattern {idx+1}/{len(fallback_patterns)}")
-                match = re.search(pattern, search_chunk, re.MULTILINE | re.IGNORECASE)
+                match = _search_pattern(pattern, text, region_start, search_end)
 
                 if match:
                     logger.debug(f"  ⚠️ Fallback match found for {clause_key}, checking corruption/value...")
                     matched_text = match.group(0)
-                    abs_start = region_start + match.start()
-                    abs_end = region_start + match.end()
+                    abs_start, abs_end = match.span()
 
                     if requires_value:
                         return _evaluate_requires_value(matched_text, abs_start, abs_end)
@@ -768,21 +1132,52 @@ def detect_clause(text: str, clause_key: str, use_preprocessing: bool = True) ->
                     # Standard non-value clause: check for corruption universally
                     return _evaluate_match(matched_text, abs_start, abs_end, from_fallback=True)
 
+            except TimeoutError:
+                logger.warning(f"  ⏱️ Fallback pattern {idx+1} for {clause_key} exceeded "
+                               f"its {PATTERN_TIMEOUT_MS:g} ms budget")
+                return (TIMEOUT_STATUS, None, None, None)
             except Exception as e:
                 logger.warning(f"  ⚠️ Fallback pattern {idx+1} failed for {clause_key}: {str(e)[:100]}")
                 continue
 
+    if search_end < region_end:
+        logger.debug(f"  ✂️ No match for {clause_key} in the first {_MAX_SEARCH_LEN} chars "
+                     f"of its {region_end - region_start}-char region")
+        return (TRUNCATED_STATUS, None, None, None)
+
     logger.debug(f"  ❌ No match found for {clause_key}")
     return ("Missing", None, None, None)
 
 
-def detect_all_clauses(text: str, use_preprocessing: bool = True) -> List[Dict]:
+def _clause_result(clause_key: str,
+                   outcome: Optional[Tuple[str, Optional[str], Optional[int], Optional[int]]]) -> Dict:
+    """Build the result dict for one clause from its detect_clause 4-tuple.
+
+    A None outcome (detection raised) is reported as Missing.
+    """
+    clause_def = CLAUSE_DEFINITIONS[clause_key]
+    status, content, start_pos, end_pos = outcome or ("Missing", None, None, None)
+    return {
+        "clause_key": clause_key,
+        "clause_name": clause_def["name"],
+        "description": clause_def["description"],
+        "status": status,
+        "content": content,
+        "start_pos": start_pos,
+        "end_pos": end_pos,
+        "confidence": 1.0 if status == "Present" else (0.5 if status == "Corrupted" else 0.0)
+    }
+
+
+def detect_all_clauses(text: str, use_preprocessing: bool = True,
+                       timings: Optional[Dict[str, float]] = None) -> List[Dict]:
     """
     Detect all 28 clauses in the text.
     
     Args:
         text: The legal document text
         use_preprocessing: Whether to clean PDF formatting markers before detection
+        timings: Optional dict filled with the detection time (seconds) of each clause
         
     Returns:
         List of dictionaries containing clause detection results
@@ -798,42 +1193,159 @@ def detect_all_clauses(text: str, use_preprocessing: bool = True) -> List[Dict]:
         logger.info(f"Preprocessing complete ({len(text)} chars after cleaning)")
     
     total_clauses = len(CLAUSE_DEFINITIONS)
-    logger.info(f"Detecting {total_clauses} clauses...")
+    logger.info(f"Detecting {total_clauses} clauses in {len(_REGION_GROUPS)} search regions...")
+
+    # One pass per search region: the region is resolved once and every
+    # clause in it shares the same memoised keyword prefilter checks, plus
+    # the document's line index and corruption scan.
+    prefilters = _PrefilterIndex(text)
+    doc_index = get_document_index(text)
+    detected = {}
+    for rule, clause_keys in _REGION_GROUPS.items():
+        region_start, region_end = _resolve_region(len(text), rule)
+        for clause_key in clause_keys:
+            t0 = time.perf_counter()
+            try:
+                detected[clause_key] = _detect_in_region(
+                    text, clause_key, _COMPILED_CLAUSES[clause_key],
+                    region_start, region_end, prefilters, doc_index
+                )
+            except Exception as e:
+                logger.error(f"  → ERROR detecting {clause_key}: {str(e)}")
+                detected[clause_key] = None
+            if timings is not None:
+                timings[clause_key] = time.perf_counter() - t0
+
+    # Report in CLAUSE_DEFINITIONS order
+    for idx, clause_key in enumerate(CLAUSE_DEFINITIONS, 1):
+        result = _clause_result(clause_key, detected.get(clause_key))
+        results.append(result)
+        logger.info(f"[{idx}/{total_clauses}] {clause_key} → Result: {result['status']}")
     
-    for idx, (clause_key, clause_def) in enumerate(CLAUSE_DEFINITIONS.items(), 1):
-        logger.info(f"[{idx}/{total_clauses}] Detecting: {clause_key}")
-        
+    logger.info(f"Detection complete! Processed {len(results)} clauses")
+    return results
+
+
+def _reuse_offset(previous: Dict, compiled: Dict, old_index: DocumentIndex,
+                  old_len: int, new_len: int,
+                  edit_start: int, edit_end: int) -> Optional[int]:
+    """
+    Decide whether a previous clause result survives an edit unchanged.
+
+    A result depends on its search window (plus the char before it, for \b
+    and ^), the lines around its match (line context and corruption verdict)
+    and, for requires_value clauses, the chars after the keyword.
+
+    Returns:
+        0 if the edit lies entirely after everything the result depends on,
+        the length delta if it lies entirely before a window that moved with
+        the end of the text (e.g. JudgeSignature), or None if the clause has
+        to be re-evaluated.
+    """
+    if previous.get("status") not in ("Present", "Missing", "Corrupted"):
+        return None
+
+    old_start, old_end = _resolve_region(old_len, compiled["region"])
+    new_start, new_end = _resolve_region(new_len, compiled["region"])
+    old_search_end = _search_end(old_start, old_end)
+    new_search_end = _search_end(new_start, new_end)
+
+    dep_start = max(0, old_start - 1)
+    dep_end = old_search_end
+    if compiled["requires_value"]:
+        dep_end += _VALUE_LOOKAHEAD
+
+    start_pos, end_pos = previous.get("start_pos"), previous.get("end_pos")
+    if start_pos is not None and end_pos is not None:
+        line_start, line_end = old_index.line_span(start_pos, end_pos)
+        dep_start = min(dep_start, line_start)
+        dep_end = max(dep_end, line_end + 1, end_pos + _VALUE_LOOKAHEAD)
+
+    if edit_start >= dep_end and (new_start, new_search_end) == (old_start, old_search_end):
+        return 0
+
+    delta = new_len - old_len
+    if (edit_end <= dep_start
+            and new_start == old_start + delta
+            and new_search_end == old_search_end + delta):
+        return delta
+
+    return None
+
+
+def detect_clauses_incremental(previous_results: List[Dict], old_text: str, new_text: str,
+                               changes: Optional[List] = None,
+                               use_preprocessing: bool = True) -> List[Dict]:
+    """
+    Re-detect clauses after an edit, re-evaluating only the affected ones.
+
+    Clauses whose search region (see get_search_region) or previously matched
+    span overlaps the edited range are detected again on the new text; the
+    rest keep their previous result, with offsets shifted when their region
+    moved with the end of the document. The output is the same as
+    detect_all_clauses(new_text).
+
+    Args:
+        previous_results: detect_all_clauses() output for old_text
+        old_text: Text the previous results were computed on
+        new_text: Edited text
+        changes: Optional edit diff (text_merge_service.TextChange list) with
+            offsets into the preprocessed old text; computed with
+            get_text_diff() when omitted
+        use_preprocessing: Whether to clean PDF formatting markers before detection
+
+    Returns:
+        List of dictionaries containing clause detection results
+    """
+    if use_preprocessing:
+        old_text = preprocess_text(old_text)
+        new_text = preprocess_text(new_text)
+
+    previous = {r.get("clause_key"): r for r in previous_results or []}
+    if set(previous) != set(CLAUSE_DEFINITIONS):
+        logger.info("Incremental detection: previous results incomplete, running full detection")
+        return detect_all_clauses(new_text, use_preprocessing=False)
+
+    if changes is None:
+        changes = get_text_diff(old_text, new_text)
+
+    if not changes:
+        return [dict(previous[clause_key]) for clause_key in CLAUSE_DEFINITIONS]
+
+    edit_start = min(change.start_pos for change in changes)
+    edit_end = max(change.end_pos for change in changes)
+    old_index = get_document_index(old_text)
+
+    reused = {}
+    for clause_key, compiled in _COMPILED_CLAUSES.items():
+        offset = _reuse_offset(previous[clause_key], compiled, old_index,
+                               len(old_text), len(new_text), edit_start, edit_end)
+        if offset is None:
+            continue
+        result = dict(previous[clause_key])
+        if offset and result["start_pos"] is not None:
+            result["start_pos"] += offset
+            result["end_pos"] += offset
+        reused[clause_key] = result
+
+    stale = [clause_key for clause_key in CLAUSE_DEFINITIONS if clause_key not in reused]
+    logger.info(f"Incremental detection: edit {edit_start}-{edit_end}, "
+                f"re-evaluating {len(stale)}/{len(CLAUSE_DEFINITIONS)} clauses")
+
+    prefilters = _PrefilterIndex(new_text)
+    doc_index = get_document_index(new_text)
+    for clause_key in stale:
+        compiled = _COMPILED_CLAUSES[clause_key]
+        region_start, region_end = _resolve_region(len(new_text), compiled["region"])
         try:
-            status, content, start_pos, end_pos = detect_clause(text, clause_key, use_preprocessing=False)
-            
-            results.append({
-                "clause_key": clause_key,
-                "clause_name": clause_def["name"],
-                "description": clause_def["description"],
-                "status": status,
-                "content": content,
-                "start_pos": start_pos,
-                "end_pos": end_pos,
-                "confidence": 1.0 if status == "Present" else (0.5 if status == "Corrupted" else 0.0)
-            })
-            
-            logger.info(f"  → Result: {status}")
+            outcome = _detect_in_region(new_text, clause_key, compiled,
+                                        region_start, region_end, prefilters, doc_index)
         except Exception as e:
             logger.error(f"  → ERROR detecting {clause_key}: {str(e)}")
-            # Add a failed result
-            results.append({
-                "clause_key": clause_key,
-                "clause_name": clause_def["name"],
-                "description": clause_def["description"],
-                "status": "Missing",
-                "content": None,
-                "start_pos": None,
-                "end_pos": None,
-                "confidence": 0.0
-            })
-    
-    logger.info(f"Detection complete! Processed {len(results)} clauses")
-    return results
+            outcome = None
+        reused[clause_key] = _clause_result(clause_key, outcome)
+
+    return [reused[clause_key] for clause_key in CLAUSE_DEFINITIONS]
 
 
 def get_corrupted_regions(text: str, clause_results: List[Dict]) -> List[Dict]:
@@ -858,21 +1370,22 @@ def get_corrupted_regions(text: str, clause_results: List[Dict]) -> List[Dict]:
                 "end": result["end_pos"]
             })
     
-    # Also detect general corruption markers
-    corruption_patterns = [
-        (r"\[CORRUPTED:[^\]]+\]", "explicit_marker"),
-        (r"\b#{3,}\b", "hash_placeholder"),  # Changed from 3+ to be stricter
-        (r"\bX{3,}\b", "x_placeholder"),      # Changed from 3+ to be stricter
-        (r"\[MISSING:[^\]]+\]", "missing_marker")
+    # Also detect general corruption markers (derived from the shared document scan)
+    doc_index = get_document_index(text)
+    marker_spans = [
+        (doc_index.markers("CORRUPTED"), "explicit_marker"),
+        (doc_index.hash_runs(3), "hash_placeholder"),  # Changed from 3+ to be stricter
+        (doc_index.x_runs(3), "x_placeholder"),        # Changed from 3+ to be stricter
+        (doc_index.markers("MISSING"), "missing_marker")
     ]
     
-    for pattern, corruption_type in corruption_patterns:
-        for match in re.finditer(pattern, text):
+    for spans, corruption_type in marker_spans:
+        for start, end in spans:
             corrupted_regions.append({
                 "clause_name": f"Corruption ({corruption_type})",
-                "text": match.group(0),
-                "start": match.start(),
-                "end": match.end()
+                "text": text[start:end],
+                "start": start,
+                "end": end
             })
     
     # Sort by position and remove duplicates
@@ -9,7 +9,8 @@ Exports:
 Each dict contains: { 'match': str, 'start': int, 'end': int, 'type': str }
 """
 from typing import List, Dict
-import re
+
+from .document_index import get_document_index
 
 
 def detect_corruptions(text: str) -> List[Dict]:
@@ -26,21 +27,20 @@ def detect_corruptions(text: str) -> List[Dict]:
     if not text:
         return []
 
-    patterns = [
-        (r"\[CORRUPTED:[^\]]+\]", 'marker'),
-        (r"\b#{2,}\b", 'hashes'),
-        (r"\bX{2,}\b", 'placeholder_x'),
-        (r"\uFFFD+", 'replacement_char'),
-        (r"[^\w\s]{3,}", 'nonword_seq')  # Changed from 2+ to 3+ to be more strict
+    # All heuristics are derived from the shared per-document scan
+    index = get_document_index(text)
+    spans = [
+        (index.markers('CORRUPTED'), 'marker'),        # \[CORRUPTED:[^\]]+\]
+        (index.hash_runs(2), 'hashes'),                # \b#{2,}\b
+        (index.x_runs(2), 'placeholder_x'),            # \bX{2,}\b
+        (index.replacement_runs(), 'replacement_char'),  # \uFFFD+
+        (index.nonword_runs(3), 'nonword_seq')         # [^\w\s]{3,} (changed from 2+ to 3+ to be more strict)
     ]
 
     matches = []
-    for pat, ptype in patterns:
-        for m in re.finditer(pat, text):
-            try:
-                matches.append({'match': m.group(0), 'start': m.start(), 'end': m.end(), 'type': ptype})
-            except Exception:
-                continue
+    for found, ptype in spans:
+        for start, end in found:
+            matches.append({'match': text[start:end], 'start': start, 'end': end, 'type': ptype})
 
     # Merge overlapping matches and remove duplicates while preserving order
     matches_sorted = sorted(matches, key=lambda x: (x['start'], -x['end']))
@@ -0,0 +1,194 @@
+"""
+Document Index - per-document line index and corruption scan shared by all checks.
+
+Clause evaluation, get_corrupted_regions and detect_corruptions all need the
+same two facts about a document: where its lines start/end, and where the
+suspicious character runs (garbled punctuation, hash/X placeholders,
+replacement chars, [CORRUPTED:]/[MISSING:] markers) are. This module computes
+both once per text:
+
+- a newline offset array searched with bisect (line context in O(log n));
+- one fused compiled scan over the text collecting every suspicious run,
+  from which a per-line corruption verdict and each heuristic's matches are
+  derived without rescanning.
+
+Exports:
+ - DocumentIndex
+ - get_document_index(text: str) -> DocumentIndex   (small LRU cache)
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import List, Tuple
+
+# One pass finds every run any corruption heuristic can match:
+#   - maximal runs of 2+ non-word, non-space chars (#, *, %, U+FFFD, ...);
+#   - maximal runs of 2+ "X" placeholder chars;
+#   - single "[" (possible marker start) or U+FFFD chars.
+_SUSPICIOUS_RUN_RE = re.compile('[^\\w\\s]{2,}|X{2,}|[\\[\\uFFFD]')
+
+_WORD_CHAR_RE = re.compile(r'\w')
+_REPLACEMENT_RUN_RE = re.compile('\\uFFFD+')
+_MARKER_RES = {
+    'CORRUPTED': re.compile(r'\[CORRUPTED:[^\]]+\]'),
+    'MISSING': re.compile(r'\[MISSING:[^\]]+\]'),
+}
+
+# Chars whose doubling (e.g. "##", "*%") flags a line as garbled
+_GARBLE_CHARS = frozenset('#*%')
+
+# Number of recently used document indexes kept in memory
+_INDEX_CACHE_SIZE = 8
+
+
+class DocumentIndex:
+    """Line offsets and suspicious-run scan for one document text.
+
+    Runs are (start, end) spans into the text; none of them contains a
+    newline, so each belongs to exactly one line.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.newlines: List[int] = [m.start() for m in re.finditer('\n', text)]
+
+        self._nonword_runs: List[Tuple[int, int]] = []
+        self._x_runs: List[Tuple[int, int]] = []
+        self._corrupt_lines: List[int] = []
+
+        for m in _SUSPICIOUS_RUN_RE.finditer(text):
+            start, end = m.span()
+            if text[start] == 'X':
+                self._x_runs.append((start, end))
+                continue
+            self._nonword_runs.append((start, end))
+            if self._run_is_corrupt(start, end):
+                line = self.line_of(start)
+                if not self._corrupt_lines or self._corrupt_lines[-1] != line:
+                    self._corrupt_lines.append(line)
+
+    # ── Line index ───────────────────────────────────────────────────────────
+
+    def line_of(self, pos: int) -> int:
+        """Return the 0-based line number containing character offset `pos`."""
+        return bisect_left(self.newlines, pos)
+
+    def line_span(self, start_pos: int, end_pos: int) -> Tuple[int, int]:
+        """Return (line_start, line_end) of the line(s) surrounding a span.
+
+        line_start follows the last newline before start_pos; line_end is the
+        first newline at or after end_pos (or the end of the text).
+        """
+        first = bisect_left(self.newlines, start_pos)
+        line_start = self.newlines[first - 1] + 1 if first > 0 else 0
+
+        last = bisect_left(self.newlines, end_pos)
+        line_end = self.newlines[last] if last < len(self.newlines) else len(self.text)
+        return line_start, line_end
+
+    def line_context(self, start_pos: int, end_pos: int) -> Tuple[str, int, int]:
+        """Return (stripped line text, line_start, line_end) around a span."""
+        line_start, line_end = self.line_span(start_pos, end_pos)
+        return self.text[line_start:line_end].strip(), line_start, line_end
+
+    # ── Corruption verdicts ──────────────────────────────────────────────────
+
+    def _run_is_corrupt(self, start: int, end: int) -> bool:
+        """General corruption verdict for one non-word run.
+
+        Mirrors the clause checks: U+FFFD, a "[CORRUPTED:" marker, "#"/"*"/"%"
+        doubled, or 3+ consecutive non-word, non-space chars.
+        """
+        run = self.text[start:end]
+        if len(run) >= 3 or '\uFFFD' in run:
+            return True
+        if len(run) == 2 and run[0] in _GARBLE_CHARS and run[1] in _GARBLE_CHARS:
+            return True
+        return run[-1] == '[' and self.text.startswith('[CORRUPTED:', end - 1)
+
+    def lines_corrupted(self, start_pos: int, end_pos: int) -> bool:
+        """True if any line overlapping the line context of a span is corrupt."""
+        first = bisect_left(self.newlines, start_pos)
+        last = bisect_left(self.newlines, end_pos)
+        idx = bisect_left(self._corrupt_lines, first)
+        return idx < len(self._corrupt_lines) and self._corrupt_lines[idx] <= last
+
+    # ── Heuristic matches derived from the scan ──────────────────────────────
+
+    def _is_word_char(self, pos: int) -> bool:
+        return 0 <= pos < len(self.text) and _WORD_CHAR_RE.match(self.text, pos) is not None
+
+    def hash_runs(self, min_len: int) -> List[Tuple[int, int]]:
+        """Spans matched by finditer(r'\\b#{min_len,}\\b'): whole "#" runs
+        flanked by word chars on both sides."""
+        return [
+            (start, end) for start, end in self._nonword_runs
+            if end - start >= min_len
+            and self.text.count('#', start, end) == end - start
+            and self._is_word_char(start - 1) and self._is_word_char(end)
+        ]
+
+    def x_runs(self, min_len: int) -> List[Tuple[int, int]]:
+        """Spans matched by finditer(r'\\bX{min_len,}\\b'): standalone "X" words."""
+        return [
+            (start, end) for start, end in self._x_runs
+            if end - start >= min_len
+            and not self._is_word_char(start - 1) and not self._is_word_char(end)
+        ]
+
+    def replacement_runs(self) -> List[Tuple[int, int]]:
+        """Spans matched by finditer('\\uFFFD+')."""
+        spans = []
+        for start, end in self._nonword_runs:
+            if '\uFFFD' in self.text[start:end]:
+                spans.extend(m.span() for m in _REPLACEMENT_RUN_RE.finditer(self.text, start, end))
+        return spans
+
+    def nonword_runs(self, min_len: int) -> List[Tuple[int, int]]:
+        """Spans matched by finditer(r'[^\\w\\s]{min_len,}') for min_len >= 2."""
+        return [(start, end) for start, end in self._nonword_runs if end - start >= min_len]
+
+    def markers(self, label: str) -> List[Tuple[int, int]]:
+        """Spans matched by finditer(r'\\[LABEL:[^\\]]+\\]') for CORRUPTED / MISSING."""
+        pattern = _MARKER_RES[label]
+        spans = []
+        last_end = 0
+        for start, end in self._nonword_runs:
+            pos = self.text.find('[', start, end)
+            while pos != -1:
+                if pos >= last_end:
+                    m = pattern.match(self.text, pos)
+                    if m:
+                        spans.append(m.span())
+                        last_end = m.end()
+                pos = self.text.find('[', pos + 1, end)
+        return spans
+
+
+_index_cache: "OrderedDict[str, DocumentIndex]" = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def get_document_index(text: str) -> DocumentIndex:
+    """Return the DocumentIndex for `text`, reusing a recently built one.
+
+    Clause detection, get_corrupted_regions and detect_corruptions are called
+    one after another on the same text during an analysis, so they share one
+    index instead of each rescanning the document.
+    """
+    with _index_cache_lock:
+        index = _index_cache.get(text)
+        if index is not None:
+            _index_cache.move_to_end(text)
+            return index
+
+    index = DocumentIndex(text)
+
+    with _index_cache_lock:
+        _index_cache[text] = index
+        _index_cache.move_to_end(text)
+        while len(_index_cache) > _INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
@@ -0,0 +1,232 @@
+"""
+Glossary Matcher - Aho-Corasick automaton over the English legal glossary terms.
+
+The ~9,000-term legal_glossary.csv used to be matched by brute force: one
+substring test per term per paragraph when sectioning and keyword tagging,
+and one compiled \\b...\\b regex per term per section during correction, so
+every section cost O(terms). The automaton finds every term occurrence in one
+pass over the text, O(text length + matches), independent of glossary size.
+
+Matching semantics (shared by all call sites):
+- case-insensitive (text and terms are lower-cased),
+- word boundaries exactly like regex \\b: a term never matches inside a
+  longer word ('petit' in 'petitioner', 'vice' in 'services'),
+- longest match: overlapping occurrences are resolved leftmost-longest, so
+  'labour tribunal' wins over 'tribunal' at the same place.
+
+The built automaton is pickled under uploads/.glossary_cache, keyed by the
+CSV's size and mtime, so only the first start after a glossary edit pays for
+the build.
+
+Exports:
+ - GlossaryMatcher
+ - get_glossary_matcher() -> GlossaryMatcher
+"""
+
+import csv
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Container, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent.parent
+GLOSSARY_PATH = ROOT_DIR / "legal_glossary.csv"
+GLOSSARY_CACHE_DIR = Path(__file__).parent.parent.parent / "uploads" / ".glossary_cache"
+
+# Bump when the pickled structure changes
+_CACHE_FORMAT = 1
+
+
+def _is_word(ch: str) -> bool:
+    """Same character class as regex \\w for str patterns."""
+    return ch.isalnum() or ch == "_"
+
+
+class GlossaryMatcher:
+    """Aho-Corasick automaton with \\b word boundaries and leftmost-longest matching."""
+
+    def __init__(self, terms: List[str]):
+        """
+        Args:
+            terms: Glossary terms (lower-cased and de-duplicated here)
+        """
+        self.terms: List[str] = list(dict.fromkeys(t.strip().lower() for t in terms if t.strip()))
+
+        # Trie: node -> {char: child}; node 0 is the root
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[int] = [-1]    # longest term ending at node (index into terms)
+        self._link: List[int] = [0]    # nearest fail-chain node with an output (0 = none)
+        self._build()
+
+    def _build(self) -> None:
+        goto, out = self._goto, self._out
+        for term_id, term in enumerate(self.terms):
+            node = 0
+            for ch in term:
+                child = goto[node].get(ch)
+                if child is None:
+                    child = len(goto)
+                    goto[node][ch] = child
+                    goto.append({})
+                    out.append(-1)
+                node = child
+            out[node] = term_id
+
+        fail = self._fail = [0] * len(goto)
+        link = self._link = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(ch, 0)
+                fail[child] = target if target != child else 0
+                link[child] = target if out[target] >= 0 else link[target]
+
+    def find_all(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        Every word-bounded occurrence of every term, overlapping ones included.
+
+        Args:
+            text: Text to scan (case-insensitive)
+
+        Returns:
+            List[(start, end, term)] in order of end position; offsets index
+            text.lower() (identical to text offsets for ASCII/Sinhala/Tamil)
+        """
+        lower = text.lower()
+        goto, fail, out, link, terms = self._goto, self._fail, self._out, self._link, self.terms
+        n = len(lower)
+
+        matches = []
+        node = 0
+        for i, ch in enumerate(lower):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            hit = node if out[node] >= 0 else link[node]
+            if not hit:
+                continue
+            end = i + 1
+            right_word = end < n and _is_word(lower[end])
+            while hit:
+                term = terms[out[hit]]
+                start = end - len(term)
+                # \b at both ends: word/non-word transition (string edges count as non-word)
+                left_word = start > 0 and _is_word(lower[start - 1])
+                if left_word != _is_word(term[0]) and right_word != _is_word(term[-1]):
+                    matches.append((start, end, term))
+                hit = link[hit]
+        return matches
+
+    def find(self, text: str, min_length: int = 0,
+             terms: Optional[Container[str]] = None) -> List[Tuple[int, int, str]]:
+        """
+        Non-overlapping, leftmost-longest term occurrences.
+
+        Args:
+            text: Text to scan (case-insensitive)
+            min_length: Ignore terms shorter than this
+            terms: If given, only these (lower-cased) terms are considered
+
+        Returns:
+            List[(start, end, term)] in text order
+        """
+        candidates = [
+            m for m in self.find_all(text)
+            if len(m[2]) >= min_length and (terms is None or m[2] in terms)
+        ]
+        candidates.sort(key=lambda m: (m[0], m[0] - m[1]))
+
+        selected = []
+        covered_until = 0
+        for start, end, term in candidates:
+            if start >= covered_until:
+                selected.append((start, end, term))
+                covered_until = end
+        return selected
+
+    def find_terms(self, text: str, min_length: int = 0,
+                   terms: Optional[Container[str]] = None) -> List[str]:
+        """Distinct matched terms (see find), in order of first occurrence."""
+        return list(dict.fromkeys(term for _, _, term in self.find(text, min_length, terms)))
+
+
+def _glossary_fingerprint(path: Path) -> str:
+    stat = path.stat()
+    return f"{_CACHE_FORMAT}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _read_terms(path: Path) -> List[str]:
+    with open(path, "r", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # Skip header
+        return [row[1] for row in reader if len(row) >= 2]
+
+
+def _load_or_build(path: Path = GLOSSARY_PATH, cache_dir: Path = GLOSSARY_CACHE_DIR) -> GlossaryMatcher:
+    """Load the pickled automaton if it matches the CSV, otherwise build and pickle it."""
+    if not path.exists():
+        logger.warning(f"⚠️ Glossary not found at {path}")
+        return GlossaryMatcher([])
+
+    fingerprint = _glossary_fingerprint(path)
+    cache_path = cache_dir / "glossary_automaton.pkl"
+    try:
+        with open(cache_path, "rb") as f:
+            cached_fingerprint, matcher = pickle.load(f)
+        if cached_fingerprint == fingerprint:
+            logger.info(f"✓ Glossary automaton loaded from cache ({len(matcher.terms)} terms)")
+            return matcher
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"⚠️ Ignoring unreadable glossary automaton cache: {e}")
+
+    t0 = time.perf_counter()
+    matcher = GlossaryMatcher(_read_terms(path))
+    logger.info(f"✓ Glossary automaton built: {len(matcher.terms)} terms, {len(matcher._goto)} states "
+                f"in {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump((fingerprint, matcher), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"⚠️ Could not write glossary automaton cache: {e}")
+    return matcher
+
+
+# Global matcher instance (lazy loaded)
+_glossary_matcher_instance = None
+_glossary_matcher_lock = threading.Lock()
+
+
+def get_glossary_matcher() -> GlossaryMatcher:
+    """
+    Get or create the global glossary matcher.
+
+    Returns:
+        GlossaryMatcher: Shared matcher instance
+    """
+    global _glossary_matcher_instance
+
+    if _glossary_matcher_instance is None:
+        with _glossary_matcher_lock:
+            if _glossary_matcher_instance is None:
+                _glossary_matcher_instance = _load_or_build()
+
+    return _glossary_matcher_instance
@@ -18,15 +18,56 @@ Architecture Benefits:
 """
 
 import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from .analysis_cache_service import ANALYSIS_CACHE_ENABLED, get_analysis_cache, make_cache_key
 from .clause_detection_service import analyze_clause_detection as regex_detection
-from .ml_clause_detection_service import MLClauseDetectionService
+from .clause_patterns import PATTERN_SET_VERSION
+from .ml_clause_detection_service import MLClauseDetectionService, ML_MC_DROPOUT
 
 logger = logging.getLogger(__name__)
 
+# Formatting tags added by PDF extraction (<<F:...>>text<</F>>)
+_FORMAT_OPEN_TAG_RE = re.compile(r'<<F:[^>]+>>')
+_FORMAT_CLOSE_TAG_RE = re.compile(r'<</F>>')
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+
+# Threads available for ML stages of concurrent analyze() calls
+HYBRID_STAGE_WORKERS = int(os.getenv("HYBRID_STAGE_WORKERS", "2"))
+
+_stage_executor = None
+_stage_executor_lock = threading.Lock()
+
+
+def get_stage_executor() -> ThreadPoolExecutor:
+    """
+    Get the bounded executor that runs ML stages alongside regex detection.
+    
+    Returns:
+        ThreadPoolExecutor: Shared executor (HYBRID_STAGE_WORKERS threads)
+    """
+    global _stage_executor
+    
+    if _stage_executor is None:
+        with _stage_executor_lock:
+            if _stage_executor is None:
+                _stage_executor = ThreadPoolExecutor(
+                    max_workers=max(1, HYBRID_STAGE_WORKERS),
+                    thread_name_prefix="hybrid-stage"
+                )
+    
+    return _stage_executor
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
+
 
 class HybridClauseDetectionService:
     """
@@ -46,15 +87,19 @@ class HybridClauseDetectionService:
     
     def __init__(self, 
                  ml_checkpoint_path: str = 'app/ml_models/clause_detection_model.pt',
-                 enable_ml: bool = True):
+                 enable_ml: bool = True,
+                 use_uncertainty: bool = ML_MC_DROPOUT):
         """
         Initialize hybrid detection service.
         
         Args:
             ml_checkpoint_path: Path to trained ML model checkpoint
             enable_ml: Whether to use ML model (can disable for testing)
+            use_uncertainty: Score ML predictions with MC-dropout uncertainty and
+                only flag disagreements for review when the ML side is uncertain
         """
         self.enable_ml = enable_ml
+        self.use_uncertainty = use_uncertainty
         self.ml_service = None
         
         if self.enable_ml:
@@ -69,75 +114,202 @@ class HybridClauseDetectionService:
             except Exception as e:
                 logger.error(f"❌ ML model initialization failed: {e}")
                 self.ml_service = None
+        
+        # Identity of the loaded model, part of the result cache key
+        self.model_version = self._compute_model_version()
+    
+    def _compute_model_version(self) -> str:
+        """Fingerprint the ML side: checkpoint file identity plus inference settings."""
+        if not self.ml_service:
+            return "regex-only"
+        
+        service = self.ml_service
+        try:
+            stat = os.stat(service.checkpoint_path)
+            checkpoint_id = f"{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            checkpoint_id = "missing"
+        return "|".join([
+            os.path.abspath(service.checkpoint_path),
+            checkpoint_id,
+            service.model_name,
+            service.inference_backend,
+            f"window={service.sliding_window}:{service.window_stride}:{service.window_reduction}",
+            f"mc_dropout={self.use_uncertainty}",
+        ])
     
-    def analyze(self, text: str, max_length: int = 512) -> Dict:
+    def analyze(self, text: str, max_length: int = 512, use_cache: bool = True) -> Dict:
         """
         Analyze legal document using hybrid approach.
         
         Process:
-        1. Run ML model (if enabled)
-        2. Run regex detection
+        1. Strip formatting tags and look up the result cache
+        2. Run ML model (if enabled) on the stage executor while
+           regex detection runs on the calling thread
         3. Compare and merge results
-        4. Return weighted decision with full metadata
+        4. Return weighted decision with full metadata and stage timings
         
         Args:
             text: Extracted text from legal document
             max_length: Max tokens for ML model (512 for Legal-BERT)
+            use_cache: Serve / store the result in the analysis result cache
             
         Returns:
-            Dict: Enriched analysis results with decisions and metadata
+            Dict: Enriched analysis results with decisions and metadata;
+            'timings' holds the strip / ml / regex / merge / total ms and
+            'cache' reports whether the result came from the cache
         """
-        
-        # Strip formatting tags before analysis — tags waste tokens and add noise
-        # Raw .txt file is preserved on disk; model always gets clean text
-        try:
-            import re
-            clean_text = re.sub(r'<<F:[^>]+>>', '', text)
-            clean_text = re.sub(r'<</F>>', '', clean_text)
-            clean_text = re.sub(r' {2,}', ' ', clean_text)
-        except Exception:
-            clean_text = text  # fallback to original if strip fails
+        t_start = time.perf_counter()
+        timings = {}
+        
+        clean_text = self._strip_format_tags(text)
+        timings['strip_ms'] = _elapsed_ms(t_start)
+        
+        # Same clean text + same model + same patterns -> same result
+        cache_key = None
+        if use_cache and ANALYSIS_CACHE_ENABLED:
+            t_cache = time.perf_counter()
+            cache_key = make_cache_key(clean_text, max_length, self.model_version, PATTERN_SET_VERSION)
+            cached, source = get_analysis_cache().get(cache_key)
+            timings['cache_ms'] = _elapsed_ms(t_cache)
+            if cached is not None:
+                logger.info(f"⚡ Hybrid analysis served from {source} cache ({cache_key[:12]})")
+                timings['total_ms'] = _elapsed_ms(t_start)
+                cached['timings'] = timings
+                cached['cache'] = {'hit': True, 'source': source, 'key': cache_key}
+                return cached
 
-        # Step 1: Run ML model
-        ml_results = None
+        # Step 1: Start the ML model - torch releases the GIL, so it overlaps
+        # with the pure-Python regex pass below
+        ml_future = None
         if self.enable_ml and self.ml_service:
-            try:
-                logger.info("\n" + "="*80)
-                logger.info("🤖 HYBRID SERVICE: Calling ML model predict()...")
-                logger.info("="*80)
-                logger.info(f"Text to be sent - Length: {len(clean_text)} chars | Words: {len(clean_text.split())} | Max tokens: {max_length}")
-                logger.info(f"Text preview (first 300 chars): {clean_text[:300]}...")
-                
-                ml_results = self.ml_service.predict(clean_text, max_length=max_length)
-                
-                if ml_results.get('success'):
-                    logger.info("\n" + "="*80)
-                    logger.info("✅ ML PREDICTION RECEIVED IN HYBRID SERVICE")
-                    logger.info("="*80)
-                    logger.info(f"Summary from ML: {ml_results['summary']}")
-                    logger.info(f"Received {len(ml_results.get('clauses', []))} clause predictions")
-                    logger.info("="*80 + "\n")
-                else:
-                    logger.warning(f"⚠️ ML prediction failed: {ml_results.get('error')}")
-                    ml_results = None
-            except Exception as e:
-                logger.error(f"❌ ML prediction error: {e}", exc_info=True)
-                ml_results = None
+            logger.info(f"🤖 HYBRID SERVICE: Calling ML model predict() ({len(clean_text)} chars, max tokens {max_length})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Text preview (first 300 chars): {clean_text[:300]}...")
+            ml_future = get_stage_executor().submit(self._timed_ml_stage, clean_text, max_length)
         
         # Step 2: Run regex detection (always)
         logger.info("📝 Running regex-based detection...")
+        t_regex = time.perf_counter()
         regex_results = regex_detection(clean_text)
+        timings['regex_ms'] = _elapsed_ms(t_regex)
         logger.info(f"✅ Regex detection complete: {regex_results['statistics']}")
         
+        ml_results = None
+        if ml_future is not None:
+            t_wait = time.perf_counter()
+            ml_results, timings['ml_ms'] = ml_future.result()
+            timings['ml_wait_ms'] = _elapsed_ms(t_wait)
+        
         # Step 3: Merge and compare results
+        t_merge = time.perf_counter()
         if ml_results and ml_results.get('success'):
             hybrid_results = self._merge_predictions(ml_results, regex_results, clean_text)
         else:
             # ML not available, return regex results with metadata
             hybrid_results = self._format_regex_only_results(regex_results)
+        timings['merge_ms'] = _elapsed_ms(t_merge)
         
+        if cache_key is not None:
+            ml_expected = bool(self.enable_ml and self.ml_service)
+            if self._is_cacheable(hybrid_results, regex_results, ml_expected):
+                get_analysis_cache().put(cache_key, hybrid_results)
+            hybrid_results['cache'] = {'hit': False, 'source': None, 'key': cache_key}
+        timings['total_ms'] = _elapsed_ms(t_start)
+        
+        hybrid_results['timings'] = timings
+        logger.info(f"⏱️ Hybrid stage timings: {timings}")
         return hybrid_results
     
+    @staticmethod
+    def _is_cacheable(hybrid_results: Dict, regex_results: Dict, ml_expected: bool) -> bool:
+        """
+        Only deterministic outcomes are cached: a transient ML failure (regex-only
+        fallback while the model is loaded) or a regex time-budget overrun
+        should be retried next time, not replayed.
+        """
+        if ml_expected and hybrid_results.get('method') == 'regex_only':
+            return False
+        return not regex_results.get('statistics', {}).get('timeout', 0)
+    
+    def _timed_ml_stage(self, clean_text: str, max_length: int) -> Tuple[Optional[Dict], float]:
+        """
+        ML stage run on the stage executor.
+        
+        Returns:
+            (ML results or None on failure, elapsed ms)
+        """
+        t0 = time.perf_counter()
+        try:
+            ml_results = self._predict_ml(clean_text, max_length)
+            if ml_results.get('success'):
+                logger.info(f"✅ ML prediction received: {ml_results['summary']} "
+                            f"({len(ml_results.get('clauses', []))} clause predictions)")
+            else:
+                logger.warning(f"⚠️ ML prediction failed: {ml_results.get('error')}")
+                ml_results = None
+        except Exception as e:
+            logger.error(f"❌ ML prediction error: {e}", exc_info=True)
+            ml_results = None
+        return ml_results, _elapsed_ms(t0)
+    
+    def analyze_batch(self, texts: List[str], max_length: int = 512) -> List[Dict]:
+        """
+        Analyze many documents with the hybrid approach.
+        
+        The ML model scores all documents in batched forward passes
+        (MLClauseDetectionService.predict_batch); regex detection and the
+        merge then run per document exactly as in analyze().
+        
+        Args:
+            texts: Extracted texts of the legal documents
+            max_length: Max tokens for ML model (512 for Legal-BERT)
+            
+        Returns:
+            List[Dict]: One analyze() result per input text, in input order
+        """
+        clean_texts = [self._strip_format_tags(text) for text in texts]
+        
+        ml_batch = [None] * len(clean_texts)
+        if self.enable_ml and self.ml_service and clean_texts:
+            try:
+                logger.info(f"🤖 HYBRID SERVICE: Calling ML model predict_batch() for {len(clean_texts)} documents...")
+                ml_batch = self.ml_service.predict_batch(clean_texts, max_length=max_length)
+            except Exception as e:
+                logger.error(f"❌ ML batch prediction error: {e}", exc_info=True)
+        
+        results = []
+        for clean_text, ml_results in zip(clean_texts, ml_batch):
+            regex_results = regex_detection(clean_text)
+            if ml_results and ml_results.get('success'):
+                results.append(self._merge_predictions(ml_results, regex_results, clean_text))
+            else:
+                results.append(self._format_regex_only_results(regex_results))
+        return results
+    
+    def _predict_ml(self, text: str, max_length: int) -> Dict:
+        """Run the ML model, with MC-dropout uncertainty when enabled."""
+        if self.use_uncertainty:
+            ml_results = self.ml_service.predict_with_uncertainty(text, max_length=max_length)
+            if ml_results.get('success'):
+                return ml_results
+            logger.warning(f"⚠️ MC-dropout unavailable ({ml_results.get('error')}), using plain prediction")
+        return self.ml_service.predict(text, max_length=max_length)
+    
+    @staticmethod
+    def _strip_format_tags(text: str) -> str:
+        """
+        Strip formatting tags before analysis — tags waste tokens and add noise.
+        Raw .txt file is preserved on disk; model always gets clean text.
+        """
+        try:
+            clean_text = _FORMAT_OPEN_TAG_RE.sub('', text)
+            clean_text = _FORMAT_CLOSE_TAG_RE.sub('', clean_text)
+            clean_text = _MULTI_SPACE_RE.sub(' ', clean_text)
+        except Exception:
+            clean_text = text  # fallback to original if strip fails
+        return clean_text
+    
     def _merge_predictions(self, ml_results: Dict, regex_results: Dict, text: str) -> Dict:
         """
         Merge ML and regex predictions with intelligent decision logic.
@@ -206,6 +378,14 @@ class HybridClauseDetectionService:
             decision_source = decision_result['source']
             requires_review = decision_result['requires_review']
             
+            # With MC-dropout scores, a disagreement goes to review only when
+            # the ML prediction is unstable under dropout (undetermined regex
+            # results are always reviewed)
+            uncertainty = ml_clause.get('uncertainty')
+            if (uncertainty is not None and ml_normalized != regex_normalized
+                    and decision_source not in ('regex_timeout', 'regex_truncated')):
+                requires_review = uncertainty['uncertain']
+            
             # Track statistics
             if ml_normalized == regex_normalized:
                 agreements += 1
@@ -240,7 +420,8 @@ class HybridClauseDetectionService:
                     'ml': {
                         'prediction': ml_status,
                         'confidence': ml_confidence,
-                        'probabilities': ml_clause.get('probabilities', {})
+                        'probabilities': ml_clause.get('probabilities', {}),
+                        'uncertainty': uncertainty
                     },
                     'regex': {
                         'prediction': regex_status,
@@ -340,6 +521,15 @@ class HybridClauseDetectionService:
             Dict: Decision with status, source, and review flag
         """
         
+        # Case 0: Regex overran its time budget or its capped search did not
+        # cover the region → its result is undetermined, use ML
+        if regex_status in ('Timeout', 'Truncated'):
+            return {
+                'status': ml_status,
+                'source': 'regex_timeout' if regex_status == 'Timeout' else 'regex_truncated',
+                'requires_review': True
+            }
+        
         # Case 1: Both systems agree → High confidence consensus
         if ml_status == regex_status:
             return {
@@ -505,16 +695,32 @@ def get_hybrid_service() -> HybridClauseDetectionService:
     return _hybrid_service_instance
 
 
-def analyze_with_hybrid_detection(text: str, max_length: int = 512) -> Dict:
+def analyze_with_hybrid_detection(text: str, max_length: int = 512, use_cache: bool = True) -> Dict:
     """
     Convenience function for hybrid clause detection.
     
     Args:
         text: Legal document text
         max_length: Max tokens for ML model
+        use_cache: Serve / store the result in the analysis result cache
         
     Returns:
         Dict: Hybrid analysis results
     """
     service = get_hybrid_service()
-    return service.analyze(text, max_length=max_length)
+    return service.analyze(text, max_length=max_length, use_cache=use_cache)
+
+
+def analyze_batch_with_hybrid_detection(texts: List[str], max_length: int = 512) -> List[Dict]:
+    """
+    Convenience function for hybrid clause detection over many documents.
+    
+    Args:
+        texts: Legal document texts
+        max_length: Max tokens for ML model
+        
+    Returns:
+        List[Dict]: Hybrid analysis results, one per text
+    """
+    service = get_hybrid_service()
+    return service.analyze_batch(texts, max_length=max_length)
@@ -0,0 +1,255 @@
+"""
+Inference Batcher - request coalescing for the shared Legal-BERT models.
+
+Every API request used to run its own small forward pass on the shared
+models, so N concurrent users meant N batch-of-one passes back to back.
+A MicroBatcher sits in front of one model: callers tokenize in their own
+thread and submit their feature rows; a single worker thread collects the
+rows of all waiting callers for up to INFERENCE_BATCH_WINDOW_MS (or until
+max_batch_size rows are queued), runs them through the model in one padded
+pass and hands each caller back its own slice.
+
+A lone request waits at most the window (a few ms, small next to a BERT
+forward pass); requests that arrive while the model is busy are coalesced
+into the next pass without waiting at all.
+
+No pass exceeds max_batch_size rows: a large submission (a whole judgment's
+sentences) is served in chunks, and while other callers are waiting each
+pass is split evenly between them, so a short request is never stuck
+behind a long one.
+
+Exports:
+ - INFERENCE_BATCHING, INFERENCE_BATCH_WINDOW_MS
+ - MicroBatcher
+ - get_batcher_stats() -> Dict[str, Dict]
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+INFERENCE_BATCHING = os.getenv("INFERENCE_BATCHING", "true").lower() == "true"
+INFERENCE_BATCH_WINDOW_MS = float(os.getenv("INFERENCE_BATCH_WINDOW_MS", "3"))
+
+# name -> batcher, for the metrics endpoint
+_registry: Dict[str, "MicroBatcher"] = {}
+_registry_lock = threading.Lock()
+
+
+class _Request:
+    """One caller's rows, its partial results and the future they are delivered through."""
+
+    __slots__ = ("items", "future", "enqueued_at", "dispatched", "pending", "results")
+
+    def __init__(self, items: List[Any]):
+        self.items = items
+        self.future: Future = Future()
+        self.enqueued_at = time.perf_counter()
+        self.dispatched = 0  # rows handed to a batch so far
+        self.pending = len(items)  # rows without a result yet
+        self.results: List[Any] = [None] * len(items)
+
+
+# (request, first row, end row) of one request's slice in a batch
+_Slice = Tuple[_Request, int, int]
+
+
+class MicroBatcher:
+    """Coalesces concurrent inference requests for one model into shared forward passes."""
+
+    def __init__(self, name: str, run_batch: Callable[[List[Any]], Sequence[Any]],
+                 max_batch_size: int, window_ms: float = INFERENCE_BATCH_WINDOW_MS):
+        """
+        Args:
+            name: Model name (metrics key and worker thread name)
+            run_batch: Runs a list of rows through the model and returns one
+                       result per row, in order
+            max_batch_size: Rows after which a batch is dispatched without
+                            waiting for the window to close
+            window_ms: How long the worker waits for more callers once the
+                       first request of a batch has arrived
+        """
+        self.name = name
+        self.run_batch = run_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.window_s = max(0.0, window_ms) / 1000.0
+
+        self._queue: "deque[_Request]" = deque()
+        self._queued_items = 0
+        self._cond = threading.Condition()
+        self._worker = None
+        self._stats = {
+            "requests": 0,
+            "items": 0,
+            "batches": 0,
+            "batched_requests": 0,
+            "max_batch_items": 0,
+            "max_batch_requests": 0,
+            "max_queue_depth": 0,
+            "wait_ms_total": 0.0,
+            "forward_ms_total": 0.0,
+            "errors": 0,
+        }
+
+        with _registry_lock:
+            _registry[name] = self
+
+    def submit(self, items: Sequence[Any]) -> List[Any]:
+        """
+        Run rows through the model, sharing the forward pass with concurrent callers.
+
+        Blocks until the results are ready. More than max_batch_size rows are
+        run over several passes; exceptions raised by run_batch are re-raised
+        in every caller with rows in that batch.
+
+        Args:
+            items: Feature rows of this request
+
+        Returns:
+            List: One result per row, in input order
+        """
+        if not items:
+            return []
+
+        request = _Request(list(items))
+        with self._cond:
+            self._ensure_worker()
+            self._queue.append(request)
+            self._queued_items += len(request.items)
+            self._stats["requests"] += 1
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], len(self._queue))
+            self._cond.notify()
+
+        return request.future.result()
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread on first use (caller holds the condition)."""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name=f"batcher-{self.name}", daemon=True)
+            self._worker.start()
+
+    def _next_batch(self) -> List[_Slice]:
+        """
+        Wait for requests, hold the window open for more, and take up to
+        max_batch_size rows, split evenly across the waiting requests.
+        """
+        with self._cond:
+            while not self._queue:
+                self._cond.wait()
+
+            deadline = time.perf_counter() + self.window_s
+            while self._queued_items < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            slices: Dict[_Request, List[int]] = {}
+            budget = self.max_batch_size
+            while budget and self._queue:
+                # Oldest first; a share left unused by a short request goes
+                # round again to the ones that still have rows
+                share = max(1, budget // len(self._queue))
+                for request in list(self._queue):
+                    take = min(share, budget, len(request.items) - request.dispatched)
+                    if request in slices:
+                        slices[request][1] += take
+                    else:
+                        slices[request] = [request.dispatched, request.dispatched + take]
+                    request.dispatched += take
+                    budget -= take
+                    if request.dispatched == len(request.items):
+                        self._queue.remove(request)
+                    if not budget:
+                        break
+
+            # Partly served requests queue up behind the ones that got nothing
+            for request in slices:
+                if request.dispatched < len(request.items):
+                    self._queue.remove(request)
+                    self._queue.append(request)
+
+            self._queued_items -= self.max_batch_size - budget
+            return [(request, start, end) for request, (start, end) in slices.items()]
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            items = [item for request, start, end in batch for item in request.items[start:end]]
+
+            started = time.perf_counter()
+            try:
+                results = list(self.run_batch(items))
+                if len(results) != len(items):
+                    raise RuntimeError(f"{self.name}: run_batch returned {len(results)} results for {len(items)} rows")
+            except Exception as e:
+                logger.error(f"❌ Batched inference failed for {self.name}: {e}", exc_info=True)
+                with self._cond:
+                    self._stats["errors"] += 1
+                    for request, _, _ in batch:
+                        # The caller gets the error now; drop its remaining rows
+                        if request in self._queue:
+                            self._queue.remove(request)
+                            self._queued_items -= len(request.items) - request.dispatched
+                for request, _, _ in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+            finished = time.perf_counter()
+
+            with self._cond:
+                self._stats["batches"] += 1
+                self._stats["batched_requests"] += len(batch)
+                self._stats["items"] += len(items)
+                self._stats["max_batch_items"] = max(self._stats["max_batch_items"], len(items))
+                self._stats["max_batch_requests"] = max(self._stats["max_batch_requests"], len(batch))
+                self._stats["forward_ms_total"] += (finished - started) * 1000
+                self._stats["wait_ms_total"] += sum((started - r.enqueued_at) * 1000 for r, _, _ in batch)
+
+            if len(batch) > 1:
+                logger.debug(f"🔀 {self.name}: coalesced {len(batch)} requests into one batch of {len(items)} rows")
+
+            offset = 0
+            for request, start, end in batch:
+                request.results[start:end] = results[offset:offset + end - start]
+                offset += end - start
+                request.pending -= end - start
+                if request.pending == 0 and not request.future.done():
+                    request.future.set_result(request.results)
+
+    def stats(self) -> Dict:
+        """Queue depth, batch-size and wait-time metrics."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats["queue_depth"] = len(self._queue)
+            stats["queued_items"] = self._queued_items
+
+        batches = stats["batches"]
+        served = stats.pop("batched_requests")
+        forward_ms = stats.pop("forward_ms_total")
+        wait_ms = stats.pop("wait_ms_total")
+        stats["mean_batch_items"] = round(stats["items"] / batches, 2) if batches else 0.0
+        stats["mean_batch_requests"] = round(served / batches, 2) if batches else 0.0
+        stats["mean_forward_ms"] = round(forward_ms / batches, 2) if batches else 0.0
+        stats["mean_wait_ms"] = round(wait_ms / served, 2) if served else 0.0
+        stats["max_batch_size"] = self.max_batch_size
+        stats["window_ms"] = self.window_s * 1000
+        return stats
+
+
+def get_batcher_stats() -> Dict[str, Dict]:
+    """
+    Metrics of every model batcher created in this process.
+
+    Returns:
+        Dict: model name -> MicroBatcher.stats()
+    """
+    with _registry_lock:
+        batchers = list(_registry.values())
+    return {batcher.name: batcher.stats() for batcher in batchers}
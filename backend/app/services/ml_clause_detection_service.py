@@ -7,14 +7,19 @@ Supports both:
 - Hybrid detection (ML + regex fallback)
 """
 
+import numpy as np
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional
 from pathlib import Path
 from transformers import AutoModel, AutoTokenizer
 import logging
 
+from .inference_batcher import INFERENCE_BATCHING, MicroBatcher
+from .onnx_inference import BACKEND_PYTORCH, INFERENCE_BACKEND, load_onnx_model
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +39,53 @@ CLAUSES = [
 LABEL_MAP_REVERSE = {0: "Missing", 1: "Present", 2: "Corrupted"}
 
 
+# ============================================================================
+# SLIDING-WINDOW INFERENCE SETTINGS
+# ============================================================================
+# Long judgments exceed the 512-token encoder limit; with sliding windows the
+# whole document is split into overlapping windows and per-clause
+# probabilities are reduced across them instead of truncating to the head.
+ML_SLIDING_WINDOW = os.getenv("ML_CLAUSE_SLIDING_WINDOW", "false").lower() == "true"
+ML_WINDOW_STRIDE = int(os.getenv("ML_CLAUSE_WINDOW_STRIDE", "128"))  # Overlapping tokens between windows
+ML_WINDOW_REDUCTION = os.getenv("ML_CLAUSE_WINDOW_REDUCTION", "max_evidence")
+ML_WINDOW_BATCH_SIZE = int(os.getenv("ML_CLAUSE_WINDOW_BATCH_SIZE", "16"))  # Windows per forward pass
+ML_BATCH_SIZE = int(os.getenv("ML_CLAUSE_BATCH_SIZE", "16"))  # Documents per forward pass in predict_batch
+
+# Monte-Carlo dropout uncertainty (predict_with_uncertainty)
+ML_MC_DROPOUT = os.getenv("ML_CLAUSE_MC_DROPOUT", "false").lower() == "true"  # Used by the hybrid service
+ML_MC_SAMPLES = int(os.getenv("ML_CLAUSE_MC_SAMPLES", "20"))  # Dropout samples of the classifier head
+ML_UNCERTAINTY_VARIANCE = float(os.getenv("ML_CLAUSE_UNCERTAINTY_VARIANCE", "0.01"))  # Variance of the predicted class above which a clause is "uncertain"
+
+# How per-window probabilities (windows x clauses x 3) become one distribution per clause:
+#   max_evidence - per clause, the window least likely to be "Missing" (a clause
+#                  only has to appear in one window to be present/corrupted)
+#   mean         - average over windows
+#   max          - per-class maximum over windows, renormalised
+WINDOW_REDUCTIONS = ("max_evidence", "mean", "max")
+
+
+def reduce_window_probabilities(probs: np.ndarray, reduction: str = "max_evidence") -> np.ndarray:
+    """
+    Reduce per-window clause probabilities to one distribution per clause.
+    
+    Args:
+        probs: Array of shape (num_windows, num_clauses, 3)
+        reduction: One of WINDOW_REDUCTIONS
+        
+    Returns:
+        np.ndarray: Array of shape (num_clauses, 3)
+    """
+    if reduction == "mean":
+        return probs.mean(axis=0)
+    if reduction == "max":
+        peak = probs.max(axis=0)
+        return peak / peak.sum(axis=-1, keepdims=True)
+    if reduction == "max_evidence":
+        best_window = probs[:, :, 0].argmin(axis=0)
+        return probs[best_window, np.arange(probs.shape[1])]
+    raise ValueError(f"Unknown window reduction '{reduction}' (expected one of {WINDOW_REDUCTIONS})")
+
+
 # ============================================================================
 # MODEL ARCHITECTURE (Must match training script)
 # ============================================================================
@@ -81,6 +133,39 @@ class OptimizedLegalBERTDetector(nn.Module):
         batch_size = logits.size(0)
         logits = logits.view(batch_size, 28, 3)
         return logits
+    
+    def forward_mc_dropout(self, input_ids, attention_mask, num_samples=None):
+        """
+        Monte-Carlo dropout with a single encoder pass.
+        
+        The encoder runs once; the pooled representation is repeated
+        num_samples times and the classifier head is evaluated on all copies
+        as one batched operation with dropout active (each copy gets its own
+        dropout mask), regardless of train/eval mode.
+        
+        Returns:
+            Tensor of shape (num_samples, batch, 28, 3) with logits
+        """
+        num_samples = num_samples or self.num_dropout_samples
+        outputs = self.bert(input_ids=input_ids, attention_mask=attention_mask)
+        pooled = outputs.last_hidden_state[:, 0]
+        
+        batch_size, hidden_size = pooled.shape
+        x = pooled.unsqueeze(0).expand(num_samples, batch_size, hidden_size)
+        x = x.reshape(num_samples * batch_size, hidden_size)
+        x = _run_with_dropout(self.pre_classifier, x)
+        logits = _run_with_dropout(self.classifier, x)
+        return logits.view(num_samples, batch_size, 28, 3)
+
+
+def _run_with_dropout(block: nn.Sequential, x: torch.Tensor) -> torch.Tensor:
+    """Apply a Sequential block with its Dropout layers forced on."""
+    for layer in block:
+        if isinstance(layer, nn.Dropout):
+            x = F.dropout(x, p=layer.p, training=True)
+        else:
+            x = layer(x)
+    return x
 
 
 # ============================================================================
@@ -90,8 +175,28 @@ class MLClauseDetectionService:
     """Enhanced clause detection service using trained ML model."""
     
     def __init__(self, checkpoint_path: str = 'app/ml_models/clause_detection_model.pt',
-                 model_name: str = "nlpaueb/legal-bert-base-uncased"):
-        """Initialize the ML-based clause detection service."""
+                 model_name: str = "nlpaueb/legal-bert-base-uncased",
+                 sliding_window: bool = ML_SLIDING_WINDOW,
+                 window_stride: int = ML_WINDOW_STRIDE,
+                 window_reduction: str = ML_WINDOW_REDUCTION,
+                 window_batch_size: int = ML_WINDOW_BATCH_SIZE,
+                 batch_size: int = ML_BATCH_SIZE,
+                 inference_backend: str = INFERENCE_BACKEND):
+        """
+        Initialize the ML-based clause detection service.
+        
+        Args:
+            checkpoint_path: Path to the trained checkpoint
+            model_name: Hugging Face encoder / tokenizer name
+            sliding_window: Cover the whole document with overlapping windows by default
+            window_stride: Tokens shared by consecutive windows
+            window_reduction: How window probabilities are combined (see WINDOW_REDUCTIONS)
+            window_batch_size: Maximum windows per forward pass
+            batch_size: Maximum documents per forward pass in predict_batch
+            inference_backend: pytorch / onnx / onnx_int8 (ML_INFERENCE_BACKEND)
+        """
+        if window_reduction not in WINDOW_REDUCTIONS:
+            raise ValueError(f"Unknown window reduction '{window_reduction}' (expected one of {WINDOW_REDUCTIONS})")
         # Resolve path relative to backend directory
         if not os.path.isabs(checkpoint_path):
             backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -99,11 +204,26 @@ class MLClauseDetectionService:
         
         self.checkpoint_path = checkpoint_path
         self.model_name = model_name
+        self.sliding_window = sliding_window
+        self.window_stride = window_stride
+        self.window_reduction = window_reduction
+        self.window_batch_size = max(1, window_batch_size)
+        self.batch_size = max(1, batch_size)
+        self.inference_backend = inference_backend
         self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
         self.model = None
         self.tokenizer = None
         self.config = None
         self.load_checkpoint()
+        
+        # Concurrent predict() calls share forward passes (INFERENCE_BATCHING)
+        self.batcher = None
+        if INFERENCE_BATCHING and self.model is not None:
+            self.batcher = MicroBatcher(
+                "clause_detection",
+                lambda sequences: list(self._forward_sequences(sequences, batch_size=self.batch_size)),
+                max_batch_size=self.batch_size
+            )
     
     def load_checkpoint(self):
         """Load the model checkpoint."""
@@ -141,6 +261,19 @@ class MLClauseDetectionService:
             # Load tokenizer
             self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
             
+            # Optionally serve the model through ONNX Runtime (CPU)
+            if self.inference_backend != BACKEND_PYTORCH:
+                onnx_model = load_onnx_model(
+                    self.model,
+                    self.tokenizer("The appeal is allowed with costs.", return_tensors='pt'),
+                    Path(self.checkpoint_path),
+                    backend=self.inference_backend,
+                    detector=True
+                )
+                if onnx_model is not None:
+                    self.model = onnx_model
+                    self.device = 'cpu'
+            
             logger.info(f"Model loaded successfully on {self.device} (model_name={self.model_name})")
             return True
             
@@ -148,13 +281,17 @@ class MLClauseDetectionService:
             logger.error(f"Failed to load checkpoint: {e}", exc_info=True)
             return False
     
-    def predict(self, text: str, max_length: int = 512) -> Dict:
+    def predict(self, text: str, max_length: int = 512,
+                sliding_window: Optional[bool] = None,
+                reduction: Optional[str] = None) -> Dict:
         """
         Use the trained ML model for predictions.
         
         Args:
             text: Legal document text
-            max_length: Maximum sequence length
+            max_length: Maximum sequence length (window size in sliding-window mode)
+            sliding_window: Override the service's sliding-window setting
+            reduction: Override the service's window reduction
             
         Returns:
             Dict: Predictions for each clause
@@ -163,6 +300,9 @@ class MLClauseDetectionService:
             logger.error("Model not loaded - cannot run predictions")
             return {"error": "Model not loaded"}
         
+        if sliding_window is None:
+            sliding_window = self.sliding_window
+        
         try:
             # Log input text info
             text_preview = text[:500] if len(text) > 500 else text
@@ -173,88 +313,22 @@ class MLClauseDetectionService:
             logger.info(f"Max token length: {max_length}")
             logger.info(f"\nText preview (first 500 chars):\n{text_preview}...")
             
-            with torch.no_grad():
-                # Tokenize
-                logger.debug(f"Tokenizing text with max_length={max_length}...")
-                encoding = self.tokenizer(
-                    text,
-                    max_length=max_length,
-                    padding='max_length',
-                    truncation=True,
-                    return_tensors='pt'
-                )
-                
-                input_ids = encoding['input_ids'].to(self.device)
-                attention_mask = encoding['attention_mask'].to(self.device)
-                
-                # Log tokenization details
-                num_tokens = input_ids.shape[1]
-                num_actual_tokens = attention_mask.sum().item()
-                logger.info(f"Tokenization complete: {num_actual_tokens} actual tokens out of {num_tokens} padded tokens")
-                logger.debug(f"Input shape: {input_ids.shape} | Device: {self.device}")
-                
-                # Inference
-                logger.info(f"Running model inference...")
-                logits = self.model(input_ids, attention_mask, use_multi_dropout=False)
-                logger.debug(f"Raw logits shape: {logits.shape}")
-                
-                # Extract predictions
-                predictions = logits.argmax(dim=-1)
-                probs = torch.softmax(logits, dim=-1)
-                confidences = torch.max(probs, dim=-1)[0]
-                
-                # Format results
-                clause_results = []
-                batch_idx = 0
-                
-                # Log detailed predictions
-                logger.info(f"\n{'='*80}")
-                logger.info(f"📥 RECEIVED FROM ML MODEL (predictions)")
-                logger.info(f"{'='*80}")
-                
-                for clause_idx, clause_name in enumerate(CLAUSES):
-                    pred_label = predictions[batch_idx, clause_idx].item()
-                    prediction = LABEL_MAP_REVERSE[pred_label]
-                    confidence = confidences[batch_idx, clause_idx].item()
-                    
-                    class_probs = probs[batch_idx, clause_idx].cpu().numpy().tolist()
-                    
-                    clause_results.append({
-                        'clause': clause_name,
-                        'status': prediction,
-                        'confidence': float(confidence),
-                        'probabilities': {
-                            'missing': float(class_probs[0]),
-                            'present': float(class_probs[1]),
-                            'corrupted': float(class_probs[2])
-                        }
-                    })
-                    
-                    # Log high confidence predictions
-                    if confidence >= 0.8:
-                        logger.info(f"  [{clause_name}] = {prediction} (confidence: {confidence:.3f}) ✓ HIGH CONFIDENCE")
-                    elif confidence >= 0.6:
-                        logger.info(f"  [{clause_name}] = {prediction} (confidence: {confidence:.3f})")
-                    else:
-                        logger.info(f"  [{clause_name}] = {prediction} (confidence: {confidence:.3f}) ⚠️ LOW CONFIDENCE")
-                
-                # Calculate summary
-                summary = {
-                    'present': sum(1 for c in clause_results if c['status'] == 'Present'),
-                    'missing': sum(1 for c in clause_results if c['status'] == 'Missing'),
-                    'corrupted': sum(1 for c in clause_results if c['status'] == 'Corrupted')
-                }
-                
-                logger.info(f"\n📊 Summary: Present={summary['present']}, Missing={summary['missing']}, Corrupted={summary['corrupted']}")
-                logger.info(f"{'='*80}\n")
-                
-                return {
-                    'success': True,
-                    'clauses': clause_results,
-                    'summary': summary,
-                    'device': str(self.device),
-                    'text_length': len(text)
-                }
+            if sliding_window:
+                return self._predict_windowed(text, max_length, reduction or self.window_reduction)
+            
+            # Tokenize (no padding: a single sequence needs none)
+            logger.debug(f"Tokenizing text with max_length={max_length}...")
+            input_ids = self.tokenizer(text, max_length=max_length, truncation=True)['input_ids']
+            logger.info(f"Tokenization complete: {len(input_ids)} tokens")
+            
+            # Inference
+            logger.info(f"Running model inference...")
+            if self.batcher is not None:
+                probs = self.batcher.submit([input_ids])[0]
+            else:
+                probs = self._forward_sequences([input_ids], batch_size=1)[0]
+            
+            return self._format_predictions(probs, text)
                 
         except Exception as e:
             logger.error(f"ML prediction error: {e}", exc_info=True)
@@ -265,6 +339,343 @@ class MLClauseDetectionService:
                 'text_length': len(text)
             }
     
+    def predict_batch(self, texts: List[str], max_length: int = 512,
+                      batch_size: Optional[int] = None,
+                      sliding_window: Optional[bool] = None,
+                      reduction: Optional[str] = None) -> List[Dict]:
+        """
+        Predict clauses for many documents at once.
+        
+        Documents are tokenized together, sorted by length and run through
+        the model in dynamically padded batches; the probabilities of all
+        documents come back to the host in a single transfer. Each result
+        has the same schema as predict().
+        
+        Args:
+            texts: Legal document texts
+            max_length: Maximum sequence length (window size in sliding-window mode)
+            batch_size: Sequences per forward pass (default: ML_CLAUSE_BATCH_SIZE)
+            sliding_window: Override the service's sliding-window setting
+            reduction: Override the service's window reduction
+            
+        Returns:
+            List[Dict]: One predict() result per input text, in input order
+        """
+        if self.model is None or self.tokenizer is None:
+            logger.error("Model not loaded - cannot run predictions")
+            return [{"error": "Model not loaded"} for _ in texts]
+        if not texts:
+            return []
+        
+        if sliding_window is None:
+            sliding_window = self.sliding_window
+        reduction = reduction or self.window_reduction
+        batch_size = batch_size or self.batch_size
+        
+        try:
+            logger.info(f"📤 SENDING {len(texts)} documents TO ML MODEL (predict_batch, "
+                        f"batch_size={batch_size}, sliding_window={sliding_window})")
+            
+            if sliding_window:
+                doc_windows = [self._build_windows(text, max_length) for text in texts]
+                sequences = [window for windows in doc_windows for window in windows]
+            else:
+                sequences = self.tokenizer(list(texts), max_length=max_length, truncation=True)['input_ids']
+            
+            probs = self._forward_sequences(sequences, batch_size=batch_size)
+            
+            results = []
+            if sliding_window:
+                offset = 0
+                for text, windows in zip(texts, doc_windows):
+                    doc_probs = reduce_window_probabilities(probs[offset:offset + len(windows)], reduction)
+                    offset += len(windows)
+                    result = self._format_predictions(doc_probs, text, log_details=False)
+                    result['windows'] = len(windows)
+                    result['window_reduction'] = reduction
+                    results.append(result)
+            else:
+                for text, doc_probs in zip(texts, probs):
+                    results.append(self._format_predictions(doc_probs, text, log_details=False))
+            
+            logger.info(f"📥 Batch prediction complete: {len(texts)} documents, {len(sequences)} sequences")
+            return results
+            
+        except Exception as e:
+            logger.error(f"ML batch prediction error: {e}", exc_info=True)
+            return [{
+                'success': False,
+                'error': str(e),
+                'device': str(self.device),
+                'text_length': len(text)
+            } for text in texts]
+    
+    def predict_with_uncertainty(self, text: str, max_length: int = 512,
+                                 num_samples: Optional[int] = None,
+                                 sliding_window: Optional[bool] = None,
+                                 reduction: Optional[str] = None) -> Dict:
+        """
+        Predict clauses with Monte-Carlo dropout uncertainty.
+        
+        The encoder runs once per sequence and num_samples dropout samples of
+        the classifier head are drawn in the same forward pass, so the cost is
+        close to a plain predict(). Each clause's status comes from the mean
+        probabilities; its per-class variance tells how stable the prediction
+        is under dropout.
+        
+        Args:
+            text: Legal document text
+            max_length: Maximum sequence length (window size in sliding-window mode)
+            num_samples: Dropout samples (default: ML_CLAUSE_MC_SAMPLES)
+            sliding_window: Override the service's sliding-window setting
+            reduction: Override the service's window reduction
+            
+        Returns:
+            Dict: predict() result where 'probabilities' are the MC means and
+            every clause also has an 'uncertainty' entry (variance per class,
+            std of the predicted class, uncertain flag)
+        """
+        if self.model is None or self.tokenizer is None:
+            logger.error("Model not loaded - cannot run predictions")
+            return {"error": "Model not loaded"}
+        if not isinstance(self.model, OptimizedLegalBERTDetector):
+            return {
+                'success': False,
+                'error': "MC-dropout uncertainty requires the PyTorch backend",
+                'device': str(self.device),
+                'text_length': len(text)
+            }
+        
+        if sliding_window is None:
+            sliding_window = self.sliding_window
+        reduction = reduction or self.window_reduction
+        num_samples = num_samples or ML_MC_SAMPLES
+        
+        try:
+            logger.info(f"📤 SENDING TO ML MODEL (predict_with_uncertainty, {num_samples} MC-dropout samples)")
+            
+            if sliding_window:
+                sequences = self._build_windows(text, max_length)
+            else:
+                sequences = [self.tokenizer(text, max_length=max_length, truncation=True)['input_ids']]
+            batch_size = self.window_batch_size if sliding_window else 1
+            
+            samples = self._forward_sequences(sequences, batch_size=batch_size, mc_samples=num_samples)
+            if sliding_window:
+                samples = np.stack([reduce_window_probabilities(sample, reduction) for sample in samples])
+            else:
+                samples = samples[:, 0]
+            
+            mean = samples.mean(axis=0)
+            variance = samples.var(axis=0)
+            
+            result = self._format_predictions(mean, text)
+            predicted = mean.argmax(axis=-1)
+            uncertain_count = 0
+            for clause_idx, clause in enumerate(result['clauses']):
+                predicted_variance = float(variance[clause_idx, predicted[clause_idx]])
+                uncertain = predicted_variance >= ML_UNCERTAINTY_VARIANCE
+                uncertain_count += uncertain
+                clause['uncertainty'] = {
+                    'variance': {
+                        'missing': float(variance[clause_idx, 0]),
+                        'present': float(variance[clause_idx, 1]),
+                        'corrupted': float(variance[clause_idx, 2])
+                    },
+                    'predicted_std': predicted_variance ** 0.5,
+                    'uncertain': uncertain
+                }
+            
+            result['mc_samples'] = num_samples
+            result['uncertain_clauses'] = uncertain_count
+            if sliding_window:
+                result['windows'] = len(sequences)
+                result['window_reduction'] = reduction
+            logger.info(f"📥 MC-dropout complete: {uncertain_count} uncertain clauses")
+            return result
+            
+        except Exception as e:
+            logger.error(f"ML uncertainty prediction error: {e}", exc_info=True)
+            return {
+                'success': False,
+                'error': str(e),
+                'device': str(self.device),
+                'text_length': len(text)
+            }
+    
+    def _forward_sequences(self, sequences: List[List[int]], batch_size: int,
+                           mc_samples: int = 0) -> np.ndarray:
+        """
+        Run token sequences through the model and return clause probabilities.
+        
+        Sequences are sorted by length so each batch is padded only to its own
+        longest member. Softmax runs on the device; all probabilities are
+        copied to the host with one transfer at the end.
+        
+        Args:
+            sequences: Input ids (with special tokens) of each sequence
+            batch_size: Maximum sequences per forward pass
+            mc_samples: If > 0, return that many MC-dropout samples per sequence
+            
+        Returns:
+            np.ndarray: Array of shape (len(sequences), 28, 3), or
+            (mc_samples, len(sequences), 28, 3) with mc_samples, in input order
+        """
+        pad_id = self.tokenizer.pad_token_id or 0
+        order = sorted(range(len(sequences)), key=lambda i: len(sequences[i]))
+        
+        batch_probs = []
+        with torch.no_grad():
+            for start in range(0, len(order), batch_size):
+                batch = [sequences[i] for i in order[start:start + batch_size]]
+                seq_len = max(len(seq) for seq in batch)
+                
+                input_ids = torch.full((len(batch), seq_len), pad_id, dtype=torch.long)
+                attention_mask = torch.zeros((len(batch), seq_len), dtype=torch.long)
+                for row, seq in enumerate(batch):
+                    input_ids[row, :len(seq)] = torch.tensor(seq, dtype=torch.long)
+                    attention_mask[row, :len(seq)] = 1
+                
+                if mc_samples:
+                    logits = self.model.forward_mc_dropout(
+                        input_ids.to(self.device),
+                        attention_mask.to(self.device),
+                        num_samples=mc_samples
+                    )
+                else:
+                    logits = self.model(
+                        input_ids.to(self.device),
+                        attention_mask.to(self.device),
+                        use_multi_dropout=False
+                    )
+                batch_probs.append(torch.softmax(logits, dim=-1))
+            
+            # Sequence axis is 0, or 1 behind the sample axis
+            seq_axis = 1 if mc_samples else 0
+            sorted_probs = torch.cat(batch_probs, dim=seq_axis).cpu().numpy()
+        
+        probs = np.empty_like(sorted_probs)
+        if mc_samples:
+            probs[:, order] = sorted_probs
+        else:
+            probs[order] = sorted_probs
+        return probs
+    
+    def _build_windows(self, text: str, max_length: int) -> List[List[int]]:
+        """
+        Split a document into overlapping token windows.
+        
+        Each window holds up to max_length tokens including [CLS]/[SEP];
+        consecutive windows share window_stride content tokens.
+        
+        Args:
+            text: Legal document text
+            max_length: Window size in tokens
+            
+        Returns:
+            List[List[int]]: Input ids of each window
+        """
+        token_ids = self.tokenizer(text, add_special_tokens=False, verbose=False)['input_ids']
+        content_len = max_length - self.tokenizer.num_special_tokens_to_add()
+        step = max(1, content_len - min(self.window_stride, content_len - 1))
+        
+        windows = []
+        start = 0
+        while True:
+            chunk = token_ids[start:start + content_len]
+            windows.append(self.tokenizer.build_inputs_with_special_tokens(chunk))
+            if start + content_len >= len(token_ids):
+                break
+            start += step
+        return windows
+    
+    def _predict_windowed(self, text: str, max_length: int, reduction: str) -> Dict:
+        """
+        Predict over the whole document with overlapping windows.
+        
+        Windows are run through the model in batches of window_batch_size
+        and their probabilities are reduced per clause.
+        """
+        windows = self._build_windows(text, max_length)
+        logger.info(f"Sliding-window inference: {len(windows)} windows of <= {max_length} tokens "
+                    f"(stride {self.window_stride}, reduction={reduction})")
+        
+        window_probs = self._forward_sequences(windows, batch_size=self.window_batch_size)
+        probs = reduce_window_probabilities(window_probs, reduction)
+        result = self._format_predictions(probs, text)
+        result['windows'] = len(windows)
+        result['window_reduction'] = reduction
+        return result
+    
+    def _format_predictions(self, probs: np.ndarray, text: str, log_details: bool = True) -> Dict:
+        """
+        Build the predict() result from one document's clause probabilities.
+        
+        Args:
+            probs: Array of shape (28, 3) with Missing/Present/Corrupted probabilities
+            text: The document text (for metadata)
+            log_details: Log every clause prediction (off for batches)
+            
+        Returns:
+            Dict: Predictions for each clause
+        """
+        predictions = probs.argmax(axis=-1)
+        confidences = probs.max(axis=-1)
+        
+        # Format results
+        clause_results = []
+        
+        # Log detailed predictions
+        if log_details:
+            logger.info(f"\n{'='*80}")
+            logger.info(f"📥 RECEIVED FROM ML MODEL (predictions)")
+            logger.info(f"{'='*80}")
+        
+        for clause_idx, clause_name in enumerate(CLAUSES):
+            prediction = LABEL_MAP_REVERSE[int(predictions[clause_idx])]
+            confidence = float(confidences[clause_idx])
+            class_probs = probs[clause_idx].tolist()
+            
+            clause_results.append({
+                'clause': clause_name,
+                'status': prediction,
+                'confidence': confidence,
+                'probabilities': {
+                    'missing': float(class_probs[0]),
+                    'present': float(class_probs[1]),
+                    'corrupted': float(class_probs[2])
+                }
+            })
+            
+            # Log high confidence predictions
+            if not log_details:
+                continue
+            if confidence >= 0.8:
+                logger.info(f"  [{clause_name}] = {prediction} (confidence: {confidence:.3f}) ✓ HIGH CONFIDENCE")
+            elif confidence >= 0.6:
+                logger.info(f"  [{clause_name}] = {prediction} (confidence: {confidence:.3f})")
+            else:
+                logger.info(f"  [{clause_name}] = {prediction} (confidence: {confidence:.3f}) ⚠️ LOW CONFIDENCE")
+        
+        # Calculate summary
+        summary = {
+            'present': sum(1 for c in clause_results if c['status'] == 'Present'),
+            'missing': sum(1 for c in clause_results if c['status'] == 'Missing'),
+            'corrupted': sum(1 for c in clause_results if c['status'] == 'Corrupted')
+        }
+        
+        if log_details:
+            logger.info(f"\n📊 Summary: Present={summary['present']}, Missing={summary['missing']}, Corrupted={summary['corrupted']}")
+            logger.info(f"{'='*80}\n")
+        
+        return {
+            'success': True,
+            'clauses': clause_results,
+            'summary': summary,
+            'device': str(self.device),
+            'text_length': len(text)
+        }
+    
     def analyze(self, text: str, max_length: int = 512) -> Dict:
         """
         Analyze document with ML model.
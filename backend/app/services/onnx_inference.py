@@ -0,0 +1,269 @@
+"""
+ONNX Runtime inference backend for the Legal-BERT models.
+
+All inference nodes are CPU-only, where eager PyTorch FP32 is the slowest
+option. This module exports a loaded PyTorch model to ONNX once, optionally
+applies dynamic INT8 quantization to its weights, and serves it through
+ONNX Runtime behind a small wrapper that is called exactly like the PyTorch
+model it replaces:
+
+- OnnxSequenceModel: drop-in for Hugging Face *ForSequenceClassification /
+  *ForTokenClassification models (model(**inputs).logits, .config, .device)
+- OnnxClauseDetector: drop-in for OptimizedLegalBERTDetector
+  (model(input_ids, attention_mask) -> logits of shape (batch, 28, 3))
+
+The backend is selected with ML_INFERENCE_BACKEND:
+    pytorch    - eager PyTorch (default)
+    onnx       - ONNX Runtime, FP32
+    onnx_int8  - ONNX Runtime, dynamic INT8 quantized weights
+
+Exported files are cached next to the model (model directory: onnx/model.onnx
+and onnx/model.int8.onnx; checkpoint file: <name>.onnx / <name>.int8.onnx)
+and re-exported when the source model is newer. If onnxruntime is not
+installed or the export fails, callers keep the PyTorch model.
+
+Exports:
+ - INFERENCE_BACKEND, INFERENCE_BACKENDS
+ - onnx_available() -> bool
+ - load_onnx_model(torch_model, dummy_inputs, source_path, backend, ...) -> Optional[wrapper]
+ - OnnxSequenceModel, OnnxClauseDetector
+"""
+
+import logging
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Sequence
+
+import torch
+import torch.nn as nn
+
+try:
+    import onnxruntime as ort
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+except ImportError:
+    ort = None
+
+logger = logging.getLogger(__name__)
+
+BACKEND_PYTORCH = "pytorch"
+BACKEND_ONNX = "onnx"
+BACKEND_ONNX_INT8 = "onnx_int8"
+INFERENCE_BACKENDS = (BACKEND_PYTORCH, BACKEND_ONNX, BACKEND_ONNX_INT8)
+
+INFERENCE_BACKEND = os.getenv("ML_INFERENCE_BACKEND", BACKEND_PYTORCH).lower()
+ONNX_THREADS = int(os.getenv("ML_ONNX_THREADS", "0"))  # 0 = ONNX Runtime default
+ONNX_OPSET = 14
+
+MODEL_INPUT_NAMES = ("input_ids", "attention_mask", "token_type_ids")
+
+
+def onnx_available() -> bool:
+    """True if onnxruntime (with its quantization tools) is installed."""
+    return ort is not None
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+class _LogitsOnly(nn.Module):
+    """Traceable view of a model: positional token tensors in, logits out."""
+
+    def __init__(self, model: nn.Module, input_names: Sequence[str], detector: bool):
+        super().__init__()
+        self.model = model
+        self.input_names = list(input_names)
+        self.detector = detector
+
+    def forward(self, *tensors):
+        inputs = dict(zip(self.input_names, tensors))
+        if self.detector:
+            return self.model(inputs["input_ids"], inputs["attention_mask"], use_multi_dropout=False)
+        return self.model(**inputs).logits
+
+
+def onnx_paths(source_path: Path) -> Dict[str, Path]:
+    """Return the FP32 and INT8 ONNX file locations for a model directory or checkpoint file."""
+    source_path = Path(source_path)
+    if source_path.is_dir():
+        base = source_path / "onnx" / "model"
+    else:
+        base = source_path.with_suffix("")
+    return {
+        BACKEND_ONNX: base.with_name(base.name + ".onnx"),
+        BACKEND_ONNX_INT8: base.with_name(base.name + ".int8.onnx"),
+    }
+
+
+def _source_mtime(source_path: Path) -> float:
+    """Latest modification time of a checkpoint file or of the files of a model directory."""
+    if source_path.is_dir():
+        return max((p.stat().st_mtime for p in source_path.iterdir() if p.is_file()), default=0.0)
+    return source_path.stat().st_mtime
+
+
+def _is_fresh(path: Path, source_path: Path) -> bool:
+    return path.exists() and path.stat().st_mtime >= _source_mtime(source_path)
+
+
+def export_to_onnx(torch_model: nn.Module, dummy_inputs: Dict[str, torch.Tensor], output_path: Path,
+                   detector: bool = False, per_token_output: bool = False) -> Path:
+    """
+    Export a model to ONNX with dynamic batch and sequence axes.
+
+    Args:
+        torch_model: Loaded PyTorch model (eval mode)
+        dummy_inputs: Tokenizer output used for tracing
+        output_path: Destination .onnx file
+        detector: True for OptimizedLegalBERTDetector (positional call, raw logits)
+        per_token_output: True for token classification (logits have a sequence axis)
+
+    Returns:
+        Path: output_path
+    """
+    input_names = [name for name in MODEL_INPUT_NAMES if name in dummy_inputs]
+    if detector:
+        input_names = ["input_ids", "attention_mask"]
+
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch", 1: "sequence"} if per_token_output else {0: "batch"}
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    wrapper = _LogitsOnly(torch_model, input_names, detector).eval()
+    tensors = tuple(dummy_inputs[name].cpu() for name in input_names)
+
+    was_on = next(torch_model.parameters()).device
+    torch_model.to("cpu")
+    try:
+        with torch.no_grad():
+            torch.onnx.export(
+                wrapper,
+                tensors,
+                str(output_path),
+                input_names=input_names,
+                output_names=["logits"],
+                dynamic_axes=dynamic_axes,
+                opset_version=ONNX_OPSET,
+                do_constant_folding=True,
+            )
+    finally:
+        torch_model.to(was_on)
+
+    logger.info(f"✅ Exported ONNX model to {output_path}")
+    return output_path
+
+
+def quantize_to_int8(fp32_path: Path, int8_path: Path) -> Path:
+    """Apply dynamic INT8 quantization (weights INT8, activations quantized at runtime)."""
+    quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+    logger.info(f"✅ Quantized ONNX model to INT8: {int8_path}")
+    return int8_path
+
+
+def ensure_onnx_file(torch_model: nn.Module, dummy_inputs: Dict[str, torch.Tensor], source_path: Path,
+                     backend: str, detector: bool = False, per_token_output: bool = False) -> Path:
+    """Return an up-to-date ONNX file for the backend, exporting/quantizing it if needed."""
+    source_path = Path(source_path)
+    paths = onnx_paths(source_path)
+
+    if not _is_fresh(paths[BACKEND_ONNX], source_path):
+        export_to_onnx(torch_model, dummy_inputs, paths[BACKEND_ONNX], detector, per_token_output)
+
+    if backend == BACKEND_ONNX_INT8 and not _is_fresh(paths[BACKEND_ONNX_INT8], paths[BACKEND_ONNX]):
+        quantize_to_int8(paths[BACKEND_ONNX], paths[BACKEND_ONNX_INT8])
+
+    return paths[backend]
+
+
+# ============================================================================
+# RUNTIME WRAPPERS
+# ============================================================================
+
+def create_session(onnx_path: Path):
+    """Create a CPU ONNX Runtime session for an exported model."""
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if ONNX_THREADS > 0:
+        options.intra_op_num_threads = ONNX_THREADS
+    return ort.InferenceSession(str(onnx_path), sess_options=options, providers=["CPUExecutionProvider"])
+
+
+class _OnnxModel:
+    """Shared ONNX Runtime plumbing: torch tensors in, torch logits out."""
+
+    def __init__(self, session, config=None, backend: str = BACKEND_ONNX):
+        self.session = session
+        self.config = config
+        self.backend = backend
+        self.device = torch.device("cpu")
+        self.input_names = [i.name for i in session.get_inputs()]
+        self.training = False
+
+    def eval(self):
+        return self
+
+    def to(self, *args, **kwargs):
+        return self
+
+    def _run(self, inputs) -> torch.Tensor:
+        feeds = {}
+        for name in self.input_names:
+            value = inputs.get(name)
+            if value is None and name == "token_type_ids":
+                value = torch.zeros_like(inputs["input_ids"])
+            feeds[name] = value.detach().cpu().numpy().astype("int64", copy=False)
+        logits = self.session.run(["logits"], feeds)[0]
+        return torch.from_numpy(logits)
+
+
+class OnnxSequenceModel(_OnnxModel):
+    """ONNX stand-in for a Hugging Face classification model: model(**inputs).logits."""
+
+    def __call__(self, **inputs):
+        return SimpleNamespace(logits=self._run(inputs))
+
+
+class OnnxClauseDetector(_OnnxModel):
+    """ONNX stand-in for OptimizedLegalBERTDetector: model(input_ids, attention_mask) -> logits."""
+
+    def __call__(self, input_ids, attention_mask, use_multi_dropout=False):
+        return self._run({"input_ids": input_ids, "attention_mask": attention_mask})
+
+
+def load_onnx_model(torch_model: nn.Module, dummy_inputs: Dict[str, torch.Tensor], source_path: Path,
+                    backend: str = INFERENCE_BACKEND, detector: bool = False,
+                    per_token_output: bool = False):
+    """
+    Wrap a loaded PyTorch model with an ONNX Runtime backend.
+
+    Args:
+        torch_model: Loaded PyTorch model (used for export and its config)
+        dummy_inputs: Tokenizer output used for tracing
+        source_path: Model directory or checkpoint file the model came from
+        backend: One of INFERENCE_BACKENDS
+        detector: True for OptimizedLegalBERTDetector
+        per_token_output: True for token classification models
+
+    Returns:
+        OnnxSequenceModel / OnnxClauseDetector, or None to keep the PyTorch model
+    """
+    if backend == BACKEND_PYTORCH:
+        return None
+    if backend not in INFERENCE_BACKENDS:
+        logger.warning(f"⚠️ Unknown ML_INFERENCE_BACKEND '{backend}', using PyTorch")
+        return None
+    if not onnx_available():
+        logger.warning("⚠️ onnxruntime not installed (pip install onnxruntime), using PyTorch")
+        return None
+
+    try:
+        onnx_path = ensure_onnx_file(torch_model, dummy_inputs, source_path, backend, detector, per_token_output)
+        session = create_session(onnx_path)
+    except Exception as e:
+        logger.error(f"❌ ONNX backend unavailable for {source_path}: {e}", exc_info=True)
+        return None
+
+    wrapper_cls = OnnxClauseDetector if detector else OnnxSequenceModel
+    logger.info(f"✓ Serving {Path(source_path).name} with ONNX Runtime ({backend})")
+    return wrapper_cls(session, config=getattr(torch_model, "config", None), backend=backend)
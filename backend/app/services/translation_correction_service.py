@@ -15,6 +15,8 @@ from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 import csv
 
+from app.services.glossary_matcher import get_glossary_matcher
+from app.services.grammar_rule_engine import GrammarRuleEngine
 from app.services.sinhala_unicode_normalizer import (
     normalize_sinhala_unicode,
     full_sinhala_normalization,
@@ -274,6 +276,10 @@ TAMIL_PHRASE_CORRECTIONS = {
     "நிவாரணம் கோரி": "நிவாரணம் கோரி",
 }
 
+# Rule tables compiled once per language (see grammar_rule_engine)
+SINHALA_GRAMMAR_ENGINE = GrammarRuleEngine(SINHALA_GRAMMAR_RULES, SINHALA_PHRASE_CORRECTIONS)
+TAMIL_GRAMMAR_ENGINE = GrammarRuleEngine(TAMIL_GRAMMAR_RULES, TAMIL_PHRASE_CORRECTIONS)
+
 
 # ============================================================================
 # CORRECTION FUNCTIONS
@@ -287,21 +293,8 @@ def apply_sinhala_grammar_correction(text: str) -> Tuple[str, int]:
     if not text or not isinstance(text, str):
         return text, 0
     
-    corrected = text
-    corrections_count = 0
-    
-    # Apply regex-based rules
-    for pattern, replacement in SINHALA_GRAMMAR_RULES:
-        new_text = re.sub(pattern, replacement, corrected)
-        if new_text != corrected:
-            corrections_count += 1
-            corrected = new_text
-    
-    # Apply phrase corrections
-    for incorrect, correct in SINHALA_PHRASE_CORRECTIONS.items():
-        if incorrect in corrected:
-            corrected = corrected.replace(incorrect, correct)
-            corrections_count += 1
+    # Regex rules, then phrase corrections (same order and counting as rule-by-rule re.sub)
+    corrected, corrections_count = SINHALA_GRAMMAR_ENGINE.apply(text)
     
     # Trim whitespace
     corrected = corrected.strip()
@@ -317,21 +310,8 @@ def apply_tamil_grammar_correction(text: str) -> Tuple[str, int]:
     if not text or not isinstance(text, str):
         return text, 0
     
-    corrected = text
-    corrections_count = 0
-    
-    # Apply regex-based rules
-    for pattern, replacement in TAMIL_GRAMMAR_RULES:
-        new_text = re.sub(pattern, replacement, corrected)
-        if new_text != corrected:
-            corrections_count += 1
-            corrected = new_text
-    
-    # Apply phrase corrections
-    for incorrect, correct in TAMIL_PHRASE_CORRECTIONS.items():
-        if incorrect in corrected:
-            corrected = corrected.replace(incorrect, correct)
-            corrections_count += 1
+    # Regex rules, then phrase corrections (same order and counting as rule-by-rule re.sub)
+    corrected, corrections_count = TAMIL_GRAMMAR_ENGINE.apply(text)
     
     # Trim whitespace
     corrected = corrected.strip()
@@ -343,31 +323,14 @@ def _find_terms_with_word_boundaries(source_lower: str, term_map: Dict[str, str]
     """
     Find glossary terms in source text using proper word boundary matching.
     Avoids false positives like 'petit' inside 'petitioner' or 'vice' inside 'services'.
-    Returns list of (en_term, local_term) sorted longest-first.
+    Occurrences covered by a longer term are skipped (one Aho-Corasick pass,
+    see glossary_matcher). Returns list of (en_term, local_term) sorted longest-first.
     """
-    found_terms = []
-    already_covered = set()  # Track character positions already matched by longer terms
-
-    # Sort by length (longest first) so multi-word terms take priority
-    candidates = sorted(term_map.items(), key=lambda x: len(x[0]), reverse=True)
-
-    for en_term, local_term in candidates:
-        # Skip very short terms (high false-positive risk)
-        if len(en_term) < 4:
-            continue
-
-        # Use word boundary regex to find whole-word/phrase matches only
-        pattern = r'\b' + re.escape(en_term) + r'\b'
-        for m in re.finditer(pattern, source_lower):
-            span = (m.start(), m.end())
-            # Skip if this span is already covered by a longer term
-            if any(span[0] >= c[0] and span[1] <= c[1] for c in already_covered):
-                continue
-            already_covered.add(span)
-            found_terms.append((en_term, local_term))
-            break  # One match per term is enough
-
-    return found_terms
+    # Skip very short terms (high false-positive risk)
+    found = get_glossary_matcher().find_terms(source_lower, min_length=4, terms=term_map)
+    # Longest first so multi-word terms are corrected before their parts
+    found.sort(key=len, reverse=True)
+    return [(en_term, term_map[en_term]) for en_term in found]
 
 
 def apply_glossary_correction(text: str, source_text: str, target_lang: str) -> Tuple[str, int, List[str]]:
@@ -530,6 +493,56 @@ def apply_comprehensive_correction(
     return result
 
 
+def empty_correction_stats(total_sections: int = 0) -> Dict:
+    """Zeroed aggregate statistics, as returned by batch_correct_sections."""
+    return {
+        "total_sections": total_sections,
+        "sections_corrected": 0,
+        "glossary_corrections": 0,
+        "grammar_corrections": 0,
+        "total_corrections": 0,
+        "all_terms_corrected": [],
+    }
+
+
+def correct_section(section: Dict, source_text: str, target_lang: str, stats: Optional[Dict] = None) -> Dict:
+    """
+    Apply corrections to one translated section.
+    
+    Args:
+        section: Translated section
+        source_text: Matching source section text
+        target_lang: Target language
+        stats: Aggregate statistics to add this section's corrections to
+    
+    Returns:
+        Corrected copy of the section
+    """
+    translated_text = section.get("translated_content", "")
+    
+    # Apply corrections
+    correction_result = apply_comprehensive_correction(
+        translated_text, source_text, target_lang
+    )
+    
+    # Update section with corrected text
+    corrected_section = section.copy()
+    corrected_section["translated_content"] = correction_result["corrected_text"]
+    corrected_section["correction_applied"] = correction_result["was_corrected"]
+    corrected_section["corrections_count"] = correction_result["total_corrections"]
+    
+    # Update statistics
+    if stats is not None:
+        if correction_result["was_corrected"]:
+            stats["sections_corrected"] += 1
+        stats["glossary_corrections"] += correction_result["glossary_corrections"]
+        stats["grammar_corrections"] += correction_result["grammar_corrections"]
+        stats["total_corrections"] += correction_result["total_corrections"]
+        stats["all_terms_corrected"].extend(correction_result["terms_corrected"])
+    
+    return corrected_section
+
+
 def batch_correct_sections(
     sections: List[Dict],
     source_sections: List[Dict],
@@ -547,43 +560,16 @@ def batch_correct_sections(
         (corrected_sections, statistics)
     """
     corrected_sections = []
-    stats = {
-        "total_sections": len(sections),
-        "sections_corrected": 0,
-        "glossary_corrections": 0,
-        "grammar_corrections": 0,
-        "total_corrections": 0,
-        "all_terms_corrected": [],
-    }
+    stats = empty_correction_stats(len(sections))
     
     for i, section in enumerate(sections):
-        translated_text = section.get("translated_content", "")
         source_text = ""
         
         # Find matching source section
         if i < len(source_sections):
             source_text = source_sections[i].get("content", "")
         
-        # Apply corrections
-        correction_result = apply_comprehensive_correction(
-            translated_text, source_text, target_lang
-        )
-        
-        # Update section with corrected text
-        corrected_section = section.copy()
-        corrected_section["translated_content"] = correction_result["corrected_text"]
-        corrected_section["correction_applied"] = correction_result["was_corrected"]
-        corrected_section["corrections_count"] = correction_result["total_corrections"]
-        
-        corrected_sections.append(corrected_section)
-        
-        # Update statistics
-        if correction_result["was_corrected"]:
-            stats["sections_corrected"] += 1
-        stats["glossary_corrections"] += correction_result["glossary_corrections"]
-        stats["grammar_corrections"] += correction_result["grammar_corrections"]
-        stats["total_corrections"] += correction_result["total_corrections"]
-        stats["all_terms_corrected"].extend(correction_result["terms_corrected"])
+        corrected_sections.append(correct_section(section, source_text, target_lang, stats))
     
     # Remove duplicate terms
     stats["all_terms_corrected"] = list(set(stats["all_terms_corrected"]))
@@ -0,0 +1,432 @@
+"""
+Translation Job Store - transactional SQLite persistence for translation jobs.
+
+Jobs used to live in one indented JSON file each, rewritten in full for every
+translated section (and re-read before every section to check for
+cancellation), so a long document cost O(n^2) disk I/O and the history page
+parsed every complete job just to list 20 summaries.
+
+The store keeps, in one embedded SQLite database (WAL journal) under
+translation_jobs/:
+
+- jobs:     one row per job; the summary/control fields (status, progress,
+            skip list, ...) are columns, the bulky remainder (source sections,
+            raw texts, statistics) is one compact JSON blob
+- sections: one row per translated section, appended as it is produced
+            ("partial") and written once more on completion ("final")
+- queue:    jobs waiting for / running on the translation scheduler, with
+            their priority, FIFO sequence and input sections, so queued work
+            survives a restart
+
+Progress updates are a single-row UPDATE plus one INSERT, cancellation checks
+read two columns, and list_jobs reads the summary columns through an index.
+load_progress(since=N) returns only the partial sections from position N on,
+so progress clients fetch each section once instead of the whole list per poll.
+load() reassembles the exact dict the JSON files used to hold, so get_job,
+get_job_progress, list_jobs and export_translation are unchanged for clients.
+
+Existing <job_id>.json files are imported on first start and renamed to
+<job_id>.json.migrated.
+
+Exports:
+ - TranslationJobStore
+ - get_job_store() -> TranslationJobStore
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Database file (next to the legacy per-job JSON files)
+JOBS_DIR = Path(__file__).parent.parent.parent / "translation_jobs"
+JOB_STORE_PATH = JOBS_DIR / "jobs.sqlite3"
+
+# Job fields stored as columns; everything else goes into the data blob
+_COLUMNS = (
+    "filename", "source_language", "target_language", "mode", "status",
+    "progress", "total_sections", "completed_sections", "created_at",
+    "completed_at", "processing_time", "error", "skip_sections",
+)
+_SECTION_FIELDS = {"partial_translated_sections": "partial", "translated_sections": "final"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id             TEXT PRIMARY KEY,
+    filename           TEXT,
+    source_language    TEXT,
+    target_language    TEXT,
+    mode               TEXT,
+    status             TEXT,
+    progress           INTEGER DEFAULT 0,
+    total_sections     INTEGER DEFAULT 0,
+    completed_sections INTEGER DEFAULT 0,
+    created_at         TEXT,
+    completed_at       TEXT,
+    processing_time    REAL DEFAULT 0,
+    error              TEXT,
+    skip_sections      TEXT,
+    data               TEXT NOT NULL DEFAULT '{}',
+    updated_at         REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_updated_at ON jobs (updated_at);
+CREATE TABLE IF NOT EXISTS sections (
+    job_id   TEXT    NOT NULL,
+    phase    TEXT    NOT NULL,
+    position INTEGER NOT NULL,
+    data     TEXT    NOT NULL,
+    PRIMARY KEY (job_id, phase, position)
+);
+CREATE TABLE IF NOT EXISTS queue (
+    seq         INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id      TEXT    NOT NULL UNIQUE,
+    model_key   TEXT    NOT NULL,
+    priority    INTEGER NOT NULL,
+    payload     TEXT    NOT NULL,
+    enqueued_at REAL    NOT NULL,
+    started_at  REAL
+);
+"""
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class TranslationJobStore:
+    """SQLite-backed store of translation jobs and their per-section results."""
+
+    def __init__(self, db_path: Path = JOB_STORE_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection shared by all threads, serialized by self._lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        self._import_json_files()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def save(self, job: Dict) -> None:
+        """Insert or fully replace a job (its section lists included)."""
+        job_id = job["job_id"]
+        columns, data, sections = self._split(job)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO jobs (job_id, {', '.join(_COLUMNS)}, data, updated_at) "
+                f"VALUES ({', '.join('?' * (len(_COLUMNS) + 3))})",
+                (job_id, *(columns.get(c) for c in _COLUMNS), _dumps(data), time.time()),
+            )
+            self._conn.execute("DELETE FROM sections WHERE job_id = ?", (job_id,))
+            for phase, rows in sections.items():
+                self._insert_sections(job_id, phase, rows)
+
+    def update(self, job_id: str, fields: Dict) -> bool:
+        """
+        Update some fields of a job in one transaction.
+
+        Column fields are set directly, section lists replace the stored rows
+        and any other field is merged into the data blob.
+
+        Returns:
+            bool: False if the job does not exist
+        """
+        columns, data, sections = self._split(fields)
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return False
+            assignments = [f"{c} = ?" for c in columns] + ["updated_at = ?"]
+            values = list(columns.values()) + [time.time()]
+            if data:
+                merged = json.loads(row[0])
+                merged.update(data)
+                assignments.append("data = ?")
+                values.append(_dumps(merged))
+            self._conn.execute(f"UPDATE jobs SET {', '.join(assignments)} WHERE job_id = ?", (*values, job_id))
+            for phase, rows in sections.items():
+                self._conn.execute("DELETE FROM sections WHERE job_id = ? AND phase = ?", (job_id, phase))
+                self._insert_sections(job_id, phase, rows)
+        return True
+
+    def update_progress(self, job_id: str, completed: int, total: int,
+                        section: Optional[Dict] = None) -> None:
+        """Record progress and append one translated section (O(1) per section)."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET completed_sections = ?, total_sections = ?, progress = ?, updated_at = ? "
+                "WHERE job_id = ?",
+                (completed, total, round(completed / max(total, 1) * 100), time.time(), job_id),
+            )
+            if cursor.rowcount and section is not None:
+                self._conn.execute(
+                    "INSERT INTO sections (job_id, phase, position, data) VALUES "
+                    "(?, 'partial', (SELECT COALESCE(MAX(position), -1) + 1 FROM sections "
+                    "WHERE job_id = ? AND phase = 'partial'), ?)",
+                    (job_id, job_id, _dumps(section)),
+                )
+
+    def add_skip_section(self, job_id: str, section_index: int) -> Optional[List[int]]:
+        """
+        Mark a section to be skipped.
+
+        Returns:
+            List[int]: The job's skip list, or None if the job does not exist
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT skip_sections FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            skip = set(json.loads(row[0]) if row[0] else [])
+            skip.add(section_index)
+            skip_list = list(skip)
+            self._conn.execute("UPDATE jobs SET skip_sections = ?, updated_at = ? WHERE job_id = ?",
+                               (_dumps(skip_list), time.time(), job_id))
+        return skip_list
+
+    def delete(self, job_id: str) -> bool:
+        """Delete a job and its sections. Returns False if it did not exist."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+            self._conn.execute("DELETE FROM sections WHERE job_id = ?", (job_id,))
+            self._conn.execute("DELETE FROM queue WHERE job_id = ?", (job_id,))
+        return cursor.rowcount > 0
+
+    def enqueue(self, job_id: str, model_key: str, priority: int, payload: Dict) -> int:
+        """
+        Persist a scheduled job.
+
+        Returns:
+            int: FIFO sequence number (ties between equal priorities run in this order)
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO queue (job_id, model_key, priority, payload, enqueued_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, model_key, priority, _dumps(payload), time.time()),
+            )
+        return cursor.lastrowid
+
+    def mark_started(self, job_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE queue SET started_at = ? WHERE job_id = ?", (time.time(), job_id))
+
+    def dequeue(self, job_id: str) -> None:
+        """Remove a finished (or abandoned) job from the queue."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM queue WHERE job_id = ?", (job_id,))
+
+    def queued_jobs(self) -> List[Dict]:
+        """Every persisted queue entry, in (priority, seq) order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, job_id, model_key, priority, payload, enqueued_at, started_at "
+                "FROM queue ORDER BY priority, seq"
+            ).fetchall()
+        return [
+            {"seq": seq, "job_id": job_id, "model_key": model_key, "priority": priority,
+             "payload": json.loads(payload), "enqueued_at": enqueued_at, "started_at": started_at}
+            for seq, job_id, model_key, priority, payload, enqueued_at, started_at in rows
+        ]
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def load(self, job_id: str) -> Optional[Dict]:
+        """Reassemble the full job dict (same shape as the old JSON file)."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)}, data FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            section_rows = self._conn.execute(
+                "SELECT phase, data FROM sections WHERE job_id = ? ORDER BY phase, position", (job_id,)
+            ).fetchall()
+
+        job = {"job_id": job_id}
+        job.update(self._columns_to_fields(row[:-1]))
+        job.update(json.loads(row[-1]))
+
+        partial = [json.loads(data) for phase, data in section_rows if phase == "partial"]
+        job["translated_sections"] = [json.loads(data) for phase, data in section_rows if phase == "final"]
+        if partial:
+            job["partial_translated_sections"] = partial
+        return job
+
+    def load_progress(self, job_id: str, since: int = 0) -> Optional[Dict]:
+        """
+        Status/progress fields and the partial sections, without the data blob.
+
+        Args:
+            job_id: Job id
+            since: Cursor from a previous call; only partial sections from this
+                   position on are returned
+
+        Returns:
+            Dict with status, progress, completed/total sections, error,
+            partial_translated_sections (new ones only), cursor (pass as since
+            next time), reset (True if since was past the stored sections -
+            the job was restarted - and the list starts over from 0) and
+            updated_at; None if the job does not exist
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, progress, completed_sections, total_sections, error, updated_at "
+                "FROM jobs WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            (stored,) = self._conn.execute(
+                "SELECT COUNT(*) FROM sections WHERE job_id = ? AND phase = 'partial'", (job_id,)
+            ).fetchone()
+            reset = since > stored
+            if reset:
+                since = 0
+            partial = self._conn.execute(
+                "SELECT data FROM sections WHERE job_id = ? AND phase = 'partial' AND position >= ? "
+                "ORDER BY position",
+                (job_id, since),
+            ).fetchall() if since < stored else []
+
+        status, progress, completed, total, error, updated_at = row
+        return {
+            "status": status,
+            "progress": progress or 0,
+            "completed_sections": completed or 0,
+            "total_sections": total or 0,
+            "error": error,
+            "partial_translated_sections": [json.loads(data) for (data,) in partial],
+            "cursor": stored,
+            "reset": reset,
+            "updated_at": updated_at,
+        }
+
+    def updated_at(self, job_id: str) -> Optional[float]:
+        """Time of the job's last write (cheap change check), or None if it does not exist."""
+        with self._lock:
+            row = self._conn.execute("SELECT updated_at FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def control(self, job_id: str) -> Optional[Tuple[str, List[int]]]:
+        """(status, skip_sections) for the per-section cancellation check, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, skip_sections FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]) if row[1] else []
+
+    def list_recent(self, limit: int = 20) -> List[Dict]:
+        """Summaries of the most recently updated jobs (summary columns only)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id, filename, source_language, target_language, status, progress, "
+                "created_at, processing_time, mode FROM jobs ORDER BY updated_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [
+            {
+                "job_id": job_id,
+                "filename": filename or "",
+                "source_language": source_language or "",
+                "target_language": target_language or "",
+                "status": status or "",
+                "progress": progress or 0,
+                "created_at": created_at or "",
+                "processing_time": processing_time or 0,
+                "mode": mode or "document",
+            }
+            for job_id, filename, source_language, target_language, status, progress,
+                created_at, processing_time, mode in rows
+        ]
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _split(job: Dict) -> Tuple[Dict, Dict, Dict[str, List[Dict]]]:
+        """Partition job fields into (columns, data blob, {phase: sections})."""
+        columns, data, sections = {}, {}, {}
+        for key, value in job.items():
+            if key == "job_id":
+                continue
+            if key in _SECTION_FIELDS:
+                sections[_SECTION_FIELDS[key]] = value or []
+            elif key == "skip_sections":
+                columns[key] = _dumps(list(value or []))
+            elif key in _COLUMNS:
+                columns[key] = value
+            else:
+                data[key] = value
+        return columns, data, sections
+
+    @staticmethod
+    def _columns_to_fields(values) -> Dict:
+        """Column values -> job fields; unset columns are omitted (error is always present)."""
+        fields = {}
+        for column, value in zip(_COLUMNS, values):
+            if value is None and column != "error":
+                continue
+            fields[column] = json.loads(value) if column == "skip_sections" else value
+        return fields
+
+    def _insert_sections(self, job_id: str, phase: str, rows: List[Dict]) -> None:
+        """Insert a section list (caller holds the lock and the transaction)."""
+        self._conn.executemany(
+            "INSERT INTO sections (job_id, phase, position, data) VALUES (?, ?, ?, ?)",
+            [(job_id, phase, position, _dumps(section)) for position, section in enumerate(rows)],
+        )
+
+    def _import_json_files(self) -> None:
+        """Import legacy <job_id>.json files not yet in the database."""
+        imported = 0
+        for path in sorted(self.db_path.parent.glob("*.json"), key=lambda p: p.stat().st_mtime):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    job = json.load(f)
+                job.setdefault("job_id", path.stem)
+                self.save(job)
+                path.rename(path.with_name(path.name + ".migrated"))
+                imported += 1
+            except (OSError, ValueError, sqlite3.Error) as e:
+                logger.warning(f"⚠️ Could not import translation job {path.name}: {e}")
+        if imported:
+            logger.info(f"✓ Imported {imported} translation jobs from JSON files into {self.db_path.name}")
+
+
+# Global store instance (lazy loaded)
+_job_store_instance = None
+_job_store_lock = threading.Lock()
+
+
+def get_job_store() -> TranslationJobStore:
+    """
+    Get or create the global translation job store.
+
+    Returns:
+        TranslationJobStore: Shared store instance
+    """
+    global _job_store_instance
+
+    if _job_store_instance is None:
+        with _job_store_lock:
+            if _job_store_instance is None:
+                _job_store_instance = TranslationJobStore()
+
+    return _job_store_instance
@@ -0,0 +1,323 @@
+"""
+Translation Memory - persistent sentence-level memory for mBART translation.
+
+Legal documents repeat themselves: captions, standard recitals, statutory
+quotations and boilerplate orders recur across judgments and within one
+document. Every sentence translated by the model is stored here, keyed by
+
+- the model pair (en_si / en_ta),
+- the model version (checkpoint identity + generation settings),
+- the normalized source sentence (whitespace collapsed),
+
+so a sentence seen before is returned instantly instead of being re-run
+through beam search, and a changed checkpoint never serves a stale entry.
+
+Storage is an embedded SQLite database (WAL journal) under translation_jobs/,
+bounded by entry count and by total text size (TRANSLATION_MEMORY_MAX_ENTRIES,
+TRANSLATION_MEMORY_MAX_MB); least recently used entries are evicted first.
+
+Optional fuzzy mode (TRANSLATION_MEMORY_FUZZY) looks up near matches for
+sentences that missed and returns them as suggestions (difflib similarity
+>= TRANSLATION_MEMORY_FUZZY_THRESHOLD). Suggestions are informational only;
+the model still translates the sentence.
+
+Exports:
+ - TRANSLATION_MEMORY_ENABLED, TRANSLATION_MEMORY_FUZZY
+ - TranslationMemory
+ - normalize_source(text) -> str
+ - get_translation_memory() -> TranslationMemory
+"""
+
+import difflib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+TRANSLATION_MEMORY_ENABLED = os.getenv("TRANSLATION_MEMORY_ENABLED", "true").lower() == "true"
+TRANSLATION_MEMORY_MAX_ENTRIES = int(os.getenv("TRANSLATION_MEMORY_MAX_ENTRIES", "200000"))
+TRANSLATION_MEMORY_MAX_MB = float(os.getenv("TRANSLATION_MEMORY_MAX_MB", "200"))
+TRANSLATION_MEMORY_FUZZY = os.getenv("TRANSLATION_MEMORY_FUZZY", "false").lower() == "true"
+TRANSLATION_MEMORY_FUZZY_THRESHOLD = float(os.getenv("TRANSLATION_MEMORY_FUZZY_THRESHOLD", "0.85"))
+
+# Candidates scanned per fuzzy lookup (most recently used first, similar length)
+FUZZY_CANDIDATES = 500
+
+# Database file
+TRANSLATION_MEMORY_PATH = Path(__file__).parent.parent.parent / "translation_jobs" / "translation_memory.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory (
+    model_key     TEXT    NOT NULL,
+    model_version TEXT    NOT NULL,
+    source        TEXT    NOT NULL,
+    target        TEXT    NOT NULL,
+    confidence    REAL    NOT NULL,
+    length        INTEGER NOT NULL,
+    size          INTEGER NOT NULL,
+    hits          INTEGER NOT NULL DEFAULT 0,
+    created_at    REAL    NOT NULL,
+    last_used     REAL    NOT NULL,
+    PRIMARY KEY (model_key, model_version, source)
+);
+CREATE INDEX IF NOT EXISTS idx_memory_last_used ON memory (last_used);
+CREATE INDEX IF NOT EXISTS idx_memory_length ON memory (model_key, model_version, length);
+"""
+
+
+def normalize_source(text: str) -> str:
+    """Collapse runs of whitespace so layout differences share one entry."""
+    return " ".join(text.split())
+
+
+class TranslationMemory:
+    """SQLite-backed LRU memory of sentence translations."""
+
+    def __init__(self, db_path: Path = TRANSLATION_MEMORY_PATH,
+                 max_entries: int = TRANSLATION_MEMORY_MAX_ENTRIES,
+                 max_mb: float = TRANSLATION_MEMORY_MAX_MB):
+        self.db_path = Path(db_path)
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0,
+                       "fuzzy_lookups": 0, "fuzzy_suggestions": 0}
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by all threads, serialized by self._lock
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        self._entries, self._bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM memory"
+        ).fetchone()
+        logger.info(f"✓ Translation memory: {self._entries} entries ({self._bytes / 1024 / 1024:.1f} MB)")
+
+    def get_many(self, model_key: str, model_version: str,
+                 sources: Sequence[str]) -> Dict[str, Tuple[str, float]]:
+        """
+        Look up exact matches for several source sentences.
+
+        Args:
+            model_key: Model pair (en_si / en_ta)
+            model_version: Model version string
+            sources: Source sentences (normalized here)
+
+        Returns:
+            Dict: normalized source -> (target, confidence) for every hit
+        """
+        wanted = list(dict.fromkeys(normalize_source(s) for s in sources))
+        if not wanted:
+            return {}
+
+        found: Dict[str, Tuple[str, float]] = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(wanted), 500):
+                chunk = wanted[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT source, target, confidence FROM memory "
+                    f"WHERE model_key = ? AND model_version = ? AND source IN ({placeholders})",
+                    (model_key, model_version, *chunk),
+                ).fetchall()
+                for source, target, confidence in rows:
+                    found[source] = (target, confidence)
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE memory SET hits = hits + 1, last_used = ? "
+                    "WHERE model_key = ? AND model_version = ? AND source = ?",
+                    [(now, model_key, model_version, source) for source in found],
+                )
+                self._conn.commit()
+
+            self._stats["hits"] += sum(1 for s in sources if normalize_source(s) in found)
+            self._stats["misses"] += sum(1 for s in sources if normalize_source(s) not in found)
+        return found
+
+    def put_many(self, model_key: str, model_version: str,
+                 entries: Sequence[Tuple[str, str, float]]) -> None:
+        """
+        Store translated sentences, evicting least recently used entries.
+
+        Args:
+            model_key: Model pair (en_si / en_ta)
+            model_version: Model version string
+            entries: (source, target, confidence) per sentence
+        """
+        if not entries:
+            return
+
+        now = time.time()
+        rows = {}
+        for source, target, confidence in entries:
+            source = normalize_source(source)
+            if source:
+                size = len(source.encode("utf-8")) + len(target.encode("utf-8"))
+                rows[source] = (model_key, model_version, source, target, float(confidence),
+                                len(source), size, now, now)
+
+        with self._lock:
+            try:
+                # Sizes of the rows about to be replaced, so the totals can be
+                # kept incrementally instead of re-summing the table
+                replaced: Dict[str, int] = {}
+                sources = list(rows)
+                for start in range(0, len(sources), 500):
+                    chunk = sources[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    replaced.update(self._conn.execute(
+                        f"SELECT source, size FROM memory "
+                        f"WHERE model_key = ? AND model_version = ? AND source IN ({placeholders})",
+                        (model_key, model_version, *chunk),
+                    ).fetchall())
+
+                self._conn.executemany(
+                    "INSERT INTO memory (model_key, model_version, source, target, confidence, "
+                    "length, size, created_at, last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (model_key, model_version, source) DO UPDATE SET "
+                    "target = excluded.target, confidence = excluded.confidence, "
+                    "size = excluded.size, last_used = excluded.last_used",
+                    list(rows.values()),
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Could not write translation memory entries: {e}")
+                return
+
+            self._stats["stores"] += len(rows)
+            self._entries += len(rows) - len(replaced)
+            self._bytes += sum(row[6] for row in rows.values()) - sum(replaced.values())
+            if self._entries > self.max_entries or self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until within both limits (caller holds the lock)."""
+        evicted = 0
+        while self._entries > self.max_entries or self._bytes > self.max_bytes:
+            # Evict in slices of ~5% so one eviction pass isn't repeated per insert
+            excess = max(self._entries - self.max_entries, 1)
+            batch = max(excess, self.max_entries // 20, 1)
+            rows = self._conn.execute(
+                "SELECT rowid, size FROM memory ORDER BY last_used LIMIT ?", (batch,)
+            ).fetchall()
+            if not rows:
+                break
+            self._conn.executemany("DELETE FROM memory WHERE rowid = ?", [(rowid,) for rowid, _ in rows])
+            self._entries -= len(rows)
+            self._bytes -= sum(size for _, size in rows)
+            evicted += len(rows)
+        self._conn.commit()
+
+        self._stats["evictions"] += evicted
+        if evicted:
+            logger.info(f"🧹 Evicted {evicted} translation memory entries "
+                        f"({self._entries} kept, {self._bytes / 1024 / 1024:.1f} MB)")
+
+    def suggest(self, model_key: str, model_version: str, source: str,
+                threshold: float = TRANSLATION_MEMORY_FUZZY_THRESHOLD,
+                limit: int = 3) -> List[Dict]:
+        """
+        Find stored translations of sentences similar to source.
+
+        Args:
+            model_key: Model pair (en_si / en_ta)
+            model_version: Model version string
+            source: Source sentence without an exact match
+            threshold: Minimum difflib similarity ratio (0-1)
+            limit: Maximum suggestions returned
+
+        Returns:
+            List[Dict]: {source, target, similarity, confidence}, best first
+        """
+        source = normalize_source(source)
+        if not source:
+            return []
+
+        # A ratio >= threshold is impossible outside this length window
+        min_len = int(len(source) * threshold / (2 - threshold))
+        max_len = int(len(source) * (2 - threshold) / threshold) + 1
+        with self._lock:
+            self._stats["fuzzy_lookups"] += 1
+            rows = self._conn.execute(
+                "SELECT source, target, confidence FROM memory "
+                "WHERE model_key = ? AND model_version = ? AND length BETWEEN ? AND ? AND source != ? "
+                "ORDER BY last_used DESC LIMIT ?",
+                (model_key, model_version, min_len, max_len, source, FUZZY_CANDIDATES),
+            ).fetchall()
+
+        matcher = difflib.SequenceMatcher(autojunk=False)
+        matcher.set_seq2(source)
+        scored = []
+        for candidate, target, confidence in rows:
+            matcher.set_seq1(candidate)
+            # Cheap upper bounds first
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= threshold:
+                scored.append({
+                    "source": candidate,
+                    "target": target,
+                    "similarity": round(ratio, 4),
+                    "confidence": round(confidence, 4),
+                })
+        scored.sort(key=lambda s: s["similarity"], reverse=True)
+
+        if scored:
+            with self._lock:
+                self._stats["fuzzy_suggestions"] += 1
+        return scored[:limit]
+
+    def clear(self) -> None:
+        """Remove every stored translation."""
+        with self._lock:
+            self._conn.execute("DELETE FROM memory")
+            self._conn.commit()
+            self._entries = self._bytes = 0
+
+    def stats(self) -> Dict:
+        """Hit/miss counters, current size and limits."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = self._entries
+            stats["bytes"] = self._bytes
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["max_entries"] = self.max_entries
+        stats["max_bytes"] = self.max_bytes
+        stats["fuzzy"] = TRANSLATION_MEMORY_FUZZY
+        return stats
+
+
+# Global memory instance (lazy loaded)
+_translation_memory_instance = None
+_translation_memory_lock = threading.Lock()
+
+
+def get_translation_memory() -> TranslationMemory:
+    """
+    Get or create the global translation memory.
+
+    Returns:
+        TranslationMemory: Shared memory instance
+    """
+    global _translation_memory_instance
+
+    if _translation_memory_instance is None:
+        with _translation_memory_lock:
+            if _translation_memory_instance is None:
+                _translation_memory_instance = TranslationMemory()
+
+    return _translation_memory_instance
@@ -0,0 +1,267 @@
+"""
+Translation Scheduler - bounded, persistent job queue for mBART translation.
+
+Every translation request used to start its own thread, so ten uploads meant
+ten threads beam-searching on the same model and CPU cores at once - slower
+in total than running them one after another, and every job finished late.
+
+Jobs are now queued per model pair (en_si / en_ta) and run by a small fixed
+pool of workers for that pair (TRANSLATION_WORKERS_PER_MODEL). The queue is
+ordered by (priority, arrival): interactive text requests (PRIORITY_INTERACTIVE)
+jump ahead of document jobs (PRIORITY_DOCUMENT) that have not started yet;
+jobs of equal priority run FIFO. Priority only orders the queue - a running
+job is never preempted and no worker is reserved, so with every worker busy
+an interactive request still waits for the first running job to finish.
+Queue entries are persisted in the job store, so queued work survives a
+restart (jobs that were mid-run start over); the app startup hook creates
+the scheduler so they are picked up without waiting for the next request.
+
+queue_info() reports a job's queue position and an ETA, estimated from a
+running average of seconds per section for the model pair, updated only by
+jobs whose sections were all translated (not stopped, skipped or failed).
+
+Exports:
+ - PRIORITY_INTERACTIVE, PRIORITY_DOCUMENT
+ - TranslationScheduler
+ - get_translation_scheduler() -> TranslationScheduler
+"""
+
+import heapq
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.services.translation_job_store import TranslationJobStore, get_job_store
+from app.services.translation_service import _model_key, run_translation_job
+
+logger = logging.getLogger(__name__)
+
+TRANSLATION_WORKERS_PER_MODEL = int(os.getenv("TRANSLATION_WORKERS_PER_MODEL", "1"))
+# Seeds the per-model ETA estimate until the first job has finished
+TRANSLATION_SECONDS_PER_SECTION = float(os.getenv("TRANSLATION_SECONDS_PER_SECTION", "3.0"))
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_DOCUMENT = 10
+
+
+class TranslationScheduler:
+    """Per-model-pair worker pools fed by a persistent priority queue."""
+
+    def __init__(self, store: Optional[TranslationJobStore] = None,
+                 workers_per_model: int = TRANSLATION_WORKERS_PER_MODEL):
+        self.store = store or get_job_store()
+        self.workers_per_model = max(1, workers_per_model)
+
+        self._cond = threading.Condition()
+        self._queues: Dict[str, List[Tuple[int, int, str]]] = {}  # model -> heap of (priority, seq, job_id)
+        self._payloads: Dict[str, Dict] = {}                       # job_id -> queued job
+        self._running: Dict[str, Tuple[str, int, float]] = {}      # job_id -> (model, sections, started)
+        self._workers: Dict[str, List[threading.Thread]] = {}
+        self._seconds_per_section: Dict[str, float] = {}           # EWMA per model
+        self._stats = {"submitted": 0, "completed": 0, "cancelled_before_start": 0,
+                       "errors": 0, "recovered": 0, "max_queue_depth": 0}
+
+        self._recover()
+
+    def submit(self, job_id: str, sections: List[Dict], source_lang: str, target_lang: str,
+               model_used: str, mode: str = "document",
+               priority: int = PRIORITY_DOCUMENT) -> Dict:
+        """
+        Queue a created job for translation.
+
+        Args:
+            job_id: Job created with create_job
+            sections: Source sections to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            model_used: Model label recorded on the job
+            mode: "document" or "text"
+            priority: Lower runs first (PRIORITY_INTERACTIVE / PRIORITY_DOCUMENT);
+                      only overtakes jobs that have not started
+
+        Returns:
+            Dict: queue_info() of the job right after queueing
+        """
+        model_key = _model_key(source_lang, target_lang)
+        payload = {
+            "sections": sections,
+            "source_lang": source_lang,
+            "target_lang": target_lang,
+            "model_used": model_used,
+            "mode": mode,
+        }
+        seq = self.store.enqueue(job_id, model_key, priority, payload)
+        with self._cond:
+            self._push(job_id, model_key, priority, seq, payload)
+            self._stats["submitted"] += 1
+        return self.queue_info(job_id)
+
+    def _push(self, job_id: str, model_key: str, priority: int, seq: int, payload: Dict) -> None:
+        """Add to the in-memory queue and wake a worker (caller holds the condition)."""
+        payload["model_key"] = model_key
+        self._payloads[job_id] = payload
+        queue = self._queues.setdefault(model_key, [])
+        heapq.heappush(queue, (priority, seq, job_id))
+        self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], len(queue))
+        self._ensure_workers(model_key)
+        self._cond.notify_all()
+
+    def _recover(self) -> None:
+        """Re-queue persisted entries left over from a previous run."""
+        entries = self.store.queued_jobs()
+        with self._cond:
+            for entry in entries:
+                job_id = entry["job_id"]
+                control = self.store.control(job_id)
+                if control is None or control[0] in ("completed", "failed", "stopped"):
+                    self.store.dequeue(job_id)
+                    continue
+                if entry["started_at"] is not None:
+                    # Interrupted mid-run: translate again from the first section
+                    self.store.update(job_id, {"partial_translated_sections": [],
+                                               "completed_sections": 0, "progress": 0})
+                self._push(job_id, entry["model_key"], entry["priority"], entry["seq"], entry["payload"])
+                self._stats["recovered"] += 1
+            recovered = self._stats["recovered"]
+        if recovered:
+            logger.info(f"✓ Re-queued {recovered} translation jobs from the previous run")
+
+    def _ensure_workers(self, model_key: str) -> None:
+        """Start the model's worker threads on first use (caller holds the condition)."""
+        workers = [w for w in self._workers.get(model_key, []) if w.is_alive()]
+        while len(workers) < self.workers_per_model:
+            worker = threading.Thread(target=self._run, args=(model_key,),
+                                      name=f"translate-{model_key}-{len(workers)}", daemon=True)
+            worker.start()
+            workers.append(worker)
+        self._workers[model_key] = workers
+
+    def _run(self, model_key: str) -> None:
+        while True:
+            with self._cond:
+                queue = self._queues[model_key]
+                while not queue:
+                    self._cond.wait()
+                _, _, job_id = heapq.heappop(queue)
+                payload = self._payloads.pop(job_id)
+                sections = payload["sections"]
+                self._running[job_id] = (model_key, len(sections), time.perf_counter())
+
+            started = time.perf_counter()
+            outcome = "errors"
+            translated = None
+            try:
+                control = self.store.control(job_id)
+                if control is None or control[0] in ("completed", "failed", "stopped"):
+                    logger.info(f"⏭️ Translation job {job_id} was stopped or deleted while queued")
+                    outcome = "cancelled_before_start"
+                    continue
+                self.store.mark_started(job_id)
+                translated = run_translation_job(job_id, sections, payload["source_lang"],
+                                                 payload["target_lang"], payload["model_used"], payload["mode"])
+                # None: the job failed and was already marked as such
+                if translated is not None:
+                    outcome = "completed"
+            except Exception as e:
+                logger.error(f"❌ Translation worker error for job {job_id}: {e}", exc_info=True)
+            finally:
+                self.store.dequeue(job_id)
+                elapsed = time.perf_counter() - started
+                with self._cond:
+                    self._running.pop(job_id, None)
+                    self._stats[outcome] += 1
+                    # Stopped, partly skipped or failed runs would skew the rate
+                    if outcome == "completed" and sections and translated == len(sections):
+                        per_section = elapsed / max(len(sections), 1)
+                        previous = self._seconds_per_section.get(model_key, TRANSLATION_SECONDS_PER_SECTION)
+                        self._seconds_per_section[model_key] = 0.7 * previous + 0.3 * per_section
+                    self._cond.notify_all()
+
+    def queue_info(self, job_id: str) -> Dict:
+        """
+        Queue position and ETA of a job.
+
+        Returns:
+            Dict: queue_state ("queued" / "running" / None once finished),
+                  queue_position (1 = next to start, 0 = running, None),
+                  eta_seconds (estimated seconds until finished, None if unknown)
+        """
+        now = time.perf_counter()
+        with self._cond:
+            running = self._running.get(job_id)
+            if running is not None:
+                model_key, total, started = running
+                rate = self._seconds_per_section.get(model_key, TRANSLATION_SECONDS_PER_SECTION)
+                return {"queue_state": "running", "queue_position": 0,
+                        "eta_seconds": round(max(total * rate - (now - started), 0.0), 1)}
+
+            payload = self._payloads.get(job_id)
+            if payload is None:
+                return {"queue_state": None, "queue_position": None, "eta_seconds": None}
+
+            model_key = payload["model_key"]
+            rate = self._seconds_per_section.get(model_key, TRANSLATION_SECONDS_PER_SECTION)
+            # Work still to do before a worker frees up for this job
+            backlog_s = sum(
+                max(total * rate - (now - started), 0.0)
+                for model, total, started in self._running.values() if model == model_key
+            )
+            ahead = []
+            for _, _, other_id in sorted(self._queues.get(model_key, [])):
+                if other_id == job_id:
+                    break
+                ahead.append((other_id, len(self._payloads[other_id]["sections"])))
+            job_sections = len(payload["sections"])
+
+        # Jobs stopped or deleted while queued are dropped by the worker
+        # without running, so they neither hold a place nor add to the wait
+        position = 1
+        for other_id, other_total in ahead:
+            control = self.store.control(other_id)
+            if control is None or control[0] in ("completed", "failed", "stopped"):
+                continue
+            backlog_s += other_total * rate
+            position += 1
+        eta = backlog_s / self.workers_per_model + job_sections * rate
+        return {"queue_state": "queued", "queue_position": position, "eta_seconds": round(eta, 1)}
+
+    def stats(self) -> Dict:
+        """Queue depth, running jobs and throughput estimate per model pair."""
+        with self._cond:
+            stats = dict(self._stats)
+            models = set(self._queues) | set(self._seconds_per_section)
+            stats["models"] = {
+                model: {
+                    "queued": len(self._queues.get(model, [])),
+                    "running": sum(1 for m, _, _ in self._running.values() if m == model),
+                    "seconds_per_section": round(
+                        self._seconds_per_section.get(model, TRANSLATION_SECONDS_PER_SECTION), 2),
+                }
+                for model in sorted(models)
+            }
+        stats["workers_per_model"] = self.workers_per_model
+        return stats
+
+
+# Global scheduler instance (lazy loaded)
+_scheduler_instance = None
+_scheduler_lock = threading.Lock()
+
+
+def get_translation_scheduler() -> TranslationScheduler:
+    """
+    Get or create the global translation scheduler.
+
+    Returns:
+        TranslationScheduler: Shared scheduler instance
+    """
+    global _scheduler_instance
+
+    if _scheduler_instance is None:
+        with _scheduler_lock:
+            if _scheduler_instance is None:
+                _scheduler_instance = TranslationScheduler()
+
+    return _scheduler_instance
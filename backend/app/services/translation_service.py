@@ -7,11 +7,13 @@ Supports:
   - raw text translation         →  full text at once
   - glossary lookup
   - model info / metrics
-  - job persistence (JSON on disk)
+  - job persistence (SQLite job store, translation_job_store)
   - post-translation corrections (glossary + grammar)
+  - sentence-level translation memory (translation_memory_service)
 """
 
 import csv
+import hashlib
 import json
 import logging
 import math
@@ -19,6 +21,7 @@ import os
 import re
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 from threading import Lock
@@ -29,9 +32,18 @@ import torch
 # Import correction service for post-processing
 from app.services.translation_correction_service import (
     apply_comprehensive_correction,
-    batch_correct_sections,
+    correct_section,
+    empty_correction_stats,
     get_correction_statistics,
 )
+from app.services.glossary_matcher import get_glossary_matcher
+from app.services.translation_job_store import get_job_store
+from app.services.translation_memory_service import (
+    TRANSLATION_MEMORY_ENABLED,
+    TRANSLATION_MEMORY_FUZZY,
+    get_translation_memory,
+    normalize_source,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +58,26 @@ GLOSSARY_PATH    = ROOT_DIR / "legal_glossary.csv"
 JOBS_DIR         = Path(__file__).resolve().parent.parent.parent / "translation_jobs"
 JOBS_DIR.mkdir(exist_ok=True)
 
+# Sentences per mBART generate() call (length-sorted, dynamically padded)
+TRANSLATION_BATCH_SIZE = int(os.getenv("TRANSLATION_BATCH_SIZE", "8"))
+
+# Decoder positions whose vocabulary logits are materialised at once when
+# scoring confidence (each is a 250k-float row)
+CONFIDENCE_SCORING_CHUNK = int(os.getenv("TRANSLATION_CONFIDENCE_CHUNK", "256"))
+
+# How confidence is computed; part of the model version like the generation
+# settings, so remembered confidences are never mixed across methods
+CONFIDENCE_METHOD = "forced-decoding-mean-logprob"
+
+# Beam-search settings; part of the model version, so changing them
+# invalidates the translation memory
+GENERATION_KWARGS = {
+    "num_beams": 5,
+    "early_stopping": True,
+    "no_repeat_ngram_size": 3,     # Prevent 3-gram repetition
+    "repetition_penalty": 1.2,     # Penalize repeated tokens
+}
+
 # ---------------------------------------------------------------------------
 # Singleton model holder
 # ---------------------------------------------------------------------------
@@ -118,7 +150,8 @@ def load_models(block: bool = True) -> Dict[str, Any]:
                     str(model_dir), low_cpu_mem_usage=True
                 ).to(target_device)
                 mdl.eval()
-                loaded[key] = {"model": mdl, "tokenizer": tok, "tgt_lang": tgt_lang, "on_device": str(target_device)}
+                loaded[key] = {"model": mdl, "tokenizer": tok, "tgt_lang": tgt_lang, "on_device": str(target_device),
+                               "version": _model_version(model_dir)}
                 logger.info("✓  Loaded %s model on %s", key, target_device)
             else:
                 logger.warning("Model dir not found: %s", model_dir)
@@ -127,6 +160,20 @@ def load_models(block: bool = True) -> Dict[str, Any]:
     return _models
 
 
+def _model_version(model_dir: Path) -> str:
+    """Fingerprint a checkpoint: its files' names, sizes and mtimes plus the generation settings."""
+    digest = hashlib.sha256()
+    for path in sorted(model_dir.iterdir()):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\x00".encode("utf-8"))
+    digest.update(json.dumps(GENERATION_KWARGS, sort_keys=True).encode("utf-8"))
+    digest.update(CONFIDENCE_METHOD.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
 def _ensure_model_on_gpu(model_key: str) -> None:
     """Ensure the requested model is on GPU, swapping if necessary for low VRAM."""
     global _models
@@ -296,13 +343,14 @@ def _split_into_sections(text: str) -> List[Dict]:
 
     sections: List[Dict] = []
     glossary_en = {t["en"].lower(): t["en"] for t in load_glossary()}
+    matcher = get_glossary_matcher()
     total_sections = len(paragraphs)
 
     for idx, para in enumerate(paragraphs):
         # Use intelligent legal document section classification
         sec_type = _classify_legal_section(para, idx, total_sections)
         # Find legal keywords present
-        kws = [glossary_en[k] for k in glossary_en if k in para.lower()][:8]
+        kws = [glossary_en[k] for k in matcher.find_terms(para, terms=glossary_en)][:8]
         sections.append({
             "id": f"sec-{idx + 1}",
             "type": sec_type,
@@ -470,70 +518,211 @@ def _format_list_items(text: str) -> str:
 def _translate_text(text: str, model_key: str, max_length: int = 512) -> Tuple[str, float]:
     """Translate text sentence-by-sentence for better quality, then merge.
     Returns (translated, avg_confidence)."""
+    return _translate_texts([text], model_key, max_length)[0]
+
+
+def _translate_texts(
+    texts: List[str],
+    model_key: str,
+    max_length: int = 512,
+    batch_size: Optional[int] = None,
+    use_memory: bool = True,
+    suggestions: Optional[List[List[Dict]]] = None,
+) -> List[Tuple[str, float]]:
+    """Translate several texts sentence-by-sentence, sharing generate() batches.
+
+    The sentences of all texts are pooled, sorted by token length and
+    translated in batches of `batch_size` with dynamic padding; each text is
+    then merged from its own sentences exactly as if translated alone.
+
+    With use_memory, sentences found in the translation memory are served
+    from it and only the rest are generated (and then stored). If a
+    `suggestions` list is passed and fuzzy mode is on, it is filled with one
+    list per text of near-match suggestions for the sentences that missed.
+    Returns one (translated, avg_confidence) per text.
+    """
+    if suggestions is not None:
+        suggestions[:] = [[] for _ in texts]
+
     models = load_models()
     entry = models.get(model_key)
     if entry is None:
-        return f"[mock-{model_key}] {text}", 0.0
+        return [(f"[mock-{model_key}] {text}", 0.0) for text in texts]
+
+    # Per text: one slot per sentence, filled now (kept as-is) or after generation
+    text_parts: List[List[Optional[Tuple[str, float]]]] = []
+    pending: List[Tuple[int, int, str]] = []  # (text index, slot, sentence)
+
+    for t_idx, text in enumerate(texts):
+        parts: List[Optional[Tuple[str, float]]] = []
+        for sent in _split_sentences(text):
+            sent = sent.strip()
+            if not sent:
+                continue
+            # Very short fragments (< 3 chars) — keep as-is (numbers, punctuation)
+            if len(sent) < 3 and not any(c.isalpha() for c in sent):
+                parts.append((sent, 1.0))
+                continue
+            pending.append((t_idx, len(parts), sent))
+            parts.append(None)
+        text_parts.append(parts)
+
+    use_memory = use_memory and TRANSLATION_MEMORY_ENABLED and bool(pending)
+    if use_memory:
+        version = f"{entry.get('version', 'unversioned')}:{max_length}"
+        try:
+            memory = get_translation_memory()
+            remembered = memory.get_many(model_key, version, [sent for _, _, sent in pending])
+        except Exception as e:
+            logger.warning("Translation memory lookup failed: %s", e)
+            remembered, use_memory = {}, False
+
+        misses = []
+        for t_idx, slot, sent in pending:
+            hit = remembered.get(normalize_source(sent))
+            if hit is not None:
+                text_parts[t_idx][slot] = hit
+            else:
+                misses.append((t_idx, slot, sent))
+        if remembered:
+            logger.info("Translation memory: %d/%d sentences reused", len(pending) - len(misses), len(pending))
+
+        if use_memory and suggestions is not None and TRANSLATION_MEMORY_FUZZY:
+            try:
+                for t_idx, _, sent in misses:
+                    matches = memory.suggest(model_key, version, sent)
+                    if matches:
+                        suggestions[t_idx].append({"sentence": sent, "matches": matches})
+            except Exception as e:
+                logger.warning("Translation memory suggestions failed: %s", e)
+        pending = misses
+
+    if pending:
+        # Ensure model is on GPU (will swap if needed for low VRAM)
+        _ensure_model_on_gpu(model_key)
+
+        generated = _generate_batched(entry, [sent for _, _, sent in pending], max_length,
+                                      batch_size or TRANSLATION_BATCH_SIZE)
+        for (t_idx, slot, _), result in zip(pending, generated):
+            text_parts[t_idx][slot] = result
+
+        if use_memory:
+            try:
+                memory.put_many(model_key, version,
+                                [(sent, trans, conf) for (_, _, sent), (trans, conf) in zip(pending, generated)])
+            except Exception as e:
+                logger.warning("Translation memory store failed: %s", e)
+
+    results = []
+    for parts in text_parts:
+        if not parts:
+            results.append(("", 0.0))
+            continue
+        merged = " ".join(trans for trans, _ in parts)
 
-    # Ensure model is on GPU (will swap if needed for low VRAM)
-    _ensure_model_on_gpu(model_key)
-    
-    device = torch.device(entry.get("on_device", models.get("device", "cpu")))
-    tok = entry["tokenizer"]
-    mdl = entry["model"]
-    tgt_lang = entry["tgt_lang"]
+        # Apply list formatting for items like (a), (b), 1), 2), etc.
+        merged = _format_list_items(merged)
 
-    # Split into sentences for one-at-a-time translation
-    sentences = _split_sentences(text)
-    if not sentences:
-        return "", 0.0
+        avg_conf = sum(conf for _, conf in parts) / len(parts)
+        results.append((merged, round(avg_conf, 4)))
+    return results
 
-    translated_parts = []
-    confidences = []
 
-    for sent in sentences:
-        sent = sent.strip()
-        if not sent:
-            continue
-        # Very short fragments (< 3 chars) — keep as-is (numbers, punctuation)
-        if len(sent) < 3 and not any(c.isalpha() for c in sent):
-            translated_parts.append(sent)
-            confidences.append(1.0)
-            continue
+def _generate_batched(entry: Dict[str, Any], sentences: List[str], max_length: int,
+                      batch_size: int) -> List[Tuple[str, float]]:
+    """Beam-search translate sentences in length-sorted, dynamically padded batches.
 
-        inputs = tok(sent, return_tensors="pt", max_length=max_length, truncation=True, padding=True).to(device)
+    The encoder runs once per batch; its states feed both beam search and
+    _sequence_confidences, a forced decoding pass over the generated tokens
+    that scores each sentence instead of keeping per-step vocabulary scores
+    during generation.
+    Returns (translation, confidence) per sentence, in input order.
+    """
+    from transformers.modeling_outputs import BaseModelOutput
+
+    if not sentences:
+        return []
+
+    device = torch.device(entry.get("on_device", _models.get("device", "cpu")))
+    tok = entry["tokenizer"]
+    mdl = entry["model"]
+    forced_bos = tok.lang_code_to_id[entry["tgt_lang"]]
+
+    lengths = [len(ids) for ids in tok(sentences, max_length=max_length, truncation=True)["input_ids"]]
+    order = sorted(range(len(sentences)), key=lambda i: lengths[i])
+    results: List[Tuple[str, float]] = [None] * len(sentences)
+
+    for start in range(0, len(order), batch_size):
+        batch_idx = order[start:start + batch_size]
+        inputs = tok(
+            [sentences[i] for i in batch_idx],
+            return_tensors="pt", max_length=max_length, truncation=True, padding=True,
+        ).to(device)
         with torch.no_grad():
-            out = mdl.generate(
+            encoder_hidden = mdl.get_encoder()(
+                input_ids=inputs["input_ids"], attention_mask=inputs["attention_mask"],
+            ).last_hidden_state
+            # generate() expands encoder_outputs for the beams in place, so it
+            # gets its own wrapper around the shared hidden states
+            sequences = mdl.generate(
                 **inputs,
-                forced_bos_token_id=tok.lang_code_to_id[tgt_lang],
+                encoder_outputs=BaseModelOutput(last_hidden_state=encoder_hidden),
+                forced_bos_token_id=forced_bos,
                 max_length=max_length,
-                num_beams=5,
-                early_stopping=True,
-                output_scores=True,
-                return_dict_in_generate=True,
-                no_repeat_ngram_size=3,      # Prevent 3-gram repetition
-                repetition_penalty=1.2,       # Penalize repeated tokens
+                **GENERATION_KWARGS,
             )
-        trans = tok.batch_decode(out.sequences, skip_special_tokens=True)[0]
-        
-        # Post-process: Remove repetition loops
-        trans = _remove_repetition_loops(trans)
-        
-        translated_parts.append(trans)
+            confs = _sequence_confidences(
+                mdl, inputs["attention_mask"], encoder_hidden, sequences, tok.pad_token_id
+            )
+        decoded = tok.batch_decode(sequences, skip_special_tokens=True)
 
-        if out.scores:
-            confs = [torch.softmax(s, dim=-1).max().item() for s in out.scores]
-            confidences.append(sum(confs) / len(confs))
-        else:
-            confidences.append(0.85)
+        for row, i in enumerate(batch_idx):
+            # Post-process: Remove repetition loops
+            results[i] = (_remove_repetition_loops(decoded[row]), confs[row])
+
+    return results
 
-    merged = " ".join(translated_parts)
-    
-    # Apply list formatting for items like (a), (b), 1), 2), etc.
-    merged = _format_list_items(merged)
-    
-    avg_conf = sum(confidences) / max(len(confidences), 1)
-    return merged, round(avg_conf, 4)
+
+def _sequence_confidences(mdl, attention_mask, encoder_hidden, sequences, pad_token_id: int) -> List[float]:
+    """Geometric-mean probability the model assigns to each generated sequence's tokens.
+
+    generate(output_scores=True) keeps a (batch * beams, vocab) tensor per
+    decoding step. Here the chosen sequences are re-scored in one forced
+    decoding pass instead, reusing the encoder states computed for generate():
+    the decoder hidden states are small, and they are projected onto the
+    vocabulary CONFIDENCE_SCORING_CHUNK tokens at a time.
+    The forced target-language token and padding are not scored.
+    """
+    decoder_input_ids = sequences[:, :-1]
+    targets = sequences[:, 1:]
+    mask = targets.ne(pad_token_id)
+    mask[:, 0] = False
+
+    hidden = getattr(mdl, mdl.base_model_prefix)(
+        attention_mask=attention_mask,
+        encoder_outputs=(encoder_hidden,),
+        decoder_input_ids=decoder_input_ids,
+    ).last_hidden_state
+    lm_head = mdl.get_output_embeddings()
+    logits_bias = getattr(mdl, "final_logits_bias", None)
+
+    token_hidden = hidden[mask]
+    token_ids = targets[mask]
+    token_logprobs = torch.empty(token_ids.shape, dtype=torch.float32, device=hidden.device)
+    for start in range(0, token_ids.numel(), CONFIDENCE_SCORING_CHUNK):
+        end = start + CONFIDENCE_SCORING_CHUNK
+        logits = lm_head(token_hidden[start:end])
+        if logits_bias is not None:
+            logits = logits + logits_bias
+        logits = logits.float()
+        token_logprobs[start:end] = (
+            logits.gather(-1, token_ids[start:end].unsqueeze(-1)).squeeze(-1) - logits.logsumexp(dim=-1)
+        )
+
+    rows = mask.nonzero(as_tuple=True)[0]
+    sums = torch.zeros(sequences.shape[0], dtype=torch.float32, device=hidden.device).index_add_(0, rows, token_logprobs)
+    counts = mask.sum(dim=1).clamp(min=1)
+    return (sums / counts).exp().tolist()
 
 
 def _split_sentences(text: str) -> List[str]:
@@ -564,6 +753,59 @@ def _model_key(source: str, target: str) -> str:
 # Public API – translate document / text
 # ---------------------------------------------------------------------------
 
+class _CorrectionStage:
+    """Pipeline stage: corrects translated sections on its own worker thread.
+
+    Sections are corrected in submission order while the caller goes on
+    generating the next ones, and each is published to the job's progress
+    as soon as it is corrected. finish() returns the corrected sections and
+    the same aggregate statistics batch_correct_sections would produce.
+    """
+
+    def __init__(self, job_id: str, source_sections: List[Dict], target_lang: str, progress_callback=None):
+        self.job_id = job_id
+        self.source_sections = source_sections
+        self.target_lang = target_lang
+        self.progress_callback = progress_callback
+        self.stats = empty_correction_stats()
+        self._futures: List[Future] = []
+        # One worker: sections are corrected and published in order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="correction")
+
+    def submit(self, index: int, section: Dict) -> None:
+        self._futures.append(self._executor.submit(self._correct, index, section))
+
+    def _correct(self, index: int, section: Dict) -> Dict:
+        source_text = ""
+        if index < len(self.source_sections):
+            source_text = self.source_sections[index].get("content", "")
+        try:
+            corrected = correct_section(section, source_text, self.target_lang, self.stats)
+        except Exception as e:
+            logger.exception("Post-processing correction failed for section %d, keeping raw translation: %s", index, e)
+            corrected = section
+            self.stats["error"] = str(e)
+
+        # Persist progress with the corrected section
+        total = len(self.source_sections)
+        _update_job_progress(self.job_id, index + 1, total, corrected)
+        if self.progress_callback:
+            self.progress_callback(index + 1, total)
+        return corrected
+
+    def finish(self) -> Tuple[List[Dict], Dict]:
+        """Wait for outstanding corrections; returns (corrected_sections, correction_stats)."""
+        try:
+            corrected = [future.result() for future in self._futures]
+        finally:
+            self._executor.shutdown(wait=True)
+        stats = self.stats
+        stats["total_sections"] = len(corrected)
+        # Remove duplicate terms
+        stats["all_terms_corrected"] = list(set(stats["all_terms_corrected"]))
+        return corrected, stats
+
+
 def translate_sections(
     sections: List[Dict],
     source_lang: str,
@@ -573,92 +815,128 @@ def translate_sections(
 ) -> Tuple[List[Dict], float, Dict]:
     """
     Translate a list of sections with post-processing corrections.
+
+    Corrections (Sinhala ZWJ normalization, glossary, grammar) run as a
+    pipeline stage on a separate worker, overlapping with generation of the
+    following sections; progress is published with corrected sections.
     Returns (translated_sections, overall_confidence, correction_stats).
     """
     key = _model_key(source_lang, target_lang)
-    translated: List[Dict] = []
     total_conf = 0.0
+    correction_stage = _CorrectionStage(job_id, sections, target_lang, progress_callback)
 
     glossary_map = {}
     for t in load_glossary():
         glossary_map[t["en"].lower()] = t.get("si" if target_lang == "si" else "ta", "")
+    # Only terms with a translation in the target language are tagged
+    glossary_map = {en_term: loc_term for en_term, loc_term in glossary_map.items() if loc_term}
+    matcher = get_glossary_matcher()
 
-    for i, sec in enumerate(sections):
-        # Check if job was cancelled/stopped
-        job_state = _load_job(job_id)
-        if job_state and job_state.get("status") in ("failed", "stopped"):
-            logger.info("Job %s was stopped, halting at section %d/%d", job_id, i, len(sections))
-            break
-
-        # Check if this section should be skipped
-        skip_sections = set(job_state.get("skip_sections", [])) if job_state else set()
-        if i in skip_sections:
-            logger.info("Skipping section %d (marked by user)", i)
-            translated.append({
+    # Consecutive sections are translated together so their sentences share
+    # generate() batches; progress is still reported section by section.
+    group: List[Tuple[int, Dict]] = []
+    group_sentences = 0
+
+    def skipped_section(sec: Dict) -> Dict:
+        return {
+            "id": sec["id"],
+            "type": sec.get("type", "paragraph"),
+            "translated_content": "[Skipped]",
+            "confidence": 0,
+            "keywords": [],
+            "skipped": True,
+        }
+
+    def flush_group() -> bool:
+        """Translate the pending group; returns False if the job was stopped."""
+        nonlocal total_conf, group_sentences
+        if not group:
+            return True
+
+        # Stop/skip may have been requested while the group was filling up
+        control = get_job_store().control(job_id)
+        if control and control[0] in ("failed", "stopped"):
+            logger.info("Job %s was stopped, halting at section %d/%d", job_id, group[0][0], len(sections))
+            group.clear()
+            group_sentences = 0
+            return False
+        skip_sections = set(control[1]) if control else set()
+
+        members = [(i, sec) for i, sec in group if i not in skip_sections]
+        group_suggestions: List[List[Dict]] = []
+        outputs = []
+        if members:
+            outputs = _translate_texts([sec["content"] for _, sec in members], key, suggestions=group_suggestions)
+        translated = {i: (output, tm) for (i, _), output, tm in zip(members, outputs, group_suggestions)}
+
+        # Submitted in section order, skipped members included
+        for i, sec in group:
+            if i not in translated:
+                logger.info("Skipping section %d (marked by user)", i)
+                correction_stage.submit(i, skipped_section(sec))
+                continue
+            (trans_text, conf), tm_suggestions = translated[i]
+            text = sec["content"]
+
+            # Highlight glossary terms found in translation
+            found_kws = [glossary_map[en_term] for en_term in matcher.find_terms(text, terms=glossary_map)]
+
+            section = {
                 "id": sec["id"],
                 "type": sec.get("type", "paragraph"),
-                "translated_content": "[Skipped]",
-                "confidence": 0,
-                "keywords": [],
-                "skipped": True,
-            })
-            _update_job_progress(job_id, i + 1, len(sections), translated[-1])
-            if progress_callback:
-                progress_callback(i + 1, len(sections))
-            continue
+                "translated_content": trans_text,
+                "confidence": conf,
+                "keywords": found_kws[:8],
+            }
+            if tm_suggestions:
+                # Fuzzy translation-memory matches for sentences the model translated
+                section["tm_suggestions"] = tm_suggestions
+            total_conf += conf
+
+            # Corrected (and published to progress) on the correction worker
+            correction_stage.submit(i, section)
+        group.clear()
+        group_sentences = 0
+        return True
 
-        text = sec["content"]
-        trans_text, conf = _translate_text(text, key)
+    try:
+        for i, sec in enumerate(sections):
+            # Check if job was cancelled/stopped
+            control = get_job_store().control(job_id)
+            if control and control[0] in ("failed", "stopped"):
+                logger.info("Job %s was stopped, halting at section %d/%d", job_id, i - len(group), len(sections))
+                group.clear()
+                break
 
-        # Highlight glossary terms found in translation
-        found_kws: List[str] = []
-        for en_term, loc_term in glossary_map.items():
-            if en_term in text.lower() and loc_term:
-                found_kws.append(loc_term)
+            # Check if this section should be skipped
+            skip_sections = set(control[1]) if control else set()
+            if i in skip_sections:
+                if not flush_group():
+                    break
+                logger.info("Skipping section %d (marked by user)", i)
+                correction_stage.submit(i, skipped_section(sec))
+                continue
 
-        translated.append({
-            "id": sec["id"],
-            "type": sec.get("type", "paragraph"),
-            "translated_content": trans_text,
-            "confidence": conf,
-            "keywords": found_kws[:8],
-        })
-        total_conf += conf
+            group.append((i, sec))
+            group_sentences += len(_split_sentences(sec["content"]))
+            if group_sentences >= TRANSLATION_BATCH_SIZE and not flush_group():
+                break
 
-        # Persist progress with the translated section
-        _update_job_progress(job_id, i + 1, len(sections), translated[-1])
-        if progress_callback:
-            progress_callback(i + 1, len(sections))
+        flush_group()
+    finally:
+        # === POST-PROCESSING: wait for the correction stage to drain ===
+        corrected_sections, correction_stats = correction_stage.finish()
 
     overall = round(total_conf / max(len(sections), 1), 4)
-    
-    # === POST-PROCESSING: Apply glossary + grammar corrections ===
-    logger.info("Applying post-translation corrections for %s...", target_lang.upper())
-    try:
-        corrected_sections, correction_stats = batch_correct_sections(
-            translated, sections, target_lang
-        )
-        
-        logger.info(
-            "✓ Corrections applied: %d total (%d glossary, %d grammar) across %d/%d sections",
-            correction_stats["total_corrections"],
-            correction_stats["glossary_corrections"],
-            correction_stats["grammar_corrections"],
-            correction_stats["sections_corrected"],
-            correction_stats["total_sections"]
-        )
-    except Exception as e:
-        logger.exception("Post-processing corrections failed, returning raw translations: %s", e)
-        corrected_sections = translated
-        correction_stats = {
-            "total_sections": len(translated),
-            "sections_corrected": 0,
-            "glossary_corrections": 0,
-            "grammar_corrections": 0,
-            "total_corrections": 0,
-            "all_terms_corrected": [],
-            "error": str(e),
-        }
+    logger.info(
+        "✓ Corrections applied (%s): %d total (%d glossary, %d grammar) across %d/%d sections",
+        target_lang.upper(),
+        correction_stats["total_corrections"],
+        correction_stats["glossary_corrections"],
+        correction_stats["grammar_corrections"],
+        correction_stats["sections_corrected"],
+        correction_stats["total_sections"]
+    )
     
     return corrected_sections, overall, correction_stats
 
@@ -673,11 +951,11 @@ def translate_raw_text(text: str, source_lang: str, target_lang: str) -> Tuple[s
 
     # Chunk long text at ~400-char boundaries (sentence-aware)
     chunks = _chunk_text(text, max_chars=400)
-    parts, confs = [], []
-    for ch in chunks:
-        t, c = _translate_text(ch, key)
-        parts.append(t)
-        confs.append(c)
+    chunk_suggestions: List[List[Dict]] = []
+    outputs = _translate_texts(chunks, key, suggestions=chunk_suggestions)
+    tm_suggestions = [s for chunk in chunk_suggestions for s in chunk]
+    parts = [t for t, _ in outputs]
+    confs = [c for _, c in outputs]
     full_trans = " ".join(parts)
     avg_conf = round(sum(confs) / max(len(confs), 1), 4)
     
@@ -710,6 +988,8 @@ def translate_raw_text(text: str, source_lang: str, target_lang: str) -> Tuple[s
             "terms_corrected": [],
             "error": str(e),
         }
+    if tm_suggestions:
+        correction_info["tm_suggestions"] = tm_suggestions
     
     return corrected_text, avg_conf, correction_info
 
@@ -761,16 +1041,7 @@ def create_job(filename: str, source_lang: str, target_lang: str, mode: str = "d
 
 
 def _update_job_progress(job_id: str, completed: int, total: int, translated_section: Dict = None):
-    job = _load_job(job_id)
-    if job:
-        job["completed_sections"] = completed
-        job["total_sections"] = total
-        job["progress"] = round(completed / max(total, 1) * 100)
-        if translated_section is not None:
-            partial = job.get("partial_translated_sections", [])
-            partial.append(translated_section)
-            job["partial_translated_sections"] = partial
-        _save_job(job_id, job)
+    get_job_store().update_progress(job_id, completed, total, translated_section)
 
 
 def finalize_job(
@@ -783,10 +1054,6 @@ def finalize_job(
     raw_translated: str = "",
     correction_stats: Optional[Dict] = None,
 ):
-    job = _load_job(job_id)
-    if not job:
-        return
-
     word_count = sum(len(s.get("content", "").split()) for s in source_sections)
     term_count = sum(len(s.get("keywords", [])) for s in source_sections)
     glossary_terms_trans = sum(len(s.get("keywords", [])) for s in translated_sections)
@@ -797,7 +1064,7 @@ def finalize_job(
     glossary_corrections = correction_stats.get("glossary_corrections", 0)
     grammar_corrections = correction_stats.get("grammar_corrections", 0)
 
-    job.update({
+    get_job_store().update(job_id, {
         "status": "completed",
         "progress": 100,
         "source_sections": source_sections,
@@ -820,59 +1087,96 @@ def finalize_job(
             "correction_rate": round(total_corrections / max(word_count, 1) * 100, 2),
         },
     })
-    _save_job(job_id, job)
 
 
 def fail_job(job_id: str, error: str):
-    job = _load_job(job_id)
-    if job:
-        job["status"] = "failed"
-        job["error"] = error
-        _save_job(job_id, job)
+    get_job_store().update(job_id, {"status": "failed", "error": error})
+
+
+def run_translation_job(
+    job_id: str,
+    sections: List[Dict],
+    source_lang: str,
+    target_lang: str,
+    model_used: str,
+    mode: str = "document",
+):
+    """Translate a created job's sections and finalize it (or mark it failed).
+    Text-mode jobs also store the joined translation as raw_translated_text.
+
+    Returns the number of sections the model translated: fewer than
+    len(sections) when the job was stopped or had sections skipped (a stopped
+    job is still finalized as completed with what it has); None if it failed."""
+    t0 = time.time()
+    try:
+        # This WILL block until models are ready (runs on a scheduler worker)
+        translated, overall_conf, correction_stats = translate_sections(
+            sections, source_lang, target_lang, job_id
+        )
+        raw_translated = " ".join(s["translated_content"] for s in translated) if mode == "text" else ""
+        elapsed = time.time() - t0
+        finalize_job(
+            job_id,
+            source_sections=sections,
+            translated_sections=translated,
+            overall_confidence=overall_conf,
+            processing_time=elapsed,
+            model_used=model_used,
+            raw_translated=raw_translated,
+            correction_stats=correction_stats,
+        )
+        logger.info("Translation job %s completed in %.1fs with %d corrections",
+                    job_id, elapsed, correction_stats.get("total_corrections", 0))
+        return sum(1 for s in translated if not s.get("skipped"))
+    except Exception as exc:
+        logger.exception("Translation job %s failed", job_id)
+        fail_job(job_id, str(exc))
+        return None
+
+
+def stop_job(job_id: str) -> Optional[str]:
+    """Mark a running job as stopped by the user.
+    Returns the job's status before the call, or None if the job does not exist;
+    finished jobs (completed / failed / stopped) are left unchanged."""
+    store = get_job_store()
+    control = store.control(job_id)
+    if control is None:
+        return None
+    if control[0] not in ("completed", "failed", "stopped"):
+        # Don't set error - this was intentional stop, not a failure
+        store.update(job_id, {"status": "stopped"})
+    return control[0]
+
+
+def skip_job_section(job_id: str, section_index: int) -> Optional[List[int]]:
+    """Mark a section to be skipped; returns the skip list (None if job not found)."""
+    return get_job_store().add_skip_section(job_id, section_index)
+
+
+def delete_job(job_id: str) -> bool:
+    return get_job_store().delete(job_id)
 
 
 def get_job(job_id: str) -> Optional[Dict]:
     return _load_job(job_id)
 
 
-def get_job_progress(job_id: str) -> Dict:
-    job = _load_job(job_id)
-    if not job:
+def get_job_progress(job_id: str, since: int = 0) -> Dict:
+    """Progress of a job; only partial sections from position `since` on are included
+    (the response's cursor is the next `since`)."""
+    progress = get_job_store().load_progress(job_id, since)
+    if not progress:
         return {"error": "Job not found"}
-    return {
-        "job_id": job_id,
-        "status": job["status"],
-        "progress": job.get("progress", 0),
-        "completed_sections": job.get("completed_sections", 0),
-        "total_sections": job.get("total_sections", 0),
-        "error": job.get("error"),
-        "partial_translated_sections": job.get("partial_translated_sections", []),
-    }
+    return {"job_id": job_id, **progress}
+
+
+def get_job_updated_at(job_id: str) -> Optional[float]:
+    """Time of the job's last change (None if not found), for cheap change polling."""
+    return get_job_store().updated_at(job_id)
 
 
 def list_jobs(limit: int = 20) -> List[Dict]:
-    jobs = []
-    if not JOBS_DIR.exists():
-        return jobs
-    files = sorted(JOBS_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
-    for fp in files[:limit]:
-        try:
-            with open(fp, "r", encoding="utf-8") as f:
-                j = json.load(f)
-            jobs.append({
-                "job_id": j["job_id"],
-                "filename": j.get("filename", ""),
-                "source_language": j.get("source_language", ""),
-                "target_language": j.get("target_language", ""),
-                "status": j.get("status", ""),
-                "progress": j.get("progress", 0),
-                "created_at": j.get("created_at", ""),
-                "processing_time": j.get("processing_time", 0),
-                "mode": j.get("mode", "document"),
-            })
-        except Exception:
-            continue
-    return jobs
+    return get_job_store().list_recent(limit)
 
 
 # ---------------------------------------------------------------------------
@@ -948,17 +1252,11 @@ def export_translation(job_id: str, fmt: str = "txt") -> Tuple[bytes, str]:
 # ---------------------------------------------------------------------------
 
 def _save_job(job_id: str, data: Dict):
-    fp = JOBS_DIR / f"{job_id}.json"
-    with open(fp, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    get_job_store().save({**data, "job_id": job_id})
 
 
 def _load_job(job_id: str) -> Optional[Dict]:
-    fp = JOBS_DIR / f"{job_id}.json"
-    if not fp.exists():
-        return None
-    with open(fp, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_job_store().load(job_id)
 
 
 def _now_iso() -> str:
@@ -1,10 +1,12 @@
 """
 FastAPI routes for legal risk classification API.
 """
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query
+from fastapi.responses import JSONResponse, HTMLResponse, StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
-from typing import Optional
+from typing import Callable, Dict, Iterator, Optional
+import json
 import logging
 import sys
 import re
@@ -15,6 +17,7 @@ backend_path = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(backend_path))
 
 from fastapi_app.services.classifier import classifier
+from fastapi_app.services.executor import POOL_INFERENCE, POOL_PDF, acquire_slot, run_blocking
 from app.services.pdf_service import pdf_bytes_to_text
 
 logger = logging.getLogger(__name__)
@@ -504,6 +507,59 @@ async def health_check():
         )
 
 
+async def _read_upload_text(file: UploadFile) -> str:
+    """
+    Read an uploaded .txt or .pdf file as plain text.
+    
+    For PDFs, extracts text automatically with OCR fallback if needed and
+    strips the formatting markers.
+    """
+    # Validate file type
+    if not (file.filename.endswith('.txt') or file.filename.endswith('.pdf')):
+        raise HTTPException(
+            status_code=400,
+            detail="Only .txt and .pdf files are supported"
+        )
+    
+    # Read file content
+    content = await file.read()
+    
+    # Extract text based on file type
+    if file.filename.endswith('.pdf'):
+        logger.info(f"Extracting text from PDF: {file.filename}")
+        
+        # Use same PDF extraction as translation section (which works well)
+        ok, raw_text = await run_blocking(POOL_PDF, pdf_bytes_to_text, content)
+        
+        if not ok:
+            raise HTTPException(
+                status_code=500,
+                detail=f"PDF extraction failed: {raw_text}"
+            )
+        
+        # Strip formatting markers (same as translation section does)
+        text = re.sub(r"<<F:[^>]+>>", "", raw_text)
+        text = re.sub(r"<</F>>", "", text)
+        text = re.sub(r"<<BOLD>>|<</BOLD>>", "", text)
+        
+        logger.info(f"Successfully extracted {len(text)} characters from PDF")
+    else:
+        # TXT file
+        try:
+            text = content.decode('utf-8')
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=400,
+                detail="File encoding not supported. Please use UTF-8 encoded text files."
+            )
+    
+    if not text.strip():
+        raise HTTPException(status_code=400, detail="File is empty or text extraction failed")
+    
+    logger.info(f"Processing file: {file.filename}, {len(text)} characters")
+    return text
+
+
 @router.post("/classify/text")
 async def classify_text(input_data: TextInput):
     """
@@ -520,10 +576,12 @@ async def classify_text(input_data: TextInput):
         logger.info(f"Received text input: {len(input_data.text)} characters")
         
         # Run analysis pipeline
-        results = classifier.analyze_text(input_data.text)
+        results = await run_blocking(POOL_INFERENCE, classifier.analyze_text, input_data.text)
         
         return JSONResponse(content=results)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in text classification: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -538,52 +596,10 @@ async def classify_file(file: UploadFile = File(...)):
     For PDFs, extracts text automatically with OCR fallback if needed.
     """
     try:
-        # Validate file type
-        if not (file.filename.endswith('.txt') or file.filename.endswith('.pdf')):
-            raise HTTPException(
-                status_code=400,
-                detail="Only .txt and .pdf files are supported"
-            )
-        
-        # Read file content
-        content = await file.read()
-        
-        # Extract text based on file type
-        if file.filename.endswith('.pdf'):
-            logger.info(f"Extracting text from PDF: {file.filename}")
-            
-            # Use same PDF extraction as translation section (which works well)
-            ok, raw_text = pdf_bytes_to_text(content)
-            
-            if not ok:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"PDF extraction failed: {raw_text}"
-                )
-            
-            # Strip formatting markers (same as translation section does)
-            text = re.sub(r"<<F:[^>]+>>", "", raw_text)
-            text = re.sub(r"<</F>>", "", text)
-            text = re.sub(r"<<BOLD>>|<</BOLD>>", "", text)
-            
-            logger.info(f"Successfully extracted {len(text)} characters from PDF")
-        else:
-            # TXT file
-            try:
-                text = content.decode('utf-8')
-            except UnicodeDecodeError:
-                raise HTTPException(
-                    status_code=400,
-                    detail="File encoding not supported. Please use UTF-8 encoded text files."
-                )
-        
-        if not text.strip():
-            raise HTTPException(status_code=400, detail="File is empty or text extraction failed")
-        
-        logger.info(f"Processing file: {file.filename}, {len(text)} characters")
+        text = await _read_upload_text(file)
         
         # Run analysis pipeline
-        results = classifier.analyze_text(text)
+        results = await run_blocking(POOL_INFERENCE, classifier.analyze_text, text)
         
         # Add the extracted text to the response for display
         results["document_text"] = text
@@ -597,6 +613,103 @@ async def classify_file(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# STREAMING CLASSIFICATION
+# ═══════════════════════════════════════════════════════════════════════════
+#
+# Streaming variants of /classify/text and /classify/file for long judgments.
+# Events from classifier.analyze_text_stream are sent as they are produced:
+# "start", one "segmentation_progress" per segmentation batch, "segmentation",
+# one "clause" per classified clause, "progress" after each batch (with the
+# running risk_summary) and a final "complete".
+# A failure after the stream has started is reported as an "error" event.
+# Each stream holds an inference pool slot while it runs, so a saturated
+# pool rejects new streams with 429 like the non-streaming endpoints.
+#
+# format=ndjson (default): one JSON object per line (application/x-ndjson)
+# format=sse:              Server-Sent Events, the event type as "event:"
+
+STREAM_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+def _encode_stream_event(event: Dict, fmt: str) -> str:
+    """Serialize one analysis event for the chosen stream format."""
+    payload = json.dumps(event, ensure_ascii=False)
+    if fmt == "sse":
+        return f"event: {event.get('event', 'message')}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+
+def _classification_stream(text: str, fmt: str, release: Callable[[], None],
+                           extra_start: Optional[Dict] = None) -> Iterator[str]:
+    """Run the streaming pipeline and encode its events (runs in the threadpool)."""
+    try:
+        for event in classifier.analyze_text_stream(text):
+            if extra_start and event["event"] == "start":
+                event.update(extra_start)
+            yield _encode_stream_event(event, fmt)
+    except Exception as e:
+        logger.error(f"Error in streaming classification: {str(e)}", exc_info=True)
+        yield _encode_stream_event({"event": "error", "detail": str(e)}, fmt)
+    finally:
+        release()
+
+
+def _streaming_response(text: str, fmt: str, extra_start: Optional[Dict] = None) -> StreamingResponse:
+    if not (classifier.has_segmentation and classifier.has_classification):
+        raise HTTPException(status_code=503, detail="Segmentation and classification models are not loaded")
+    
+    # Admitted like /classify/text: the slot is held until the generator
+    # finishes (or the response ends without starting it) - 429 when full
+    release = acquire_slot(POOL_INFERENCE)
+    
+    return StreamingResponse(
+        _classification_stream(text, fmt, release, extra_start),
+        media_type=STREAM_FORMATS[fmt],
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # disable proxy buffering so events arrive immediately
+        },
+        background=BackgroundTask(release)
+    )
+
+
+@router.post("/classify/text/stream")
+async def classify_text_stream(
+    input_data: TextInput,
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$")
+):
+    """
+    Stream the risk classification of input text.
+    
+    Same analysis as /classify/text, but clauses are sent as soon as their
+    batch is classified instead of in one response at the end.
+    """
+    if not input_data.text.strip():
+        raise HTTPException(status_code=400, detail="Text cannot be empty")
+    
+    logger.info(f"Received text input for streaming: {len(input_data.text)} characters")
+    return _streaming_response(input_data.text, format)
+
+
+@router.post("/classify/file/stream")
+async def classify_file_stream(
+    file: UploadFile = File(...),
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$")
+):
+    """
+    Stream the risk classification of an uploaded file (PDF or TXT).
+    
+    The extracted document text is sent once in the "start" event so the
+    client can highlight clauses by their character offsets.
+    """
+    text = await _read_upload_text(file)
+    return _streaming_response(text, format, {"filename": file.filename, "document_text": text})
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # CLASSIFICATION RESULTS MANAGEMENT
 # ═══════════════════════════════════════════════════════════════════════════
@@ -605,7 +718,6 @@ async def classify_file(file: UploadFile = File(...)):
 RESULTS_DIR = Path(backend_path) / "classification_results"
 RESULTS_DIR.mkdir(exist_ok=True, parents=True)
 
-import json
 import datetime
 from fastapi.responses import FileResponse
 
@@ -884,7 +996,7 @@ async def classify_uploaded_file(filename: str = Form(...)):
         
         # Extract text from PDF
         logger.info(f"Extracting text from uploaded file: {filename}")
-        ok, raw_text = pdf_bytes_to_text(pdf_data)
+        ok, raw_text = await run_blocking(POOL_PDF, pdf_bytes_to_text, pdf_data)
         
         if not ok:
             raise HTTPException(
@@ -907,7 +1019,7 @@ async def classify_uploaded_file(filename: str = Form(...)):
         
         # Classify the text
         logger.info(f"Classifying uploaded file: {filename}")
-        result = classifier.analyze_text(text)
+        result = await run_blocking(POOL_INFERENCE, classifier.analyze_text, text)
         
         # Add filename and document text to result
         result["filename"] = filename
@@ -27,6 +27,7 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from app.services.pdf_service import pdf_bytes_to_text, pdf_bytes_to_dual_text, strip_bold_markers
+from fastapi_app.services.executor import POOL_INFERENCE, POOL_IO, POOL_PDF, run_blocking
 from app.services.clause_detection_service import analyze_clause_detection
 from app.services.hybrid_clause_detection_service import analyze_with_hybrid_detection
 from app.services.clause_patterns import CLAUSE_DEFINITIONS
@@ -161,7 +162,7 @@ async def analyze_clauses(
             raise HTTPException(status_code=500, detail=f"Failed to save uploaded PDF: {e}")
 
         # Extract text from PDF (dual version - tagged and clean)
-        ok, result = pdf_bytes_to_dual_text(file_bytes)
+        ok, result = await run_blocking(POOL_PDF, pdf_bytes_to_dual_text, file_bytes)
         if not ok:
             raise HTTPException(status_code=500, detail=f"PDF text extraction failed: {result}")
 
@@ -271,16 +272,18 @@ async def analyze_clauses(
     # Analyze clauses with hybrid detection (ML + Regex)
     try:
         logger.info("analyze-clauses: starting HYBRID clause analysis (ML + Regex)")
-        clause_analysis = analyze_with_hybrid_detection(extracted_text)
+        clause_analysis = await run_blocking(POOL_INFERENCE, analyze_with_hybrid_detection, extracted_text)
         
         # Run corruption detection
         try:
-            corruptions = detect_corruptions(extracted_text)
+            corruptions = await run_blocking(POOL_INFERENCE, detect_corruptions, extracted_text)
         except Exception as e:
             logger.exception('Corruption detection failed')
             corruptions = []
             
         logger.info(f"analyze-clauses: hybrid analysis completed - method={clause_analysis.get('method')}")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, 
@@ -364,7 +367,7 @@ async def predict_clauses(
             raise HTTPException(status_code=400, detail="Uploaded file has no filename")
         try:
             file_bytes = await file.read()
-            ok, result = pdf_bytes_to_dual_text(file_bytes)
+            ok, result = await run_blocking(POOL_PDF, pdf_bytes_to_dual_text, file_bytes)
             if not ok:
                 raise HTTPException(status_code=500, detail=f"PDF text extraction failed: {result}")
             # Use clean version for clause prediction
@@ -630,7 +633,9 @@ async def save_to_database(
                 detail="MongoDB is not connected. Please check your MongoDB connection."
             )
         
-        file_id = mongo_service.save_finalized_document(
+        file_id = await run_blocking(
+            POOL_IO,
+            mongo_service.save_finalized_document,
             filename=filename,
             file_content=content,
             metadata=metadata
@@ -684,7 +689,7 @@ async def list_database_documents(
                 detail="MongoDB is not connected"
             )
         
-        documents = mongo_service.list_documents(limit=limit, skip=skip)
+        documents = await run_blocking(POOL_IO, mongo_service.list_documents, limit=limit, skip=skip)
         
         return {
             "success": True,
@@ -721,7 +726,7 @@ async def get_database_document(file_id: str):
                 detail="MongoDB is not connected"
             )
         
-        document = mongo_service.get_document_by_id(file_id)
+        document = await run_blocking(POOL_IO, mongo_service.get_document_by_id, file_id)
         
         if not document:
             raise HTTPException(
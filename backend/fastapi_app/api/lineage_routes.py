@@ -12,6 +12,7 @@ from traitlets import Any
 # Import your own PDF extraction function
 from app.services.precedent_preprocessing_service import preprocess_judgment_for_lineage
 from fastapi_app.services.lineage_analysis_service import analyze_judgment_lineage, is_model_loaded, load_processed_acts_data
+from fastapi_app.services.executor import POOL_INFERENCE, POOL_PDF, run_blocking
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -110,7 +111,7 @@ async def analyze_lineage(request: LineageAnalysisRequest):
         raise HTTPException(status_code=404, detail=f"File {request.filename} not found in uploads folder.")
     
     # Extract text
-    raw_text = extract_text_from_pdf_like_notebook(pdf_path)
+    raw_text = await run_blocking(POOL_PDF, extract_text_from_pdf_like_notebook, pdf_path)
     
     # DEBUG: Save the extracted text to a file for comparison
     debug_file = Path(__file__).parent.parent.parent / "debug_extracted_text.txt"
@@ -120,17 +121,21 @@ async def analyze_lineage(request: LineageAnalysisRequest):
     
     # Preprocess
     try:
-        preprocessed_data = preprocess_judgment_for_lineage(raw_text)
+        preprocessed_data = await run_blocking(POOL_INFERENCE, preprocess_judgment_for_lineage, raw_text)
         preprocessed_data["file_name"] = request.filename
         logger.info(f"Preprocessing complete. Found {len(preprocessed_data['acts_list'])} acts.")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Preprocessing failed: {e}")
         raise HTTPException(status_code=500, detail="Failed to preprocess document.")
 
     # Analyze
     try:
-        analysis_results = analyze_judgment_lineage(preprocessed_data)
+        analysis_results = await run_blocking(POOL_INFERENCE, analyze_judgment_lineage, preprocessed_data)
         logger.info(f"Analysis complete. Generated {len(analysis_results)} treatment entries.")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Lineage analysis failed: {e}")
         raise HTTPException(status_code=500, detail="Lineage analysis failed.")
@@ -175,7 +180,7 @@ async def upload_and_analyze(file: UploadFile = File(...)):
     
     # 4. Extract text from the saved PDF using your notebook's method
     try:
-        raw_text = extract_text_from_pdf_like_notebook(file_path)
+        raw_text = await run_blocking(POOL_PDF, extract_text_from_pdf_like_notebook, file_path)
         
         if not raw_text or len(raw_text.strip()) == 0:
             # Clean up the saved file if text extraction fails
@@ -183,6 +188,8 @@ async def upload_and_analyze(file: UploadFile = File(...)):
                 file_path.unlink()
             raise HTTPException(status_code=400, detail="No text could be extracted from the PDF file.")
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to extract text from PDF: {e}")
         # Clean up the saved file
@@ -192,9 +199,11 @@ async def upload_and_analyze(file: UploadFile = File(...)):
 
     # 5. Preprocess the text
     try:
-        preprocessed_data = preprocess_judgment_for_lineage(raw_text)
+        preprocessed_data = await run_blocking(POOL_INFERENCE, preprocess_judgment_for_lineage, raw_text)
         preprocessed_data["file_name"] = file.filename
         logger.info(f"Preprocessing complete. Found {len(preprocessed_data['acts_list'])} acts.")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Preprocessing failed for {file.filename}: {e}")
         # Clean up the saved file
@@ -204,7 +213,9 @@ async def upload_and_analyze(file: UploadFile = File(...)):
 
     # 6. Analyze
     try:
-        analysis_results = analyze_judgment_lineage(preprocessed_data)
+        analysis_results = await run_blocking(POOL_INFERENCE, analyze_judgment_lineage, preprocessed_data)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Lineage analysis failed for {file.filename}: {e}")
         # Clean up the saved file
@@ -379,7 +390,7 @@ async def download_judgment_text(filename: str):
         # Read the PDF and extract text (you can reuse your existing extraction function)
         from fastapi_app.api.lineage_routes import extract_text_from_pdf_like_notebook
         
-        text_content = extract_text_from_pdf_like_notebook(file_path)
+        text_content = await run_blocking(POOL_PDF, extract_text_from_pdf_like_notebook, file_path)
         
         if not text_content:
             raise HTTPException(status_code=500, detail="Failed to extract text from PDF")
@@ -10,6 +10,7 @@ import logging
 import os
 import json
 import datetime
+import hashlib
 import re
 from pathlib import Path
 from io import BytesIO
@@ -20,7 +21,8 @@ backend_path = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(backend_path))
 
 from app.services.pdf_service import pdf_bytes_to_text, pdf_bytes_to_dual_text, text_to_pdf, strip_bold_markers
-from app.services.clause_detection_service import analyze_clause_detection
+from fastapi_app.services.executor import POOL_INFERENCE, POOL_PDF, run_blocking
+from app.services.clause_detection_service import analyze_clause_detection, reanalyze_clause_detection
 from app.services.hybrid_clause_detection_service import analyze_with_hybrid_detection
 from app.services.clause_patterns import CLAUSE_DEFINITIONS
 from app.services.corruption_detection_service import detect_corruptions
@@ -62,6 +64,54 @@ class PDFGenerateRequest(BaseModel):
     filename: Optional[str] = "document_completed.pdf"
 
 
+def _update_saved_clause_analysis(text_path: Path, old_text: Optional[str], new_text: str) -> dict:
+    """
+    Update the clause analysis stored next to a saved text file.
+    
+    The analysis of the previous save is kept in <file>.clauses.json together
+    with a hash of the text it was computed on. When that hash matches the text
+    being replaced, only the clauses touched by the edit are detected again;
+    otherwise the whole text is analyzed.
+    
+    Args:
+        text_path: Path of the saved .txt file
+        old_text: Text the file held before this save (None for a new file)
+        new_text: Text that was just saved
+        
+    Returns:
+        dict: Clause analysis of new_text (analyze_clause_detection structure)
+    """
+    analysis_path = Path(str(text_path) + '.clauses.json')
+    
+    previous = None
+    if old_text is not None and analysis_path.exists():
+        try:
+            with open(analysis_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get('text_sha256') == hashlib.sha256(old_text.encode('utf-8')).hexdigest():
+                previous = stored.get('analysis')
+        except Exception:
+            logger.warning(f"save-text: ignoring unreadable clause analysis {analysis_path}")
+    
+    if previous:
+        analysis = reanalyze_clause_detection(previous, old_text, new_text)
+        logger.info(f"save-text: clause analysis updated incrementally for {text_path}")
+    else:
+        analysis = analyze_clause_detection(new_text)
+        logger.info(f"save-text: clause analysis computed for {text_path}")
+    
+    try:
+        with open(analysis_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'text_sha256': hashlib.sha256(new_text.encode('utf-8')).hexdigest(),
+                'analysis': analysis
+            }, f)
+    except Exception:
+        logger.exception(f'save-text: failed to store clause analysis at {analysis_path}')
+    
+    return analysis
+
+
 @router.post("/upload-pdf")
 async def upload_pdf(file: UploadFile = File(...)):
     """
@@ -92,13 +142,15 @@ async def upload_pdf(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=f'Failed to save uploaded file: {e}')
     
     # Extract text from PDF (dual version - tagged and clean)
-    ok, result = pdf_bytes_to_dual_text(file_bytes)
+    ok, result = await run_blocking(POOL_PDF, pdf_bytes_to_dual_text, file_bytes)
     
     if not ok:
         logger.info(f"upload-pdf: initial extraction failed: {result}; attempting OCR fallback")
         try:
             from app.services.pdf_service import _ocr_fallback
-            ocr_ok, ocr_result = _ocr_fallback(file_bytes)
+            ocr_ok, ocr_result = await run_blocking(POOL_PDF, _ocr_fallback, file_bytes)
+        except HTTPException:
+            raise
         except Exception as e:
             ocr_ok, ocr_result = False, str(e)
         
@@ -218,7 +270,7 @@ async def analyze_clauses(
             raise HTTPException(status_code=500, detail=f'Failed to save uploaded PDF: {e}')
         
         # Extract text from PDF (dual version)
-        ok, result = pdf_bytes_to_dual_text(file_bytes)
+        ok, result = await run_blocking(POOL_PDF, pdf_bytes_to_dual_text, file_bytes)
         if not ok:
             raise HTTPException(status_code=500, detail=f'PDF text extraction failed: {result}')
         
@@ -324,16 +376,18 @@ async def analyze_clauses(
     # Analyze clauses with hybrid detection (ML + Regex)
     try:
         logger.info("analyze-clauses: starting HYBRID clause analysis (ML + Regex)")
-        clause_analysis = analyze_with_hybrid_detection(extracted_text)
+        clause_analysis = await run_blocking(POOL_INFERENCE, analyze_with_hybrid_detection, extracted_text)
         
         # Run corruption detection heuristics
         try:
-            corruptions = detect_corruptions(extracted_text)
+            corruptions = await run_blocking(POOL_INFERENCE, detect_corruptions, extracted_text)
         except Exception as e:
             logger.exception('corruption detection failed')
             corruptions = []
         
         logger.info(f"analyze-clauses: hybrid analysis completed - method={clause_analysis.get('method')}")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f'Clause analysis failed: {str(e)}')
     
@@ -392,8 +446,11 @@ async def save_text(data: TextSaveRequest):
     This endpoint saves the clean version. The tagged version remains unchanged
     until document finalization, where changes are merged back.
     
+    The clause analysis of the saved text is updated from the one kept for the
+    previous save (see _update_saved_clause_analysis) and returned with it.
+    
     Expects JSON body: { "filename": "somefile.pdf.clean.txt", "content": "...text..." }
-    Returns { success: true } on success
+    Returns { success: true, clause_analysis: {...} } on success
     """
     filename = data.filename
     content = data.content
@@ -416,14 +473,37 @@ async def save_text(data: TextSaveRequest):
     except ValueError:
         raise HTTPException(status_code=400, detail='Invalid filename or path')
     
+    # Keep the text being replaced so clause analysis can be updated incrementally
+    old_content = None
+    if candidate_path.exists():
+        try:
+            with open(candidate_path, 'r', encoding='utf-8') as f:
+                old_content = f.read()
+        except Exception:
+            logger.warning(f"save-text: could not read previous text of {candidate_path}")
+    
     try:
         with open(candidate_path, 'w', encoding='utf-8') as f:
             f.write(content)
         logger.info(f"save-text: updated {candidate_path}")
-        return JSONResponse(content={'success': True})
     except Exception as e:
         logger.exception('Failed to write text file')
         raise HTTPException(status_code=500, detail=str(e))
+    
+    # The tagged version carries formatting markers; only the clean text is analyzed
+    if filename.lower().endswith('.tagged.txt'):
+        return JSONResponse(content={'success': True})
+    
+    try:
+        clause_analysis = await run_blocking(
+            POOL_INFERENCE, _update_saved_clause_analysis, candidate_path, old_content, content
+        )
+    except Exception:
+        # The text is saved; a failed or rejected analysis must not fail the save
+        logger.exception(f'save-text: clause analysis failed for {candidate_path}')
+        clause_analysis = None
+    
+    return JSONResponse(content={'success': True, 'clause_analysis': clause_analysis})
 
 
 @router.post("/generate-pdf")
@@ -442,7 +522,7 @@ async def generate_pdf(data: PDFGenerateRequest):
         filename = data.filename
         
         # Generate PDF from text (supports formatting markers <<F:...>>)
-        pdf_bytes = text_to_pdf(text)
+        pdf_bytes = await run_blocking(POOL_PDF, text_to_pdf, text)
         
         logger.info(f"generate-pdf: created PDF, size={len(pdf_bytes)} bytes for filename={filename}")
         
@@ -454,6 +534,8 @@ async def generate_pdf(data: PDFGenerateRequest):
                 'Content-Disposition': f'attachment; filename="{filename}"'
             }
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception('generate-pdf failed')
         raise HTTPException(status_code=500, detail=str(e))
@@ -495,7 +577,7 @@ async def download_formatted_pdf(filename: str = Form(...)):
         logger.info(f"download-formatted-pdf: read tagged file {tagged_path}, length={len(tagged_text)}")
         
         # Generate PDF from tagged text (preserves formatting)
-        pdf_bytes = text_to_pdf(tagged_text)
+        pdf_bytes = await run_blocking(POOL_PDF, text_to_pdf, tagged_text)
         
         # Create output filename
         output_filename = f"{base_name}.pdf"
@@ -558,7 +640,7 @@ async def finalize_and_download_pdf(
             finalized_tagged_text = result.get('modified_text', '')
         
         # Step 3: Generate PDF from tagged version (preserves formatting)
-        pdf_bytes = text_to_pdf(finalized_tagged_text)
+        pdf_bytes = await run_blocking(POOL_PDF, text_to_pdf, finalized_tagged_text)
         
         # Create output filename
         base_filename = filename.replace('.clean.txt', '').replace('.txt', '')
@@ -4,26 +4,33 @@ FastAPI routes for the Translation module.
 Endpoints:
   POST /api/translate/document   – translate uploaded PDF (async via background thread)
   POST /api/translate/text       – translate raw text (async via background thread)
-  GET  /api/translate/progress/{job_id}  – SSE / polling progress
+  GET  /api/translate/progress/{job_id}  – polling progress (queue position, ETA); ?since=<cursor>
+                                           returns only sections completed after the cursor
+  GET  /api/translate/progress/{job_id}/stream – SSE: pushes new sections and status changes
   GET  /api/translate/job/{job_id}       – full job result
   GET  /api/translate/history            – list recent jobs
   GET  /api/translate/export/{job_id}    – download translated file
   GET  /api/translate/glossary           – legal glossary
   GET  /api/translate/model-info         – model performance info
+  GET  /api/translate/memory/stats       – translation memory hit rate / size
+  DELETE /api/translate/memory           – clear the translation memory
+  GET  /api/translate/queue/stats        – translation scheduler queues / workers
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
 import re
 import time
-import threading
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
-from fastapi.responses import JSONResponse, Response
+from fastapi import APIRouter, File, Form, Header, HTTPException, Query, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 # ── resolve imports ────────────────────────────────────────────────────────
 import sys
@@ -33,19 +40,26 @@ sys.path.insert(0, str(_backend))
 
 from app.services.translation_service import (
     create_job,
-    fail_job,
-    finalize_job,
+    delete_job,
     get_glossary,
     get_job,
     get_job_progress,
+    get_job_updated_at,
     get_model_info,
     list_jobs,
     load_models,
+    skip_job_section,
+    stop_job,
     translate_raw_text,
-    translate_sections,
     export_translation,
     _split_into_sections,
 )
+from app.services.translation_memory_service import get_translation_memory
+from app.services.translation_scheduler import (
+    PRIORITY_DOCUMENT,
+    PRIORITY_INTERACTIVE,
+    get_translation_scheduler,
+)
 from app.services.pdf_service import pdf_bytes_to_text
 
 logger = logging.getLogger(__name__)
@@ -54,6 +68,12 @@ router = APIRouter()
 UPLOADS_DIR = _backend / "uploads"
 UPLOADS_DIR.mkdir(exist_ok=True)
 
+# Progress stream: how often the job is checked for changes, and the idle keep-alive
+PROGRESS_STREAM_INTERVAL = float(os.getenv("TRANSLATION_PROGRESS_INTERVAL", "0.5"))
+PROGRESS_STREAM_HEARTBEAT = 15.0
+
+_FINISHED_STATUSES = ("completed", "failed", "stopped")
+
 
 def _secure(name: str) -> str:
     name = os.path.basename(name)
@@ -115,31 +135,11 @@ async def translate_document(
         mk = f"{source_language}_{target_language}"
         model_used = "mBART-legal-" + mk if mk in models else "mock-fallback"
 
-        # Run translation in background thread so the request returns immediately
-        def _run():
-            t0 = time.time()
-            try:
-                # This WILL block until models are ready (inside the bg thread, that's fine)
-                translated, overall_conf, correction_stats = translate_sections(
-                    sections, source_language, target_language, job_id
-                )
-                elapsed = time.time() - t0
-                finalize_job(
-                    job_id,
-                    source_sections=sections,
-                    translated_sections=translated,
-                    overall_confidence=overall_conf,
-                    processing_time=elapsed,
-                    model_used=model_used,
-                    correction_stats=correction_stats,
-                )
-                logger.info("Translation job %s completed in %.1fs with %d corrections", 
-                           job_id, elapsed, correction_stats.get('total_corrections', 0))
-            except Exception as exc:
-                logger.exception("Translation job %s failed", job_id)
-                fail_job(job_id, str(exc))
-
-        threading.Thread(target=_run, daemon=True).start()
+        # Queue for the model pair's workers so the request returns immediately
+        queue_info = get_translation_scheduler().submit(
+            job_id, sections, source_language, target_language, model_used,
+            mode="document", priority=PRIORITY_DOCUMENT,
+        )
 
         return JSONResponse({
             "success": True,
@@ -151,6 +151,7 @@ async def translate_document(
             "total_sections": len(sections),
             "model_used": model_used,
             "source_sections": sections,
+            **queue_info,
         })
     except HTTPException:
         raise
@@ -186,29 +187,11 @@ async def translate_text_endpoint(
 
         sections = _split_into_sections(text)
 
-        def _run():
-            t0 = time.time()
-            try:
-                translated_sections, overall_conf, correction_stats = translate_sections(
-                    sections, source_language, target_language, job_id
-                )
-                raw_translated = " ".join(s["translated_content"] for s in translated_sections)
-                elapsed = time.time() - t0
-                finalize_job(
-                    job_id,
-                    source_sections=sections,
-                    translated_sections=translated_sections,
-                    overall_confidence=overall_conf,
-                    processing_time=elapsed,
-                    correction_stats=correction_stats,
-                    model_used=model_used,
-                    raw_translated=raw_translated,
-                )
-            except Exception as exc:
-                logger.exception("Text translation job %s failed", job_id)
-                fail_job(job_id, str(exc))
-
-        threading.Thread(target=_run, daemon=True).start()
+        # Interactive text jumps ahead of queued document jobs
+        queue_info = get_translation_scheduler().submit(
+            job_id, sections, source_language, target_language, model_used,
+            mode="text", priority=PRIORITY_INTERACTIVE,
+        )
 
         return JSONResponse({
             "success": True,
@@ -220,6 +203,7 @@ async def translate_text_endpoint(
             "total_sections": len(sections),
             "model_used": model_used,
             "source_sections": sections,
+            **queue_info,
         })
     except HTTPException:
         raise
@@ -233,14 +217,103 @@ async def translate_text_endpoint(
 # ═══════════════════════════════════════════════════════════════════════════
 
 @router.get("/translate/progress/{job_id}")
-async def translation_progress(job_id: str):
-    """Light-weight polling endpoint for progress updates."""
-    info = get_job_progress(job_id)
+async def translation_progress(job_id: str, since: int = Query(0, ge=0)):
+    """
+    Light-weight polling endpoint for progress updates (incl. queue position and ETA).
+
+    partial_translated_sections holds only the sections completed since the
+    `since` cursor; pass the returned `cursor` as `since` on the next poll.
+    `reset: true` means the job restarted and the list starts over.
+    """
+    # Job store reads (SQLite) stay off the event loop
+    info = await run_in_threadpool(get_job_progress, job_id, since)
     if "error" in info and info["error"] == "Job not found":
         raise HTTPException(404, "Job not found")
+    info.update(await run_in_threadpool(get_translation_scheduler().queue_info, job_id))
     return JSONResponse(info)
 
 
+def _sse_event(event: str, data: dict, event_id: Optional[int] = None) -> str:
+    payload = json.dumps(data, ensure_ascii=False)
+    prefix = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{prefix}event: {event}\ndata: {payload}\n\n"
+
+
+async def _progress_events(request: Request, job_id: str, cursor: int) -> AsyncIterator[str]:
+    """
+    Push a "progress" event whenever the job changes (new sections, status,
+    queue position), then "end" once it has finished. The event id is the
+    section cursor, so a reconnecting EventSource resumes where it left off.
+
+    Job store reads (SQLite) and the scheduler lookup run in the threadpool,
+    never on the event loop.
+    """
+    scheduler = get_translation_scheduler()
+    last_change = None
+    last_queue = None
+    last_sent = time.monotonic()
+
+    while not await request.is_disconnected():
+        changed_at = await run_in_threadpool(get_job_updated_at, job_id)
+        if changed_at is None:
+            yield _sse_event("error", {"job_id": job_id, "detail": "Job not found"})
+            return
+
+        queue = await run_in_threadpool(scheduler.queue_info, job_id)
+        queue_key = (queue["queue_state"], queue["queue_position"])
+        if changed_at != last_change or queue_key != last_queue:
+            info = await run_in_threadpool(get_job_progress, job_id, cursor)
+            if "cursor" not in info:
+                yield _sse_event("error", {"job_id": job_id, "detail": "Job not found"})
+                return
+            cursor = info["cursor"]
+            last_change, last_queue = info["updated_at"], queue_key
+            info.update(queue)
+            yield _sse_event("progress", info, cursor)
+            last_sent = time.monotonic()
+
+            if info["status"] in _FINISHED_STATUSES:
+                yield _sse_event("end", {"job_id": job_id, "status": info["status"]}, cursor)
+                return
+        elif time.monotonic() - last_sent >= PROGRESS_STREAM_HEARTBEAT:
+            yield ": keep-alive\n\n"
+            last_sent = time.monotonic()
+
+        await asyncio.sleep(PROGRESS_STREAM_INTERVAL)
+
+
+@router.get("/translate/progress/{job_id}/stream")
+async def translation_progress_stream(
+    request: Request,
+    job_id: str,
+    since: int = Query(0, ge=0),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    Server-Sent Events stream of a job's progress.
+
+    Each "progress" event carries the status fields, queue position/ETA and
+    only the sections completed since the previous event; nothing is sent
+    while the job is unchanged (apart from a keep-alive comment). A final
+    "end" event is sent once the job is completed, failed or stopped.
+    """
+    if await run_in_threadpool(get_job_updated_at, job_id) is None:
+        raise HTTPException(404, "Job not found")
+
+    # EventSource sends the last received id when it reconnects
+    if last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+
+    return StreamingResponse(
+        _progress_events(request, job_id, since),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # disable proxy buffering so events arrive immediately
+        }
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # GET /api/translate/job/{job_id}
 # ═══════════════════════════════════════════════════════════════════════════
@@ -272,15 +345,11 @@ async def translation_history(limit: int = Query(20, ge=1, le=100)):
 @router.post("/translate/cancel/{job_id}")
 async def cancel_translation(job_id: str):
     """Mark a running translation job as stopped by user."""
-    from app.services.translation_service import _load_job, _save_job
-    job = _load_job(job_id)
-    if not job:
+    status = stop_job(job_id)
+    if status is None:
         raise HTTPException(404, "Job not found")
-    if job["status"] in ("completed", "failed", "stopped"):
-        return JSONResponse({"message": "Job already finished", "status": job["status"]})
-    job["status"] = "stopped"
-    # Don't set error - this was intentional stop, not a failure
-    _save_job(job_id, job)
+    if status in ("completed", "failed", "stopped"):
+        return JSONResponse({"message": "Job already finished", "status": status})
     return JSONResponse({"message": "Job stopped", "status": "stopped"})
 
 
@@ -291,15 +360,10 @@ async def cancel_translation(job_id: str):
 @router.post("/translate/skip-section/{job_id}")
 async def skip_section(job_id: str, section_index: int = Form(...)):
     """Mark a section to be skipped during translation."""
-    from app.services.translation_service import _load_job, _save_job
-    job = _load_job(job_id)
-    if not job:
+    skip_sections = skip_job_section(job_id, section_index)
+    if skip_sections is None:
         raise HTTPException(404, "Job not found")
-    skip_set = set(job.get("skip_sections", []))
-    skip_set.add(section_index)
-    job["skip_sections"] = list(skip_set)
-    _save_job(job_id, job)
-    return JSONResponse({"message": f"Section {section_index} marked for skip", "skip_sections": list(skip_set)})
+    return JSONResponse({"message": f"Section {section_index} marked for skip", "skip_sections": skip_sections})
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -309,11 +373,8 @@ async def skip_section(job_id: str, section_index: int = Form(...)):
 @router.delete("/translate/job/{job_id}")
 async def delete_translation_job(job_id: str):
     """Delete a translation job."""
-    from app.services.translation_service import JOBS_DIR
-    job_file = JOBS_DIR / f"{job_id}.json"
-    if not job_file.exists():
+    if not delete_job(job_id):
         raise HTTPException(404, "Job not found")
-    job_file.unlink()
     return JSONResponse({"message": "Job deleted"})
 
 
@@ -371,6 +432,41 @@ async def model_info_endpoint():
         return JSONResponse({"error": str(exc)}, status_code=500)
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# GET /api/translate/memory/stats  ·  DELETE /api/translate/memory
+# ═══════════════════════════════════════════════════════════════════════════
+
+@router.get("/translate/memory/stats")
+async def translation_memory_stats():
+    """Hit rate, size and limits of the sentence translation memory."""
+    try:
+        return JSONResponse(get_translation_memory().stats())
+    except Exception as exc:
+        logger.exception("translation memory stats error")
+        return JSONResponse({"error": str(exc)}, status_code=500)
+
+
+@router.delete("/translate/memory")
+async def clear_translation_memory():
+    """Remove every stored sentence translation."""
+    try:
+        get_translation_memory().clear()
+        return JSONResponse({"cleared": True})
+    except Exception as exc:
+        logger.exception("translation memory clear error")
+        return JSONResponse({"error": str(exc)}, status_code=500)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# GET /api/translate/queue/stats
+# ═══════════════════════════════════════════════════════════════════════════
+
+@router.get("/translate/queue/stats")
+async def translation_queue_stats():
+    """Queued / running jobs and seconds-per-section estimate per model pair."""
+    return JSONResponse(get_translation_scheduler().stats())
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # POST /api/translate/extract-saved  – extract text from a saved file
 # ═══════════════════════════════════════════════════════════════════════════
@@ -467,27 +563,10 @@ async def translate_document_from_saved(
         mk = f"{source_language}_{target_language}"
         model_used = "mBART-legal-" + mk if mk in models else "mock-fallback"
 
-        def _run():
-            t0 = time.time()
-            try:
-                translated, overall_conf, correction_stats = translate_sections(
-                    sections, source_language, target_language, job_id
-                )
-                elapsed = time.time() - t0
-                finalize_job(
-                    job_id,
-                    source_sections=sections,
-                    translated_sections=translated,
-                    overall_confidence=overall_conf,
-                    processing_time=elapsed,
-                    model_used=model_used,
-                    correction_stats=correction_stats,
-                )
-            except Exception as exc:
-                logger.exception("Translation job %s failed", job_id)
-                fail_job(job_id, str(exc))
-
-        threading.Thread(target=_run, daemon=True).start()
+        queue_info = get_translation_scheduler().submit(
+            job_id, sections, source_language, target_language, model_used,
+            mode="document", priority=PRIORITY_DOCUMENT,
+        )
 
         return JSONResponse({
             "success": True,
@@ -499,6 +578,7 @@ async def translate_document_from_saved(
             "total_sections": len(sections),
             "model_used": model_used,
             "source_sections": sections,
+            **queue_info,
         })
     except HTTPException:
         raise
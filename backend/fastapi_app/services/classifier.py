@@ -3,14 +3,22 @@ Legal risk classification pipeline service.
 Implements the two-stage pipeline: clause segmentation → risk classification
 """
 import logging
+import os
 import torch
 import numpy as np
 import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Iterator, Optional, Tuple
 from .model_loader import model_loader
+from app.services.inference_batcher import INFERENCE_BATCHING, MicroBatcher
 
 logger = logging.getLogger(__name__)
 
+# Sentences per segmentation forward pass (sentences are length-sorted first)
+SEGMENTATION_BATCH_SIZE = int(os.getenv("SEGMENTATION_BATCH_SIZE", "32"))
+
+# Clauses per risk-classification forward pass (clauses are length-sorted first)
+CLASSIFICATION_BATCH_SIZE = int(os.getenv("CLASSIFICATION_BATCH_SIZE", "16"))
+
 
 class LegalRiskClassifier:
     """Two-stage legal risk classification pipeline."""
@@ -38,6 +46,22 @@ class LegalRiskClassifier:
             logger.warning("Classification model not available")
         
         self.labels = model_loader.get_labels()
+        
+        # Coalesce concurrent requests into shared forward passes (INFERENCE_BATCHING)
+        self.segmentation_batcher = None
+        self.classification_batcher = None
+        if INFERENCE_BATCHING and self.has_segmentation:
+            self.segmentation_batcher = MicroBatcher(
+                "segmentation",
+                lambda features: self._label_segmentation_features(features, SEGMENTATION_BATCH_SIZE),
+                max_batch_size=SEGMENTATION_BATCH_SIZE
+            )
+        if INFERENCE_BATCHING and self.has_classification:
+            self.classification_batcher = MicroBatcher(
+                "risk_classification",
+                lambda features: self._classify_features(features, CLASSIFICATION_BATCH_SIZE),
+                max_batch_size=CLASSIFICATION_BATCH_SIZE
+            )
     
     def _split_into_sentences(self, text: str) -> List[Dict]:
         """
@@ -232,14 +256,19 @@ class LegalRiskClassifier:
         logger.info(f"Split text into {len(result)} sentences (PDF-aware, joined line breaks)")
         return result
     
-    def segment_clauses(self, text: str) -> List[Dict]:
+    def segment_clauses(self, text: str, batch_size: Optional[int] = None) -> List[Dict]:
         """
         Stage 1: Segment text into clauses using BIO tagging.
         Pre-splits text into sentences to avoid truncation issues.
         Returns clauses with character offsets from the original text.
         
+        All sentences are tokenized in one call, sorted by token length and
+        run through the model in dynamically padded batches, so a long
+        judgment takes a few forward passes instead of one per sentence.
+        
         Args:
             text: Input text to segment
+            batch_size: Sentences per forward pass (default: SEGMENTATION_BATCH_SIZE)
             
         Returns:
             List of dicts: [{"text": str, "start": int, "end": int}, ...]
@@ -248,50 +277,114 @@ class LegalRiskClassifier:
             raise RuntimeError("Segmentation model not available. Please place model files in app/ml_models/legalbert_clause_segmentation_model/")
         
         sentence_infos = self._split_into_sentences(text)
+        all_clauses = self._segment_sentences(sentence_infos, batch_size)
         
-        all_clauses = []
+        logger.info(f"Segmented into {len(all_clauses)} clauses from {len(sentence_infos)} sentences")
         
-        for sentence_info in sentence_infos:
+        if not all_clauses:
+            # If no clauses found, treat entire text as one clause
+            all_clauses = [{"text": text, "start": 0, "end": len(text)}]
+        
+        return all_clauses
+    
+    def _segment_sentences(self, sentence_infos: List[Dict],
+                           batch_size: Optional[int] = None) -> List[Dict]:
+        """
+        Label a list of sentences and extract their clauses.
+        
+        Args:
+            sentence_infos: Sentences from _split_into_sentences ({"text", "start", ...})
+            batch_size: Sentences per forward pass (default: SEGMENTATION_BATCH_SIZE)
+            
+        Returns:
+            Clauses of all sentences, in sentence order, with document offsets
+        """
+        sentence_labels, encodings = self._predict_segmentation_labels(
+            [info["text"] for info in sentence_infos],
+            batch_size
+        )
+        
+        clauses = []
+        
+        for idx, sentence_info in enumerate(sentence_infos):
             sentence = sentence_info["text"]
             sentence_start = sentence_info["start"]
             
-            # Tokenize input with return_offsets_mapping to get char positions
-            inputs = self.segmentation_tokenizer(
-                sentence,
-                return_tensors="pt",
-                truncation=True,
-                max_length=512,
-                padding=True,
-                return_offsets_mapping=True
-            )
-            
-            # Extract offset_mapping before moving to device (it's not needed on GPU)
-            offset_mapping = inputs.pop("offset_mapping")[0]  # shape: (seq_len, 2)
-            
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-            
-            # Get predictions
-            with torch.no_grad():
-                outputs = self.segmentation_model(**inputs)
-                predictions = torch.argmax(outputs.logits, dim=-1)
-            
-            # Convert predictions to labels
-            tokens = self.segmentation_tokenizer.convert_ids_to_tokens(inputs["input_ids"][0])
-            predicted_labels = [self.labels["segmentation"][pred.item()] for pred in predictions[0]]
+            tokens = self.segmentation_tokenizer.convert_ids_to_tokens(encodings["input_ids"][idx])
+            offset_mapping = torch.tensor(encodings["offset_mapping"][idx])  # shape: (seq_len, 2)
             
             # Extract clauses using offset_mapping for exact positions
             sentence_clauses = self._extract_clauses_with_offsets(
-                tokens, predicted_labels, offset_mapping, sentence, sentence_start
+                tokens, sentence_labels[idx], offset_mapping, sentence, sentence_start
             )
-            all_clauses.extend(sentence_clauses)
+            clauses.extend(sentence_clauses)
         
-        logger.info(f"Segmented into {len(all_clauses)} clauses from {len(sentence_infos)} sentences")
+        return clauses
+    
+    def _predict_segmentation_labels(self, sentences: List[str],
+                                     batch_size: Optional[int] = None) -> Tuple[List[List[str]], Dict]:
+        """
+        Predict BIO labels for every token of every sentence.
         
-        if not all_clauses:
-            # If no clauses found, treat entire text as one clause
-            all_clauses = [{"text": text, "start": 0, "end": len(text)}]
+        Without an explicit batch_size the forward passes go through the
+        segmentation batcher and are shared with concurrent requests.
         
-        return all_clauses
+        Args:
+            sentences: Sentence texts
+            batch_size: Sentences per forward pass (default: SEGMENTATION_BATCH_SIZE)
+            
+        Returns:
+            (labels per sentence, tokenizer encodings with input_ids and
+            offset_mapping per sentence), both in input order
+        """
+        # Tokenize everything once, unpadded, with offset mappings for char positions
+        encodings = self.segmentation_tokenizer(
+            sentences,
+            truncation=True,
+            max_length=512,
+            return_offsets_mapping=True
+        )
+        model_keys = [k for k in ("input_ids", "token_type_ids", "attention_mask") if k in encodings]
+        features = [{k: encodings[k][i] for k in model_keys} for i in range(len(sentences))]
+        
+        if batch_size is None and self.segmentation_batcher is not None:
+            return self.segmentation_batcher.submit(features), encodings
+        return self._label_segmentation_features(features, batch_size or SEGMENTATION_BATCH_SIZE), encodings
+    
+    def _label_segmentation_features(self, features: List[Dict[str, List[int]]], batch_size: int) -> List[List[str]]:
+        """
+        Run tokenized sentences through the segmentation model.
+        
+        Args:
+            features: Unpadded model inputs (input_ids, attention_mask, ...) per sentence
+            batch_size: Sentences per forward pass
+            
+        Returns:
+            BIO labels per sentence, in input order
+        """
+        # Length buckets: neighbours in length order share a batch and its padding
+        order = sorted(range(len(features)), key=lambda i: len(features[i]["input_ids"]))
+        id2label = self.labels["segmentation"]
+        sentence_labels: List[List[str]] = [[] for _ in features]
+        
+        with torch.no_grad():
+            for start in range(0, len(order), batch_size):
+                batch_idx = order[start:start + batch_size]
+                batch = self.segmentation_tokenizer.pad(
+                    [features[i] for i in batch_idx],
+                    padding=True,
+                    return_tensors="pt"
+                )
+                inputs = {k: v.to(self.device) for k, v in batch.items()}
+                
+                outputs = self.segmentation_model(**inputs)
+                predictions = torch.argmax(outputs.logits, dim=-1).cpu().tolist()
+                
+                for row, i in enumerate(batch_idx):
+                    seq_len = len(features[i]["input_ids"])
+                    sentence_labels[i] = [id2label[pred] for pred in predictions[row][:seq_len]]
+        
+        return sentence_labels
     
     def _extract_clauses_with_offsets(
         self, 
@@ -412,7 +505,7 @@ class LegalRiskClassifier:
         
         return clauses
     
-    def segment_clauses_hybrid(self, text: str) -> List[Dict]:
+    def segment_clauses_hybrid(self, text: str, ml_clauses: Optional[List[Dict]] = None) -> List[Dict]:
         """
         HYBRID APPROACH: Combines Legal-BERT ML predictions with rule-based post-processing.
         
@@ -424,6 +517,7 @@ class LegalRiskClassifier:
         
         Args:
             text: Input text to segment
+            ml_clauses: segment_clauses(text) output, if already computed
             
         Returns:
             List of dicts: [{"text": str, "start": int, "end": int}, ...]
@@ -431,7 +525,8 @@ class LegalRiskClassifier:
         import re
         
         # Step 1: Get ML predictions
-        ml_clauses = self.segment_clauses(text)
+        if ml_clauses is None:
+            ml_clauses = self.segment_clauses(text)
         
         if not ml_clauses:
             return [{"text": text, "start": 0, "end": len(text)}]
@@ -697,32 +792,86 @@ class LegalRiskClassifier:
         Returns:
             Tuple of (risk_level, confidence, all_probabilities)
         """
+        return self.classify_risk_batch([clause])[0]
+    
+    def classify_risk_batch(self, clauses: List[str],
+                            batch_size: Optional[int] = None) -> List[Tuple[str, float, Dict[str, float]]]:
+        """
+        Stage 2 for many clauses: classify the risk level of each clause.
+        
+        Clauses are tokenized once, sorted by token length and classified in
+        dynamically padded micro-batches; softmax/argmax run on the whole batch
+        and the probabilities come back to the host in one transfer per batch.
+        Without an explicit batch_size the forward passes go through the
+        classification batcher and are shared with concurrent requests.
+        
+        Args:
+            clauses: Clause texts to classify
+            batch_size: Clauses per forward pass (default: CLASSIFICATION_BATCH_SIZE)
+            
+        Returns:
+            List of (risk_level, confidence, all_probabilities), in input order
+        """
         if not self.has_classification:
             raise RuntimeError("Classification model not available. Please place model files in app/ml_models/legalbert_risk_classification_model/")
+        if not clauses:
+            return []
         
-        inputs = self.classification_tokenizer(
-            clause,
-            return_tensors="pt",
+        encodings = self.classification_tokenizer(
+            list(clauses),
             truncation=True,
-            max_length=512,
-            padding=True
-        ).to(self.device)
+            max_length=512
+        )
+        model_keys = [k for k in ("input_ids", "token_type_ids", "attention_mask") if k in encodings]
+        features = [{k: encodings[k][i] for k in model_keys} for i in range(len(clauses))]
         
-        with torch.no_grad():
-            outputs = self.classification_model(**inputs)
-            logits = outputs.logits
-            probabilities = torch.nn.functional.softmax(logits, dim=-1)[0]
-            predicted_class = torch.argmax(probabilities).item()
-            confidence = probabilities[predicted_class].item()
+        if batch_size is None and self.classification_batcher is not None:
+            return self.classification_batcher.submit(features)
+        return self._classify_features(features, batch_size or CLASSIFICATION_BATCH_SIZE)
+    
+    def _classify_features(self, features: List[Dict[str, List[int]]],
+                           batch_size: int) -> List[Tuple[str, float, Dict[str, float]]]:
+        """
+        Run tokenized clauses through the risk classification model.
         
-        risk_level = self.labels["classification"][predicted_class]
+        Args:
+            features: Unpadded model inputs (input_ids, attention_mask, ...) per clause
+            batch_size: Clauses per forward pass
+            
+        Returns:
+            List of (risk_level, confidence, all_probabilities), in input order
+        """
+        order = sorted(range(len(features)), key=lambda i: len(features[i]["input_ids"]))
         
-        all_probs = {
-            self.labels["classification"][i]: prob.item() 
-            for i, prob in enumerate(probabilities)
-        }
+        labels = self.labels["classification"]
+        results: List[Tuple[str, float, Dict[str, float]]] = [None] * len(features)
         
-        return risk_level, confidence, all_probs
+        with torch.no_grad():
+            for start in range(0, len(order), batch_size):
+                batch_idx = order[start:start + batch_size]
+                batch = self.classification_tokenizer.pad(
+                    [features[i] for i in batch_idx],
+                    padding=True,
+                    return_tensors="pt"
+                )
+                inputs = {k: v.to(self.device) for k, v in batch.items()}
+                
+                logits = self.classification_model(**inputs).logits
+                probabilities = torch.nn.functional.softmax(logits, dim=-1)
+                predicted = torch.argmax(probabilities, dim=-1)
+                
+                probabilities = probabilities.cpu().numpy()
+                predicted = predicted.cpu().numpy()
+                
+                for row, i in enumerate(batch_idx):
+                    predicted_class = int(predicted[row])
+                    results[i] = (
+                        labels[predicted_class],
+                        float(probabilities[row, predicted_class]),
+                        {labels[j]: float(prob) for j, prob in enumerate(probabilities[row])}
+                    )
+        
+        return results
     
     def analyze_text(self, text: str) -> Dict:
         """
@@ -751,37 +900,18 @@ class LegalRiskClassifier:
                 "risk_summary": {"High": 0, "Medium": 0, "Low": 0}
             }
         
-        # Stage 2: Classify each clause (skip structural/metadata text)
+        substantive = self._substantive_clauses(clause_infos)
+        
+        # Stage 2: Classify all substantive clauses in batches
+        classifications = self.classify_risk_batch([c["text"] for c in substantive])
+        
         results = []
         risk_counts = {"High": 0, "Medium": 0, "Low": 0}
-        clause_id = 1
         
-        for clause_info in clause_infos:
-            clause_text = clause_info["text"]
-            
-            # Skip document structure elements — headers, judge names, signatures,
-            # act citations, case numbers — these are NOT legal-risk clauses
-            if self._is_structural_text(clause_text):
-                logger.debug(f"Skipping structural text: {clause_text[:60]!r}")
-                continue
-            
-            risk_level, confidence, all_probs = self.classify_risk(clause_text)
-            
-            key_factors = self._generate_key_factors(clause_text, risk_level)
-            
-            results.append({
-                "id": clause_id,
-                "text": clause_text,
-                "start_char": clause_info["start"],
-                "end_char": clause_info["end"],
-                "risk": risk_level,
-                "confidence": round(confidence * 100, 2),
-                "probabilities": {k: round(v * 100, 2) for k, v in all_probs.items()},
-                "keyFactors": key_factors
-            })
-            
-            risk_counts[risk_level] += 1
-            clause_id += 1
+        for clause_id, (clause_info, classification) in enumerate(zip(substantive, classifications), 1):
+            result = self._build_clause_result(clause_id, clause_info, *classification)
+            results.append(result)
+            risk_counts[result["risk"]] += 1
         
         logger.info(f"Analysis complete: {len(results)} substantive clauses classified (skipped {len(clause_infos) - len(results)} structural segments)")
         
@@ -789,11 +919,129 @@ class LegalRiskClassifier:
             "total_clauses": len(clause_infos),
             "clauses": results,
             "risk_summary": risk_counts,
-            "model_info": {
-                "segmentation_model": "Legal-BERT (BIO Tagging)",
-                "classification_model": "Legal-BERT (Risk Classification)",
-                "device": str(self.device)
+            "model_info": self._model_info()
+        }
+    
+    def analyze_text_stream(self, text: str, batch_size: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Streaming variant of analyze_text.
+        
+        Yields events as the pipeline advances instead of one final result,
+        so a client can render the first clauses of a long judgment while
+        the rest are still being classified:
+        
+            {"event": "start", "characters": int}
+            {"event": "segmentation_progress", "segmented_sentences": int, "total_sentences": int}
+                                                          (one per segmentation batch)
+            {"event": "segmentation", "total_clauses": int, "substantive_clauses": int, "skipped": int}
+            {"event": "clause", "clause": {...}}          (one per clause, document order)
+            {"event": "progress", "classified": int, "total": int, "risk_summary": {...}}
+            {"event": "complete", "total_clauses": int, "classified_clauses": int,
+             "risk_summary": {...}, "model_info": {...}}
+        
+        Clause payloads are the same dicts analyze_text returns in "clauses".
+        
+        Segmentation runs SEGMENTATION_BATCH_SIZE sentences at a time in
+        document order, so a long judgment reports progress before its first
+        clause is classified; the hybrid post-processing then runs once over
+        all ML clauses, exactly as in analyze_text.
+        
+        Args:
+            text: Input legal text
+            batch_size: Clauses per classification forward pass (default: CLASSIFICATION_BATCH_SIZE)
+            
+        Yields:
+            Event dictionaries
+        """
+        batch_size = batch_size or CLASSIFICATION_BATCH_SIZE
+        yield {"event": "start", "characters": len(text)}
+        
+        # Stage 1: Segment clauses using HYBRID approach (ML + Rules)
+        if not self.has_segmentation:
+            raise RuntimeError("Segmentation model not available. Please place model files in app/ml_models/legalbert_clause_segmentation_model/")
+        sentence_infos = self._split_into_sentences(text)
+        ml_clauses = []
+        for start in range(0, len(sentence_infos), SEGMENTATION_BATCH_SIZE):
+            chunk = sentence_infos[start:start + SEGMENTATION_BATCH_SIZE]
+            ml_clauses.extend(self._segment_sentences(chunk))
+            yield {
+                "event": "segmentation_progress",
+                "segmented_sentences": start + len(chunk),
+                "total_sentences": len(sentence_infos)
+            }
+        
+        if not ml_clauses:
+            ml_clauses = [{"text": text, "start": 0, "end": len(text)}]
+        clause_infos = self.segment_clauses_hybrid(text, ml_clauses)
+        substantive = self._substantive_clauses(clause_infos)
+        yield {
+            "event": "segmentation",
+            "total_clauses": len(clause_infos),
+            "substantive_clauses": len(substantive),
+            "skipped": len(clause_infos) - len(substantive)
+        }
+        
+        # Stage 2: Classify in document order, one forward pass per chunk
+        risk_counts = {"High": 0, "Medium": 0, "Low": 0}
+        for start in range(0, len(substantive), batch_size):
+            chunk = substantive[start:start + batch_size]
+            classifications = self.classify_risk_batch([c["text"] for c in chunk])
+            
+            for offset, (clause_info, classification) in enumerate(zip(chunk, classifications)):
+                result = self._build_clause_result(start + offset + 1, clause_info, *classification)
+                risk_counts[result["risk"]] += 1
+                yield {"event": "clause", "clause": result}
+            
+            yield {
+                "event": "progress",
+                "classified": start + len(chunk),
+                "total": len(substantive),
+                "risk_summary": dict(risk_counts)
             }
+        
+        logger.info(f"Streamed analysis complete: {len(substantive)} substantive clauses classified (skipped {len(clause_infos) - len(substantive)} structural segments)")
+        
+        yield {
+            "event": "complete",
+            "total_clauses": len(clause_infos),
+            "classified_clauses": len(substantive),
+            "risk_summary": risk_counts,
+            "model_info": self._model_info()
+        }
+    
+    def _substantive_clauses(self, clause_infos: List[Dict]) -> List[Dict]:
+        """
+        Skip document structure elements — headers, judge names, signatures,
+        act citations, case numbers — these are NOT legal-risk clauses.
+        """
+        substantive = []
+        for clause_info in clause_infos:
+            if self._is_structural_text(clause_info["text"]):
+                logger.debug(f"Skipping structural text: {clause_info['text'][:60]!r}")
+                continue
+            substantive.append(clause_info)
+        return substantive
+    
+    def _model_info(self) -> Dict:
+        return {
+            "segmentation_model": "Legal-BERT (BIO Tagging)",
+            "classification_model": "Legal-BERT (Risk Classification)",
+            "device": str(self.device)
+        }
+    
+    def _build_clause_result(self, clause_id: int, clause_info: Dict, risk_level: str,
+                             confidence: float, all_probs: Dict[str, float]) -> Dict:
+        """Format one classified clause for the API response."""
+        clause_text = clause_info["text"]
+        return {
+            "id": clause_id,
+            "text": clause_text,
+            "start_char": clause_info["start"],
+            "end_char": clause_info["end"],
+            "risk": risk_level,
+            "confidence": round(confidence * 100, 2),
+            "probabilities": {k: round(v * 100, 2) for k, v in all_probs.items()},
+            "keyFactors": self._generate_key_factors(clause_text, risk_level)
         }
     
     def _is_structural_text(self, text: str) -> bool:
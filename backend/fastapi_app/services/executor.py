@@ -0,0 +1,305 @@
+"""
+Shared execution layer for blocking work in async routes.
+
+Route handlers are `async def`, so CPU-bound work called from them directly
+(torch inference, pdfplumber/OCR extraction, regex scanning) stalls the event
+loop and with it every other request on the worker, including /ping and
+translation progress polling. Handlers offload that work here instead:
+
+    result = await run_blocking(POOL_INFERENCE, classifier.analyze_text, text)
+
+Separate bounded pools keep one kind of work from starving another:
+    inference - ML models and the regex clause/corruption scanners
+    pdf       - PDF text extraction (incl. OCR fallback) and PDF generation
+    io        - file system / database calls
+
+Admission control: each pool accepts at most workers + queue slots tasks.
+Beyond that run_blocking raises a 429 with a Retry-After estimate instead of
+queueing without bound. Time spent waiting for a worker is added up per
+request and returned by QueueTimingMiddleware in X-Queue-Wait-Ms and
+Server-Timing headers.
+
+Exports:
+ - POOL_INFERENCE, POOL_PDF, POOL_IO
+ - PoolSaturatedError
+ - run_blocking(pool, fn, *args, **kwargs) -> awaitable result
+ - acquire_slot(pool) -> release callable
+ - get_pool(name) -> BoundedPool
+ - get_executor_stats() -> Dict[str, Dict]
+ - queue_timing_middleware(request, call_next)
+"""
+import asyncio
+import contextvars
+import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+POOL_INFERENCE = "inference"
+POOL_PDF = "pdf"
+POOL_IO = "io"
+
+# (workers, queue slots) per pool
+POOL_SETTINGS = {
+    POOL_INFERENCE: (
+        int(os.getenv("EXECUTOR_INFERENCE_WORKERS", "4")),
+        int(os.getenv("EXECUTOR_INFERENCE_QUEUE", "16")),
+    ),
+    POOL_PDF: (
+        int(os.getenv("EXECUTOR_PDF_WORKERS", "2")),
+        int(os.getenv("EXECUTOR_PDF_QUEUE", "8")),
+    ),
+    POOL_IO: (
+        int(os.getenv("EXECUTOR_IO_WORKERS", "8")),
+        int(os.getenv("EXECUTOR_IO_QUEUE", "64")),
+    ),
+}
+
+# Queue waits above this are logged
+SLOW_QUEUE_WAIT_MS = float(os.getenv("EXECUTOR_SLOW_QUEUE_WAIT_MS", "500"))
+
+# Per-request accumulator, set by queue_timing_middleware
+_request_timing: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar(
+    "request_timing", default=None
+)
+
+
+class PoolSaturatedError(HTTPException):
+    """429 raised when a pool has no free worker or queue slot."""
+
+    def __init__(self, pool: str, retry_after: int):
+        super().__init__(
+            status_code=429,
+            detail=f"Server is busy ({pool} queue full). Please retry in {retry_after}s.",
+            headers={"Retry-After": str(retry_after)}
+        )
+        self.pool = pool
+        self.retry_after = retry_after
+
+
+class BoundedPool:
+    """Thread pool with a bounded backlog and wait/run-time metrics."""
+
+    def __init__(self, name: str, workers: int, queue_slots: int):
+        self.name = name
+        self.workers = max(1, workers)
+        self.queue_slots = max(0, queue_slots)
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"{name}-pool")
+
+        self._lock = threading.Lock()
+        self._in_flight = 0   # queued + running
+        self._running = 0
+        self._mean_task_s = 1.0  # EWMA, seeds the first Retry-After estimates
+        self._stats = {
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "wait_ms_total": 0.0,
+            "max_wait_ms": 0.0,
+            "task_ms_total": 0.0,
+        }
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.queue_slots
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free: the backlog drained at the mean task time."""
+        with self._lock:
+            backlog = max(1, self._in_flight - self.workers + 1)
+            estimate = self._mean_task_s * backlog / self.workers
+        return max(1, math.ceil(estimate))
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) on a pool thread and await its result.
+
+        Raises:
+            PoolSaturatedError: If every worker and queue slot is taken
+        """
+        self.acquire()
+
+        timing = _request_timing.get()
+        submitted = time.perf_counter()
+
+        def task():
+            started = time.perf_counter()
+            wait_ms = (started - submitted) * 1000
+            with self._lock:
+                self._running += 1
+                self._stats["wait_ms_total"] += wait_ms
+                self._stats["max_wait_ms"] = max(self._stats["max_wait_ms"], wait_ms)
+            if timing is not None:
+                timing["queue_wait_ms"] = timing.get("queue_wait_ms", 0.0) + wait_ms
+            if wait_ms > SLOW_QUEUE_WAIT_MS:
+                logger.info(f"⏳ {fn.__name__} waited {wait_ms:.0f} ms for a {self.name} worker")
+
+            ok = False
+            try:
+                result = fn(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self._running -= 1
+                    self._stats["completed" if ok else "failed"] += 1
+                    self._stats["task_ms_total"] += elapsed * 1000
+                    self._mean_task_s = 0.8 * self._mean_task_s + 0.2 * elapsed
+
+        # copy_context: the task sees the request's context variables
+        context = contextvars.copy_context()
+        future = self.executor.submit(context.run, task)
+        # Release the slot when the task finishes or is cancelled before it starts
+        future.add_done_callback(lambda _: self.release())
+        return await asyncio.wrap_future(future)
+
+    def acquire(self) -> None:
+        """
+        Take one worker/queue slot; every successful call needs one release().
+
+        Raises:
+            PoolSaturatedError: If every worker and queue slot is taken
+        """
+        with self._lock:
+            admitted = self._in_flight < self.capacity
+            if admitted:
+                self._in_flight += 1
+            else:
+                self._stats["rejected"] += 1
+        if not admitted:
+            retry_after = self.retry_after()
+            logger.warning(f"⚠️ {self.name} pool saturated ({self.capacity} tasks), rejecting with Retry-After {retry_after}s")
+            raise PoolSaturatedError(self.name, retry_after)
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def stats(self) -> Dict:
+        """Occupancy, rejection and wait-time metrics."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["running"] = self._running
+            stats["queued"] = self._in_flight - self._running
+        finished = stats["completed"] + stats["failed"]
+        wait_ms = stats.pop("wait_ms_total")
+        task_ms = stats.pop("task_ms_total")
+        stats["mean_wait_ms"] = round(wait_ms / finished, 2) if finished else 0.0
+        stats["max_wait_ms"] = round(stats["max_wait_ms"], 2)
+        stats["mean_task_ms"] = round(task_ms / finished, 2) if finished else 0.0
+        stats["workers"] = self.workers
+        stats["queue_slots"] = self.queue_slots
+        return stats
+
+
+# Global pool instances (lazy loaded)
+_pools: Dict[str, BoundedPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(name: str) -> BoundedPool:
+    """
+    Get or create a shared pool.
+
+    Args:
+        name: POOL_INFERENCE, POOL_PDF or POOL_IO
+
+    Returns:
+        BoundedPool: Shared pool instance
+    """
+    pool = _pools.get(name)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(name)
+            if pool is None:
+                workers, queue_slots = POOL_SETTINGS[name]
+                pool = BoundedPool(name, workers, queue_slots)
+                _pools[name] = pool
+                logger.info(f"✓ {name} pool: {pool.workers} workers, {pool.queue_slots} queue slots")
+    return pool
+
+
+async def run_blocking(pool: str, fn: Callable, *args, **kwargs) -> Any:
+    """
+    Offload blocking work from an async route to a bounded pool.
+
+    Args:
+        pool: POOL_INFERENCE, POOL_PDF or POOL_IO
+        fn: Blocking callable
+        *args, **kwargs: Passed to fn
+
+    Returns:
+        fn's return value (its exceptions propagate)
+
+    Raises:
+        PoolSaturatedError: 429 with Retry-After if the pool is full
+    """
+    return await get_pool(pool).run(fn, *args, **kwargs)
+
+
+def acquire_slot(pool: str) -> Callable[[], None]:
+    """
+    Admit work that runs outside the pool's threads against its capacity.
+
+    Streaming responses are iterated by the server, not submitted to a pool,
+    but still occupy the model for as long as they run; holding a slot keeps
+    them inside the same admission limit as run_blocking work.
+
+    Args:
+        pool: POOL_INFERENCE, POOL_PDF or POOL_IO
+
+    Returns:
+        Callable: Releases the slot; safe to call more than once
+
+    Raises:
+        PoolSaturatedError: 429 with Retry-After if the pool is full
+    """
+    bounded = get_pool(pool)
+    bounded.acquire()
+
+    lock = threading.Lock()
+    held = [True]
+
+    def release() -> None:
+        with lock:
+            if not held[0]:
+                return
+            held[0] = False
+        bounded.release()
+
+    return release
+
+
+def get_executor_stats() -> Dict[str, Dict]:
+    """
+    Metrics of every pool created so far.
+
+    Returns:
+        Dict: pool name -> BoundedPool.stats()
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+    return {pool.name: pool.stats() for pool in pools}
+
+
+async def queue_timing_middleware(request, call_next):
+    """Report the time a request spent waiting for pool workers (X-Queue-Wait-Ms, Server-Timing)."""
+    timing = {"queue_wait_ms": 0.0}
+    token = _request_timing.set(timing)
+    try:
+        response = await call_next(request)
+    finally:
+        _request_timing.reset(token)
+
+    wait_ms = timing["queue_wait_ms"]
+    response.headers["X-Queue-Wait-Ms"] = f"{wait_ms:.1f}"
+    response.headers["Server-Timing"] = f"queue;dur={wait_ms:.1f}"
+    return response
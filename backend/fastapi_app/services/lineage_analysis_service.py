@@ -4,63 +4,122 @@ from pathlib import Path
 import re
 import torch
 import logging
+import os
+import threading
 from typing import List, Dict, Any, Optional, Tuple
 
+from app.services.inference_batcher import INFERENCE_BATCHING, MicroBatcher
 from app.services.precedent_preprocessing_service import extract_act_contexts
 from fastapi_app.services.model_loader import model_loader
 
 PROCESSED_DATA_FILE = Path(__file__).parent.parent.parent / "processed_acts_data.json"
 
+# Act contexts per lineage forward pass
+LINEAGE_BATCH_SIZE = int(os.getenv("LINEAGE_BATCH_SIZE", "16"))
+
 logger = logging.getLogger(__name__)
 
+# Global batcher instance (lazy loaded)
+_lineage_batcher = None
+_lineage_batcher_lock = threading.Lock()
+
 def is_model_loaded() -> bool:
     """Check if the lineage model is loaded."""
     return model_loader.has_lineage_model()
 
-def predict_treatment(context: str) -> Tuple[Optional[str], Optional[float]]:
+def _predict_lineage_features(features: List[Dict[str, List[int]]]) -> List[Tuple[str, float]]:
     """
-    Predicts the treatment (FOLLOWED, OVERRULED, etc.) for a given context.
-    Returns (label, confidence) or (None, None) if model not loaded.
-    Matches the EXACT logic from your working test script.
+    Run tokenized contexts through the lineage model in length-sorted, padded batches.
+    Returns (label, confidence) per context, in input order.
+    """
+    model, tokenizer = model_loader.get_lineage_model()
+    
+    # Get the id2label mapping directly from model config
+    id2label = model.config.id2label
+    
+    order = sorted(range(len(features)), key=lambda i: len(features[i]["input_ids"]))
+    results: List[Tuple[str, float]] = [None] * len(features)
+    
+    with torch.no_grad():
+        for start in range(0, len(order), LINEAGE_BATCH_SIZE):
+            batch_idx = order[start:start + LINEAGE_BATCH_SIZE]
+            batch = tokenizer.pad([features[i] for i in batch_idx], padding=True, return_tensors="pt")
+            
+            # Move inputs to the same device as model
+            inputs = {k: v.to(model.device) for k, v in batch.items()}
+            
+            outputs = model(**inputs)
+            probs = torch.softmax(outputs.logits, dim=-1)
+            confidences, pred_ids = probs.max(dim=-1)
+            
+            for row, i in enumerate(batch_idx):
+                results[i] = (id2label[int(pred_ids[row])], float(confidences[row]))
+    
+    return results
+
+
+def get_lineage_batcher() -> Optional[MicroBatcher]:
+    """
+    Get or create the lineage model batcher (None if batching is disabled).
+    
+    Returns:
+        MicroBatcher: Shared batcher that coalesces concurrent lineage requests
+    """
+    global _lineage_batcher
+    
+    if _lineage_batcher is None and INFERENCE_BATCHING:
+        with _lineage_batcher_lock:
+            if _lineage_batcher is None:
+                _lineage_batcher = MicroBatcher(
+                    "lineage", _predict_lineage_features, max_batch_size=LINEAGE_BATCH_SIZE
+                )
+    
+    return _lineage_batcher
+
+
+def predict_treatments(contexts: List[str]) -> List[Tuple[Optional[str], Optional[float]]]:
+    """
+    Predicts the treatment (FOLLOWED, OVERRULED, etc.) for each context.
+    Returns (label, confidence) per context; (None, None) for every context
+    if the model is not loaded, and for the contexts of a sub-batch of
+    LINEAGE_BATCH_SIZE whose inference failed.
     """
     if not model_loader.has_lineage_model():
         logger.error("Model not loaded. Cannot predict treatment.")
-        return None, None
+        return [(None, None)] * len(contexts)
+    if not contexts:
+        return []
 
-    try:
-        model, tokenizer = model_loader.get_lineage_model()
-        
-        # Get the id2label mapping directly from model config
-        id2label = model.config.id2label
-        logger.debug(f"Label mapping: {id2label}")
-        
-        # Tokenize exactly like your test script
-        inputs = tokenizer(
-            context,
-            truncation=True,
-            padding="max_length",
-            max_length=256,
-            return_tensors="pt"
-        )
-        
-        # Move inputs to the same device as model
-        inputs = {k: v.to(model.device) for k, v in inputs.items()}
-        
-        with torch.no_grad():
-            outputs = model(**inputs)
-            probs = torch.softmax(outputs.logits, dim=-1)
-            pred_id = torch.argmax(probs).item()
-            confidence = probs[0][pred_id].item()
-        
-        # Use integer key directly (exactly like your test script)
-        label = id2label[pred_id]
-        
-        logger.debug(f"Prediction: {label} (confidence: {confidence:.3f})")
-        return label, confidence
+    _, tokenizer = model_loader.get_lineage_model()
+    batcher = get_lineage_batcher()
+    predictions: List[Tuple[Optional[str], Optional[float]]] = []
+
+    for start in range(0, len(contexts), LINEAGE_BATCH_SIZE):
+        chunk = list(contexts[start:start + LINEAGE_BATCH_SIZE])
+        try:
+            # Tokenize like the test script, but unpadded: batches are padded to their longest context
+            encodings = tokenizer(chunk, truncation=True, max_length=256)
+            model_keys = [k for k in ("input_ids", "token_type_ids", "attention_mask") if k in encodings]
+            features = [{k: encodings[k][i] for k in model_keys} for i in range(len(chunk))]
+            
+            chunk_predictions = batcher.submit(features) if batcher is not None else _predict_lineage_features(features)
+        except Exception as e:
+            logger.error(f"Error during treatment prediction (contexts {start}-{start + len(chunk) - 1}): {e}")
+            chunk_predictions = [(None, None)] * len(chunk)
         
-    except Exception as e:
-        logger.error(f"Error during treatment prediction: {e}")
-        return None, None
+        for label, confidence in chunk_predictions:
+            if label is not None:
+                logger.debug(f"Prediction: {label} (confidence: {confidence:.3f})")
+        predictions.extend(chunk_predictions)
+
+    return predictions
+
+def predict_treatment(context: str) -> Tuple[Optional[str], Optional[float]]:
+    """
+    Predicts the treatment (FOLLOWED, OVERRULED, etc.) for a given context.
+    Returns (label, confidence) or (None, None) if model not loaded.
+    """
+    return predict_treatments([context])[0]
 
 def analyze_judgment_lineage(judgment_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
@@ -83,7 +142,8 @@ def analyze_judgment_lineage(judgment_data: Dict[str, Any]) -> List[Dict[str, An
 
     logger.info(f"Analyzing lineage for case '{case_id}' with {len(acts_list)} acts.")
 
-    results = []
+    # Collect the contexts of every act first so they share forward passes
+    act_contexts = []
     for act in acts_list:
         logger.info(f"\n--- Analyzing act: {act} ---")
         
@@ -93,20 +153,22 @@ def analyze_judgment_lineage(judgment_data: Dict[str, Any]) -> List[Dict[str, An
         
         for i, ctx in enumerate(contexts[:3]):  # Limit to first 3 contexts
             logger.info(f"   Context {i+1} (first 100 chars): {ctx[:100]}...")
-            
-            # Get prediction (exactly like test script)
-            label, conf = predict_treatment(ctx)
-            
-            if label and conf is not None:
-                results.append({
-                    "case": case_id,
-                    "act": act,
-                    "treatment": label,
-                    "confidence": round(conf, 3)
-                })
-                logger.info(f"   ✅ {act} → {label} (conf: {conf:.3f})")
-            else:
-                logger.warning(f"   ❌ Prediction failed for act: {act}")
+            act_contexts.append((act, ctx))
+    
+    predictions = predict_treatments([ctx for _, ctx in act_contexts])
+    
+    results = []
+    for (act, _), (label, conf) in zip(act_contexts, predictions):
+        if label and conf is not None:
+            results.append({
+                "case": case_id,
+                "act": act,
+                "treatment": label,
+                "confidence": round(conf, 3)
+            })
+            logger.info(f"   ✅ {act} → {label} (conf: {conf:.3f})")
+        else:
+            logger.warning(f"   ❌ Prediction failed for act: {act}")
 
     logger.info(f"Analysis complete. Generated {len(results)} treatment entries.")
     return results
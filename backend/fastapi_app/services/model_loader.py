@@ -14,6 +14,8 @@ from transformers import (
 )
 import torch
 
+from app.services.onnx_inference import BACKEND_PYTORCH, INFERENCE_BACKEND, INFERENCE_BACKENDS, load_onnx_model
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -30,7 +32,17 @@ class ModelLoader:
     
     def __init__(self):
         if not self._models_loaded:
-            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+            # pytorch / onnx / onnx_int8 (ML_INFERENCE_BACKEND)
+            self.inference_backend = INFERENCE_BACKEND
+            
+            # ONNX Runtime sessions are CPU-only, so keep every model (and the
+            # inputs callers move to get_device()) on the CPU with that backend
+            if self.inference_backend in INFERENCE_BACKENDS and self.inference_backend != BACKEND_PYTORCH:
+                self.device = torch.device("cpu")
+                if torch.cuda.is_available():
+                    logger.warning(f"⚠️ ML_INFERENCE_BACKEND={self.inference_backend} runs on CPU; CUDA is not used")
+            else:
+                self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
             logger.info(f"Using device: {self.device}")
             
             # Get model paths - go up to backend/, then into app/ml_models/
@@ -69,6 +81,10 @@ class ModelLoader:
                 ).to(self.device)
                 self.segmentation_model.eval()
                 self.segmentation_labels = self.segmentation_model.config.id2label
+                self.segmentation_model = self._select_backend(
+                    self.segmentation_model, self.segmentation_tokenizer,
+                    self.segmentation_path, per_token_output=True
+                )
                 logger.info("✓ Clause segmentation model loaded successfully")
             else:
                 logger.warning(f"Segmentation model not found at {self.segmentation_path}")
@@ -86,6 +102,9 @@ class ModelLoader:
                 ).to(self.device)
                 self.classification_model.eval()
                 self.classification_labels = self.classification_model.config.id2label
+                self.classification_model = self._select_backend(
+                    self.classification_model, self.classification_tokenizer, self.classification_path
+                )
                 logger.info("✓ Risk classification model loaded successfully")
             else:
                 logger.warning(f"Classification model not found at {self.classification_path}")
@@ -102,6 +121,9 @@ class ModelLoader:
                 ).to(self.device)
                 self.lineage_model.eval()
                 self.lineage_labels = self.lineage_model.config.id2label
+                self.lineage_model = self._select_backend(
+                    self.lineage_model, self.lineage_tokenizer, self.lineage_path
+                )
                 logger.info("✓ Act treatment lineage model loaded successfully")
                 logger.info(f"  Available treatment labels: {list(self.lineage_labels.values())}")
             else:
@@ -127,6 +149,23 @@ class ModelLoader:
             # Don't raise - allow server to start without models
             logger.warning("Server will continue without ML models")
     
+    def _select_backend(self, model, tokenizer, model_path: Path, per_token_output: bool = False):
+        """
+        Return the model served by the configured inference backend.
+        
+        With an ONNX backend the PyTorch model is exported (and quantized) once
+        and replaced by an ONNX Runtime wrapper with the same call interface;
+        on any failure the PyTorch model is kept.
+        """
+        if self.inference_backend == BACKEND_PYTORCH:
+            return model
+        dummy_inputs = tokenizer("The appeal is allowed with costs.", return_tensors="pt")
+        onnx_model = load_onnx_model(
+            model, dummy_inputs, model_path,
+            backend=self.inference_backend, per_token_output=per_token_output
+        )
+        return onnx_model if onnx_model is not None else model
+    
     def get_segmentation_model(self):
         """Get the clause segmentation model and tokenizer."""
         if self.segmentation_model is None:
@@ -161,6 +200,10 @@ class ModelLoader:
         """Get the current device (CPU/GPU)."""
         return self.device
     
+    def get_inference_backend(self):
+        """Get the configured inference backend (pytorch / onnx / onnx_int8)."""
+        return self.inference_backend
+    
     def get_labels(self):
         """Get label mappings for both models."""
         return {
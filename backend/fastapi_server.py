@@ -18,6 +18,7 @@ from fastapi_app.api.clause_routes import router as clause_router
 from fastapi_app.api.pdf_routes import router as pdf_router
 from fastapi_app.api.lineage_routes import router as lineage_router
 from fastapi_app.api.translation_routes import router as translation_router, preload_models as preload_translation_models
+from fastapi_app.services.executor import get_executor_stats, queue_timing_middleware
 
 # Configure logging
 logging.basicConfig(
@@ -42,8 +43,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After", "X-Queue-Wait-Ms", "Server-Timing"],
 )
 
+# Report per-request queue wait for work offloaded to the shared pools
+app.middleware("http")(queue_timing_middleware)
+
 # Include routers
 app.include_router(classification_router, prefix="/api", tags=["classification"])
 app.include_router(clause_router, prefix="/api", tags=["clause_detection"])
@@ -87,7 +92,16 @@ async def startup_event():
     import threading
     threading.Thread(target=preload_translation_models, daemon=True).start()
     logger.info("✓ Translation model loading initiated (background)")
-    
+
+    # Re-queue translation jobs persisted by the previous run
+    try:
+        from app.services.translation_scheduler import get_translation_scheduler
+        translation_scheduler = get_translation_scheduler()
+        queued = sum(model["queued"] for model in translation_scheduler.stats()["models"].values())
+        logger.info(f"✓ Translation scheduler ready ({queued} queued jobs)")
+    except Exception as e:
+        logger.warning(f"⚠ Translation scheduler unavailable: {str(e)}")
+
     # Log clause prediction configuration
     prediction_mode = os.getenv("CLAUSE_PREDICTION_MODE", "manual")
     openai_key = os.getenv("OPENAI_API_KEY", "")
@@ -161,7 +175,9 @@ async def root():
                     "classify_file": "/api/classify/file",
                     "analyze_clauses": "/api/analyze-clauses",
                     "list_clauses": "/api/clauses/list",
-                    "health": "/api/health"
+                    "health": "/api/health",
+                    "inference_batching": "/api/inference/batching",
+                    "executor_stats": "/api/executor/stats"
                 },
                 "lineage_analysis": {
                     "upload_and_analyze": "/api/lineage/analyze-lineage",
@@ -185,6 +201,23 @@ async def ping():
     return {"status": "ok"}
 
 
+@app.get("/api/inference/batching")
+async def inference_batching_stats():
+    """Request-coalescing metrics (queue depth, batch sizes, wait times) per model."""
+    from app.services.inference_batcher import INFERENCE_BATCHING, INFERENCE_BATCH_WINDOW_MS, get_batcher_stats
+    return {
+        "enabled": INFERENCE_BATCHING,
+        "window_ms": INFERENCE_BATCH_WINDOW_MS,
+        "models": get_batcher_stats()
+    }
+
+
+@app.get("/api/executor/stats")
+async def executor_stats():
+    """Occupancy, rejections (429s) and queue wait times of the inference / pdf / io pools."""
+    return {"pools": get_executor_stats()}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
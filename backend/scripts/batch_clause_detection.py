@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Batch Clause Detection
+Runs clause detection over a whole corpus of judgment texts in parallel and
+streams one JSON record per document to a JSONL file, so pattern changes can
+be re-validated against every judgment without going through the HTTP API.
+
+Documents are fanned out across a process pool. Each record is written (and
+flushed) as soon as its document finishes, so an interrupted run can be
+resumed: documents already present in the output file are skipped. Documents
+that failed are retried on the next run.
+
+At the end the script reports throughput (docs/sec), status counts and
+per-clause detection time (regex mode).
+
+Usage:
+    python scripts/batch_clause_detection.py
+    python scripts/batch_clause_detection.py --input path/to/texts --output results.jsonl --workers 8
+    python scripts/batch_clause_detection.py --mode hybrid --workers 2
+    python scripts/batch_clause_detection.py --no-resume
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from tqdm import tqdm
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.clause_patterns import CLAUSE_DEFINITIONS
+
+# Set in every worker process by _init_worker
+_MODE = None
+
+
+def _init_worker(mode: str):
+    """Pool initializer: silence per-clause INFO logging and pick the detector."""
+    global _MODE
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+    _MODE = mode
+
+
+def process_document(path: str, rel_name: str) -> dict:
+    """Detect clauses in one document (runs in a worker process).
+
+    Returns:
+        JSONL record for the document; contains "error" if detection failed
+    """
+    t0 = time.perf_counter()
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            text = f.read()
+
+        clause_timings = {}
+        if _MODE == 'hybrid':
+            from app.services.hybrid_clause_detection_service import analyze_with_hybrid_detection
+            analysis = analyze_with_hybrid_detection(text)
+            # Merged results use 'clause'; regex-only fallback keeps 'clause_key'
+            clauses = {
+                c.get('clause', c.get('clause_key')): c['status']
+                for c in analysis.get('clauses', [])
+            }
+        else:
+            from app.services.clause_patterns import detect_all_clauses
+            results = detect_all_clauses(text, timings=clause_timings)
+            clauses = {r['clause_key']: r['status'] for r in results}
+
+        return {
+            'file': rel_name,
+            'chars': len(text),
+            'elapsed_ms': round((time.perf_counter() - t0) * 1000, 3),
+            'clauses': clauses,
+            'clause_timings_ms': {k: round(v * 1000, 3) for k, v in clause_timings.items()},
+        }
+    except Exception as e:
+        return {
+            'file': rel_name,
+            'error': f"{type(e).__name__}: {e}",
+            'elapsed_ms': round((time.perf_counter() - t0) * 1000, 3),
+        }
+
+
+def load_completed(output_path: Path) -> set:
+    """Return the files already processed successfully in an earlier run.
+
+    A run killed mid-write can leave a truncated last line; unreadable lines
+    and failed documents are dropped from the file so they are redone.
+    """
+    if not output_path.exists():
+        return set()
+
+    completed = set()
+    kept = []
+    dropped = 0
+    with open(output_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                dropped += 1
+                continue
+            if 'error' in record or 'file' not in record:
+                dropped += 1
+                continue
+            completed.add(record['file'])
+            kept.append(line if line.endswith('\n') else line + '\n')
+
+    if dropped:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.writelines(kept)
+        print(f"⚠️ Dropped {dropped} incomplete/failed records from {output_path.name}; they will be retried")
+    return completed
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def print_report(records, wall_time: float, workers: int):
+    """Print throughput, status counts and per-clause timing for this run."""
+    ok = [r for r in records if 'error' not in r]
+    failed = len(records) - len(ok)
+
+    print(f"\n{'=' * 80}")
+    print(f"Documents processed: {len(records)} ({failed} failed) with {workers} workers")
+    print(f"Wall time:           {wall_time:.2f} s")
+    if records and wall_time > 0:
+        print(f"Throughput:          {len(records) / wall_time:.1f} docs/sec")
+    if ok:
+        latencies = [r['elapsed_ms'] for r in ok]
+        print(f"Per doc:             mean {statistics.mean(latencies):.1f} ms | "
+              f"p95 {percentile(latencies, 95):.1f} ms | max {max(latencies):.1f} ms")
+
+    status_counts = defaultdict(Counter)
+    clause_times = defaultdict(list)
+    for record in ok:
+        for clause_key, status in record['clauses'].items():
+            status_counts[clause_key][status] += 1
+        for clause_key, ms in record.get('clause_timings_ms', {}).items():
+            clause_times[clause_key].append(ms)
+
+    if not ok:
+        return
+
+    has_timings = bool(clause_times)
+    header = f"\n{'Clause':<24} {'Present':>8} {'Missing':>8} {'Corrupt':>8} {'Timeout':>8} {'Truncated':>9}"
+    if has_timings:
+        header += f" {'Mean ms':>9} {'p95 ms':>9} {'Max ms':>9}"
+    print(header)
+    print("-" * (len(header) - 1))
+    for clause_key in CLAUSE_DEFINITIONS:
+        counts = status_counts[clause_key]
+        row = (f"{clause_key:<24} {counts['Present']:>8} {counts['Missing']:>8} "
+               f"{counts['Corrupted']:>8} {counts['Timeout']:>8} {counts['Truncated']:>9}")
+        times = clause_times.get(clause_key)
+        if times:
+            row += f" {statistics.mean(times):>9.3f} {percentile(times, 95):>9.3f} {max(times):>9.3f}"
+        print(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run clause detection over a corpus in parallel and write JSONL results'
+    )
+    parser.add_argument(
+        '--input',
+        type=str,
+        default=os.path.join(os.path.dirname(__file__), '..', 'app', 'casefiles'),
+        help='Directory containing judgment .txt files, searched recursively (default: casefiles folder)'
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default='clause_detection_results.jsonl',
+        help='JSONL file to append results to (default: clause_detection_results.jsonl)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Worker processes (default: CPU count)'
+    )
+    parser.add_argument(
+        '--mode',
+        choices=['regex', 'hybrid'],
+        default='regex',
+        help='regex: detect_all_clauses; hybrid: ML + regex service (loads the model in every worker)'
+    )
+    parser.add_argument('--limit', type=int, default=None, help='Only process the first N pending files')
+    parser.add_argument('--no-resume', action='store_true', help='Overwrite the output instead of resuming')
+
+    args = parser.parse_args()
+
+    input_dir = Path(args.input)
+    if not input_dir.exists():
+        print(f"Error: Input directory not found - {input_dir}")
+        return 1
+
+    files = sorted(input_dir.rglob('*.txt'))
+    if not files:
+        print(f"No .txt files found in {input_dir}")
+        return 0
+
+    output_path = Path(args.output)
+    if args.no_resume and output_path.exists():
+        output_path.unlink()
+    completed = load_completed(output_path)
+
+    pending = [p for p in files if p.relative_to(input_dir).as_posix() not in completed]
+    if args.limit:
+        pending = pending[:args.limit]
+
+    print(f"Found {len(files)} files | {len(completed)} already done | {len(pending)} to process")
+    if not pending:
+        print("✅ Nothing to do")
+        return 0
+
+    workers = max(1, min(args.workers, len(pending)))
+    records = []
+    t0 = time.perf_counter()
+
+    with open(output_path, 'a', encoding='utf-8') as out, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                initargs=(args.mode,)) as pool:
+        futures = [
+            pool.submit(process_document, str(path), path.relative_to(input_dir).as_posix())
+            for path in pending
+        ]
+        try:
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Detecting clauses"):
+                record = future.result()
+                out.write(json.dumps(record, ensure_ascii=False) + '\n')
+                out.flush()
+                records.append(record)
+                if 'error' in record:
+                    tqdm.write(f"❌ {record['file']}: {record['error']}")
+        except KeyboardInterrupt:
+            for future in futures:
+                future.cancel()
+            print(f"\n⚠️ Interrupted - {len(records)} results saved; rerun to resume")
+            print_report(records, time.perf_counter() - t0, workers)
+            return 130
+
+    print_report(records, time.perf_counter() - t0, workers)
+    print(f"\n✅ Results written to {output_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
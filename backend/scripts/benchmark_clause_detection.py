@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Clause Detection Micro-benchmark
+Times detect_all_clauses() per document over a directory of judgment texts.
+
+Usage:
+    python scripts/benchmark_clause_detection.py
+    python scripts/benchmark_clause_detection.py --input path/to/texts --repeat 10
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.clause_patterns import detect_all_clauses
+
+
+def load_texts(input_dir: Path, limit: int = None):
+    """Load every .txt judgment in input_dir as (name, text) pairs."""
+    texts = []
+    for path in sorted(input_dir.glob('*.txt')):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            texts.append((path.name, f.read()))
+        if limit and len(texts) >= limit:
+            break
+    return texts
+
+
+def time_document(text: str, repeat: int) -> float:
+    """Return the best-of-`repeat` wall time (seconds) for one document."""
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        detect_all_clauses(text)
+        timings.append(time.perf_counter() - t0)
+    return min(timings)
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark per-document latency of regex clause detection'
+    )
+    parser.add_argument(
+        '--input',
+        type=str,
+        default=os.path.join(os.path.dirname(__file__), '..', 'app', 'casefiles'),
+        help='Directory containing judgment .txt files (default: casefiles folder)'
+    )
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per document (best time is kept)')
+    parser.add_argument('--warmup', type=int, default=1, help='Untimed passes over the corpus first')
+    parser.add_argument('--limit', type=int, default=None, help='Only benchmark the first N files')
+    parser.add_argument('--verbose', action='store_true', help='Print the timing of every document')
+
+    args = parser.parse_args()
+
+    # detect_all_clauses logs every clause at INFO; keep that out of the timings
+    logging.basicConfig(level=logging.WARNING)
+
+    input_dir = Path(args.input)
+    if not input_dir.exists():
+        print(f"Error: Input directory not found - {input_dir}")
+        return 1
+
+    texts = load_texts(input_dir, args.limit)
+    if not texts:
+        print(f"No .txt files found in {input_dir}")
+        return 0
+
+    for _ in range(args.warmup):
+        for _, text in texts:
+            detect_all_clauses(text)
+
+    latencies = []
+    total_chars = 0
+    for name, text in texts:
+        elapsed = time_document(text, args.repeat)
+        latencies.append(elapsed)
+        total_chars += len(text)
+        if args.verbose:
+            print(f"  {name:<50} {len(text):>8} chars  {elapsed * 1000:8.2f} ms")
+
+    total = sum(latencies)
+    print(f"Documents:        {len(texts)} ({total_chars:,} chars)")
+    print(f"Mean per doc:     {statistics.mean(latencies) * 1000:.2f} ms")
+    print(f"Median per doc:   {statistics.median(latencies) * 1000:.2f} ms")
+    print(f"p95 per doc:      {percentile(latencies, 95) * 1000:.2f} ms")
+    print(f"Max per doc:      {max(latencies) * 1000:.2f} ms")
+    print(f"Throughput:       {len(texts) / total:.1f} docs/sec")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
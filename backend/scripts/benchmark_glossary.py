@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Glossary Matching Benchmark
+Compares the old brute-force glossary matching with the Aho-Corasick
+GlossaryMatcher over the sections of a directory of judgment texts:
+
+  substring  - one `term in text` test per term (old sectioning / keyword tagging)
+  regex      - one compiled \\b...\\b regex per term (old correction lookup)
+  automaton  - one pass of the glossary automaton (all three call sites now)
+
+Each is timed per section for growing slices of the glossary: the brute-force
+columns grow with the number of terms, the automaton column stays flat
+(it depends on the section length only). Also reports how often the
+correction-step term sets differ between the regex and automaton versions
+(overlapping matches are now resolved leftmost-longest).
+
+Usage:
+    python scripts/benchmark_glossary.py
+    python scripts/benchmark_glossary.py --limit 2 --sizes 1000 3000 9000
+"""
+
+import argparse
+import logging
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.glossary_matcher import GLOSSARY_PATH, GlossaryMatcher, _read_terms
+
+
+def load_sections(input_dir: Path, limit: int = None):
+    """Paragraph-level sections (as _split_into_sections produces them)."""
+    sections = []
+    for i, path in enumerate(sorted(input_dir.glob('*.txt'))):
+        if limit and i >= limit:
+            break
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            text = f.read()
+        sections.extend(p.strip() for p in re.split(r"\n\s*\n", text) if p.strip())
+    return sections
+
+
+def substring_terms(section, terms):
+    lower = section.lower()
+    return [t for t in terms if t in lower]
+
+
+def regex_terms(section, terms):
+    """The old _find_terms_with_word_boundaries (term map keys only)."""
+    lower = section.lower()
+    found = []
+    covered = set()
+    for term in sorted(terms, key=len, reverse=True):
+        if len(term) < 4:
+            continue
+        for m in re.finditer(r'\b' + re.escape(term) + r'\b', lower):
+            span = (m.start(), m.end())
+            if any(span[0] >= c[0] and span[1] <= c[1] for c in covered):
+                continue
+            covered.add(span)
+            found.append(term)
+            break
+    return found
+
+
+def time_per_section(fn, sections):
+    t0 = time.perf_counter()
+    results = [fn(section) for section in sections]
+    return (time.perf_counter() - t0) * 1000 / len(sections), results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark brute-force vs Aho-Corasick glossary matching (ms/section)'
+    )
+    parser.add_argument(
+        '--input',
+        type=str,
+        default=os.path.join(os.path.dirname(__file__), '..', 'app', 'casefiles'),
+        help='Directory containing judgment .txt files (default: casefiles folder)'
+    )
+    parser.add_argument('--limit', type=int, default=1, help='Only use the first N files (the regex column is slow)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 2000, 5000, 0],
+                        help='Glossary sizes to test (0 = full glossary)')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    input_dir = Path(args.input)
+    if not input_dir.exists():
+        print(f"Error: Input directory not found - {input_dir}")
+        return 1
+    if not GLOSSARY_PATH.exists():
+        print(f"Error: Glossary not found - {GLOSSARY_PATH}")
+        return 1
+
+    sections = load_sections(input_dir, args.limit)
+    if not sections:
+        print(f"No .txt files found in {input_dir}")
+        return 0
+
+    all_terms = list(dict.fromkeys(t.strip().lower() for t in _read_terms(GLOSSARY_PATH) if t.strip()))
+    mean_chars = sum(len(s) for s in sections) / len(sections)
+    print(f"Sections: {len(sections)} (mean {mean_chars:.0f} chars) | Glossary terms: {len(all_terms)}")
+
+    print(f"\n{'Terms':>7} {'Build ms':>9} {'Substring':>10} {'Regex':>9} {'Automaton':>10} "
+          f"{'Speedup':>8} {'Diff secs':>10}")
+    print("-" * 70)
+    for size in args.sizes:
+        terms = all_terms[:size] if size else all_terms
+
+        t0 = time.perf_counter()
+        matcher = GlossaryMatcher(terms)
+        build_ms = (time.perf_counter() - t0) * 1000
+
+        substring_ms, _ = time_per_section(lambda s: substring_terms(s, terms), sections)
+        regex_ms, regex_found = time_per_section(lambda s: regex_terms(s, terms), sections)
+        automaton_ms, automaton_found = time_per_section(
+            lambda s: sorted(matcher.find_terms(s, min_length=4), key=len, reverse=True), sections
+        )
+
+        differing = sum(1 for a, b in zip(regex_found, automaton_found) if set(a) != set(b))
+        print(f"{len(terms):>7} {build_ms:>9.0f} {substring_ms:>10.3f} {regex_ms:>9.3f} {automaton_ms:>10.3f} "
+              f"{(substring_ms + regex_ms) / automaton_ms:>8.1f} {differing:>10}")
+
+    print("\n(ms per section; speedup = (substring + regex) / automaton)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
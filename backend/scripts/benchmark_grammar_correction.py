@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Grammar Correction Benchmark
+Compares the old rule-by-rule Sinhala/Tamil grammar correction (re.sub per
+string pattern, then `in` / str.replace per phrase) with the compiled
+GrammarRuleEngine over a batch of translated judgment sections, and checks
+that both produce the same text and the same correction counts.
+
+Also times the phrase-correction lookup both ways: one `in` test per phrase
+(what the engine keeps) vs one Aho-Corasick pass (GlossaryMatcher) over the
+section for all phrases at once.
+
+Sections come from (first available):
+  --input DIR  - translated .txt files, split into paragraphs; the language
+                 of each file is detected from its script
+  job store    - translated sections of completed translation jobs
+  synthetic    - generated Sinhala and Tamil sections seeded with the mBART
+                 artifacts the rules target (duplicated words, punctuation
+                 spacing, known mistranslated phrases)
+
+Usage:
+    python scripts/benchmark_grammar_correction.py
+    python scripts/benchmark_grammar_correction.py --input path/to/translations --repeat 5
+    python scripts/benchmark_grammar_correction.py --synthetic 2000
+"""
+
+import argparse
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.glossary_matcher import GlossaryMatcher
+from app.services.translation_correction_service import (
+    SINHALA_GRAMMAR_RULES,
+    SINHALA_PHRASE_CORRECTIONS,
+    TAMIL_GRAMMAR_RULES,
+    TAMIL_PHRASE_CORRECTIONS,
+    apply_sinhala_grammar_correction,
+    apply_tamil_grammar_correction,
+)
+
+LEGACY_TABLES = {
+    "si": (SINHALA_GRAMMAR_RULES, SINHALA_PHRASE_CORRECTIONS),
+    "ta": (TAMIL_GRAMMAR_RULES, TAMIL_PHRASE_CORRECTIONS),
+}
+ENGINE_FUNCTIONS = {
+    "si": apply_sinhala_grammar_correction,
+    "ta": apply_tamil_grammar_correction,
+}
+
+
+def legacy_correction(text, lang):
+    """The previous apply_*_grammar_correction loops."""
+    rules, phrases = LEGACY_TABLES[lang]
+    if not text or not isinstance(text, str):
+        return text, 0
+    corrected = text
+    corrections_count = 0
+    for pattern, replacement in rules:
+        new_text = re.sub(pattern, replacement, corrected)
+        if new_text != corrected:
+            corrections_count += 1
+            corrected = new_text
+    for incorrect, correct in phrases.items():
+        if incorrect in corrected:
+            corrected = corrected.replace(incorrect, correct)
+            corrections_count += 1
+    return corrected.strip(), corrections_count
+
+
+def detect_language(text):
+    sinhala = sum(1 for ch in text if '\u0d80' <= ch <= '\u0dff')
+    tamil = sum(1 for ch in text if '\u0b80' <= ch <= '\u0bff')
+    if not sinhala and not tamil:
+        return None
+    return "si" if sinhala >= tamil else "ta"
+
+
+def load_input_sections(input_dir: Path):
+    sections = []
+    for path in sorted(input_dir.glob('*.txt')):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            text = f.read()
+        lang = detect_language(text)
+        if lang:
+            sections.extend((lang, p.strip()) for p in re.split(r"\n\s*\n", text) if p.strip())
+    return sections
+
+
+def load_job_sections(limit: int):
+    from app.services.translation_job_store import get_job_store
+
+    store = get_job_store()
+    sections = []
+    for summary in store.list_recent(limit):
+        lang = summary.get("target_language")
+        if summary.get("status") != "completed" or lang not in LEGACY_TABLES:
+            continue
+        job = store.load(summary["job_id"]) or {}
+        sections.extend(
+            (lang, s["translated_content"]) for s in job.get("translated_sections", [])
+            if s.get("translated_content") and s["translated_content"] != "[Skipped]"
+        )
+    return sections
+
+
+def synthetic_sections(count: int, seed: int = 13):
+    """Sections built from the correction tables' own vocabulary plus typical artifacts."""
+    rng = random.Random(seed)
+    sections = []
+    for lang, (rules, phrases) in LEGACY_TABLES.items():
+        words = sorted({w for text in list(phrases) + list(phrases.values()) for w in text.split()})
+        words += sorted({r for _, r in rules if '\\' not in r and r.strip()})
+        artifacts = list(phrases) + [f"{w} {w}" for w in rng.sample(words, min(20, len(words)))]
+        artifacts += ["  ", " ,", ".", ";x", "12 වැනි වැනි" if lang == "si" else "12 வது வது"]
+        for _ in range(count // 2):
+            tokens = []
+            for _ in range(rng.randint(20, 80)):
+                tokens.append(rng.choice(artifacts) if rng.random() < 0.08 else rng.choice(words))
+            sections.append((lang, " ".join(tokens) + "."))
+    rng.shuffle(sections)
+    return sections
+
+
+def run(fn, sections, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        results = [fn(text, lang) for lang, text in sections]
+    return (time.perf_counter() - t0) * 1000 / repeat, results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark rule-by-rule vs compiled Sinhala/Tamil grammar correction'
+    )
+    parser.add_argument('--input', type=str, default=None,
+                        help='Directory of translated Sinhala/Tamil .txt files')
+    parser.add_argument('--jobs', type=int, default=50, help='Recent completed jobs to read from the job store')
+    parser.add_argument('--synthetic', type=int, default=0,
+                        help='Use N generated sections instead of real translations')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes over the batch')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.synthetic:
+        sections, source = synthetic_sections(args.synthetic), "synthetic"
+    elif args.input:
+        input_dir = Path(args.input)
+        if not input_dir.exists():
+            print(f"Error: Input directory not found - {input_dir}")
+            return 1
+        sections, source = load_input_sections(input_dir), str(input_dir)
+    else:
+        sections, source = load_job_sections(args.jobs), "job store"
+        if not sections:
+            print("No completed Sinhala/Tamil jobs in the job store, using 1000 synthetic sections")
+            sections, source = synthetic_sections(1000), "synthetic"
+
+    if not sections:
+        print(f"No Sinhala/Tamil sections found in {source}")
+        return 0
+
+    mean_chars = sum(len(text) for _, text in sections) / len(sections)
+    by_lang = {lang: sum(1 for l, _ in sections if l == lang) for lang in LEGACY_TABLES}
+    print(f"Sections: {len(sections)} from {source} (si: {by_lang['si']}, ta: {by_lang['ta']}, "
+          f"mean {mean_chars:.0f} chars)")
+
+    legacy_ms, legacy_results = run(legacy_correction, sections, args.repeat)
+    engine_ms, engine_results = run(lambda text, lang: ENGINE_FUNCTIONS[lang](text), sections, args.repeat)
+
+    text_diffs = sum(1 for a, b in zip(legacy_results, engine_results) if a[0] != b[0])
+    count_diffs = sum(1 for a, b in zip(legacy_results, engine_results) if a[1] != b[1])
+    corrections = sum(count for _, count in engine_results)
+
+    print(f"\n{'Implementation':<16} {'Batch ms':>10} {'ms/section':>11}")
+    print("-" * 40)
+    print(f"{'rule-by-rule':<16} {legacy_ms:>10.1f} {legacy_ms / len(sections):>11.4f}")
+    print(f"{'compiled':<16} {engine_ms:>10.1f} {engine_ms / len(sections):>11.4f}")
+    print(f"\nSpeedup: {legacy_ms / engine_ms:.1f}x | corrections: {corrections} | "
+          f"differing texts: {text_diffs} | differing counts: {count_diffs}")
+
+    # Phrase lookup only
+    phrase_lists = {lang: list(phrases) for lang, (_, phrases) in LEGACY_TABLES.items()}
+    automata = {lang: GlossaryMatcher(terms) for lang, terms in phrase_lists.items()}
+    substring_ms, _ = run(lambda text, lang: [p for p in phrase_lists[lang] if p in text], sections, args.repeat)
+    automaton_ms, _ = run(lambda text, lang: automata[lang].find_all(text), sections, args.repeat)
+    print(f"\nPhrase lookup: `in` per phrase {substring_ms:.1f} ms | "
+          f"Aho-Corasick pass {automaton_ms:.1f} ms")
+    return 1 if text_diffs or count_diffs else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
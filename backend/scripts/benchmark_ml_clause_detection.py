@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+ML Clause Detection Benchmark
+Measures MLClauseDetectionService.predict latency as a function of document
+length, comparing the default truncated (first 512 tokens) inference with
+sliding-window inference over the whole document, and the throughput of
+predict_batch against one predict call per document.
+
+Documents of each target length are built from the judgment corpus (texts are
+concatenated and cut to the requested number of words).
+
+Usage:
+    python scripts/benchmark_ml_clause_detection.py
+    python scripts/benchmark_ml_clause_detection.py --lengths 500 2000 8000 --repeat 5
+    python scripts/benchmark_ml_clause_detection.py --stride 64 --window-batch-size 8
+    python scripts/benchmark_ml_clause_detection.py --batch-docs 64 --batch-sizes 4 8 16 32
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.ml_clause_detection_service import (
+    MLClauseDetectionService,
+    ML_WINDOW_BATCH_SIZE,
+    ML_WINDOW_REDUCTION,
+    ML_WINDOW_STRIDE,
+    WINDOW_REDUCTIONS,
+)
+
+
+def load_documents(input_dir: Path):
+    """Return the text of every corpus document."""
+    texts = []
+    for path in sorted(input_dir.glob('*.txt')):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            texts.append(f.read())
+    return texts
+
+
+def load_words(input_dir: Path):
+    """Return all words of the corpus in file order."""
+    words = []
+    for path in sorted(input_dir.glob('*.txt')):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            words.extend(f.read().split())
+    return words
+
+
+def time_predict(service, text: str, repeat: int, **kwargs):
+    """Return (median seconds, last result) over `repeat` predict calls."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = service.predict(text, **kwargs)
+        timings.append(time.perf_counter() - t0)
+    if not result.get('success'):
+        raise RuntimeError(result.get('error'))
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark ML clause detection latency against document length'
+    )
+    parser.add_argument(
+        '--input',
+        type=str,
+        default=os.path.join(os.path.dirname(__file__), '..', 'app', 'casefiles'),
+        help='Directory containing judgment .txt files (default: casefiles folder)'
+    )
+    parser.add_argument(
+        '--checkpoint',
+        type=str,
+        default='app/ml_models/clause_detection_model.pt',
+        help='Clause detection checkpoint'
+    )
+    parser.add_argument(
+        '--lengths',
+        type=int,
+        nargs='+',
+        default=[250, 500, 1000, 2000, 4000, 8000, 16000],
+        help='Document lengths to test, in words'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per length (median is reported)')
+    parser.add_argument('--stride', type=int, default=ML_WINDOW_STRIDE, help='Overlapping tokens between windows')
+    parser.add_argument('--window-batch-size', type=int, default=ML_WINDOW_BATCH_SIZE, help='Windows per forward pass')
+    parser.add_argument('--reduction', choices=WINDOW_REDUCTIONS, default=ML_WINDOW_REDUCTION, help='Window reduction')
+    parser.add_argument('--batch-docs', type=int, default=32, help='Documents in the throughput test (0 to skip)')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 4, 8, 16, 32],
+                        help='predict_batch batch sizes to test')
+
+    args = parser.parse_args()
+
+    # predict() logs every clause at INFO; keep that out of the timings
+    logging.basicConfig(level=logging.WARNING)
+
+    input_dir = Path(args.input)
+    if not input_dir.exists():
+        print(f"Error: Input directory not found - {input_dir}")
+        return 1
+
+    words = load_words(input_dir)
+    if not words:
+        print(f"No .txt files found in {input_dir}")
+        return 0
+
+    service = MLClauseDetectionService(
+        checkpoint_path=args.checkpoint,
+        window_stride=args.stride,
+        window_reduction=args.reduction,
+        window_batch_size=args.window_batch_size,
+    )
+    if service.model is None:
+        print(f"Error: Could not load model checkpoint - {service.checkpoint_path}")
+        return 1
+
+    print(f"Device: {service.device} | stride {args.stride} | window batch {args.window_batch_size} "
+          f"| reduction {args.reduction}")
+
+    # Warm up kernels / allocator
+    service.predict(' '.join(words[:500]), sliding_window=False)
+
+    print(f"\n{'Words':>8} {'Tokens':>8} {'Windows':>8} {'Truncated ms':>13} {'Windowed ms':>12} "
+          f"{'ms/window':>10} {'Changed':>8}")
+    print("-" * 75)
+    for length in args.lengths:
+        if length > len(words):
+            print(f"{length:>8}  (corpus only has {len(words)} words - skipped)")
+            continue
+        text = ' '.join(words[:length])
+        num_tokens = len(service.tokenizer(text, add_special_tokens=False, verbose=False)['input_ids'])
+
+        truncated_s, truncated = time_predict(service, text, args.repeat, sliding_window=False)
+        windowed_s, windowed = time_predict(service, text, args.repeat, sliding_window=True)
+
+        changed = sum(
+            1 for a, b in zip(truncated['clauses'], windowed['clauses'])
+            if a['status'] != b['status']
+        )
+        windows = windowed['windows']
+        print(f"{length:>8} {num_tokens:>8} {windows:>8} {truncated_s * 1000:>13.1f} "
+              f"{windowed_s * 1000:>12.1f} {windowed_s * 1000 / windows:>10.1f} {changed:>8}")
+
+    if args.batch_docs > 0:
+        benchmark_batch(service, input_dir, args.batch_docs, args.batch_sizes)
+
+    return 0
+
+
+def benchmark_batch(service, input_dir: Path, num_docs: int, batch_sizes):
+    """Compare docs/sec of sequential predict() with predict_batch()."""
+    corpus = load_documents(input_dir)
+    texts = [corpus[i % len(corpus)] for i in range(num_docs)]
+
+    t0 = time.perf_counter()
+    sequential = [service.predict(text, sliding_window=False) for text in texts]
+    sequential_s = time.perf_counter() - t0
+
+    print(f"\nThroughput over {num_docs} documents (truncated inference)")
+    print(f"{'Mode':<22} {'Seconds':>9} {'Docs/sec':>9} {'Speedup':>8} {'Mismatches':>11}")
+    print("-" * 63)
+    print(f"{'predict (sequential)':<22} {sequential_s:>9.2f} {num_docs / sequential_s:>9.1f} {1.0:>8.2f} {'-':>11}")
+
+    for batch_size in batch_sizes:
+        t0 = time.perf_counter()
+        batched = service.predict_batch(texts, batch_size=batch_size, sliding_window=False)
+        batched_s = time.perf_counter() - t0
+        mismatches = sum(
+            1 for a, b in zip(sequential, batched)
+            for ca, cb in zip(a['clauses'], b['clauses'])
+            if ca['status'] != cb['status']
+        )
+        print(f"{f'predict_batch bs={batch_size}':<22} {batched_s:>9.2f} {num_docs / batched_s:>9.1f} "
+              f"{sequential_s / batched_s:>8.2f} {mismatches:>11}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Risk Classification Benchmark
+Compares the original one-clause-per-forward-pass classification (a copy of
+the unbatched classify_risk, kept below as baseline_classify_risk) with
+classify_risk_batch over the clauses segmented from a directory of judgment
+texts, and checks that the batched results match (risk label, and
+confidence/probabilities as returned by analyze_text, i.e. rounded to 0.01%).
+
+classify_risk itself now goes through classify_risk_batch, so it cannot
+serve as the reference.
+
+Usage:
+    python scripts/benchmark_risk_classification.py
+    python scripts/benchmark_risk_classification.py --batch-sizes 8 16 32 --limit 5
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+import torch
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from fastapi_app.services.classifier import LegalRiskClassifier
+
+
+def load_texts(input_dir: Path, limit: int = None):
+    """Load every .txt judgment in input_dir."""
+    texts = []
+    for path in sorted(input_dir.glob('*.txt')):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            texts.append(f.read())
+        if limit and len(texts) >= limit:
+            break
+    return texts
+
+
+def baseline_classify_risk(classifier, clause):
+    """The unbatched classify_risk: one padded forward pass per clause."""
+    inputs = classifier.classification_tokenizer(
+        clause,
+        return_tensors="pt",
+        truncation=True,
+        max_length=512,
+        padding=True
+    ).to(classifier.device)
+
+    with torch.no_grad():
+        outputs = classifier.classification_model(**inputs)
+        logits = outputs.logits
+        probabilities = torch.nn.functional.softmax(logits, dim=-1)[0]
+        predicted_class = torch.argmax(probabilities).item()
+        confidence = probabilities[predicted_class].item()
+
+    risk_level = classifier.labels["classification"][predicted_class]
+
+    all_probs = {
+        classifier.labels["classification"][i]: prob.item()
+        for i, prob in enumerate(probabilities)
+    }
+
+    return risk_level, confidence, all_probs
+
+
+def as_reported(classification):
+    """Round a (risk, confidence, probabilities) tuple the way analyze_text reports it."""
+    risk_level, confidence, all_probs = classification
+    return risk_level, round(confidence * 100, 2), {k: round(v * 100, 2) for k, v in all_probs.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark batched risk classification against the unbatched baseline'
+    )
+    parser.add_argument(
+        '--input',
+        type=str,
+        default=os.path.join(os.path.dirname(__file__), '..', 'app', 'casefiles'),
+        help='Directory containing judgment .txt files (default: casefiles folder)'
+    )
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[4, 8, 16, 32],
+                        help='classify_risk_batch batch sizes to test')
+    parser.add_argument('--limit', type=int, default=None, help='Only use the first N files')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    input_dir = Path(args.input)
+    if not input_dir.exists():
+        print(f"Error: Input directory not found - {input_dir}")
+        return 1
+
+    texts = load_texts(input_dir, args.limit)
+    if not texts:
+        print(f"No .txt files found in {input_dir}")
+        return 0
+
+    classifier = LegalRiskClassifier()
+    if not (classifier.has_segmentation and classifier.has_classification):
+        print("Error: Segmentation and classification models are required (app/ml_models/)")
+        return 1
+
+    clauses = []
+    for text in texts:
+        clauses.extend(
+            c["text"] for c in classifier.segment_clauses_hybrid(text)
+            if not classifier._is_structural_text(c["text"])
+        )
+    print(f"Documents: {len(texts)} | Substantive clauses: {len(clauses)} | Device: {classifier.device}")
+    if not clauses:
+        return 0
+
+    # Warm up
+    classifier.classify_risk_batch(clauses[:8])
+    baseline_classify_risk(classifier, clauses[0])
+
+    t0 = time.perf_counter()
+    reference = [baseline_classify_risk(classifier, clause) for clause in clauses]
+    sequential_s = time.perf_counter() - t0
+    reference_reported = [as_reported(r) for r in reference]
+
+    print(f"\n{'Mode':<22} {'Seconds':>9} {'Clauses/s':>10} {'Speedup':>8} {'Label diffs':>12} {'Rounded diffs':>14}")
+    print("-" * 80)
+    print(f"{'unbatched baseline':<22} {sequential_s:>9.2f} {len(clauses) / sequential_s:>10.1f} {1.0:>8.2f} "
+          f"{'-':>12} {'-':>14}")
+
+    for batch_size in args.batch_sizes:
+        t0 = time.perf_counter()
+        batched = classifier.classify_risk_batch(clauses, batch_size=batch_size)
+        elapsed = time.perf_counter() - t0
+
+        label_diffs = sum(1 for a, b in zip(reference, batched) if a[0] != b[0])
+        rounded_diffs = sum(1 for a, b in zip(reference_reported, batched) if a != as_reported(b))
+        print(f"{f'batch bs={batch_size}':<22} {elapsed:>9.2f} {len(clauses) / elapsed:>10.1f} "
+              f"{sequential_s / elapsed:>8.2f} {label_diffs:>12} {rounded_diffs:>14}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
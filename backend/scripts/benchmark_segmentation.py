@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Clause Segmentation Benchmark
+Measures LegalRiskClassifier.segment_clauses throughput (sentences/sec) over
+a directory of judgment texts for several batch sizes. Batch size 1 is the
+old one-forward-pass-per-sentence behaviour; every other batch size is
+checked to return exactly the same clauses and offsets.
+
+Usage:
+    python scripts/benchmark_segmentation.py
+    python scripts/benchmark_segmentation.py --batch-sizes 1 16 32 64 --limit 5
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from fastapi_app.services.classifier import LegalRiskClassifier
+
+
+def load_texts(input_dir: Path, limit: int = None):
+    """Load every .txt judgment in input_dir."""
+    texts = []
+    for path in sorted(input_dir.glob('*.txt')):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            texts.append(f.read())
+        if limit and len(texts) >= limit:
+            break
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark batched BIO clause segmentation (sentences/sec)'
+    )
+    parser.add_argument(
+        '--input',
+        type=str,
+        default=os.path.join(os.path.dirname(__file__), '..', 'app', 'casefiles'),
+        help='Directory containing judgment .txt files (default: casefiles folder)'
+    )
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 8, 16, 32, 64],
+                        help='Batch sizes to test (1 = one forward pass per sentence)')
+    parser.add_argument('--limit', type=int, default=None, help='Only use the first N files')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    input_dir = Path(args.input)
+    if not input_dir.exists():
+        print(f"Error: Input directory not found - {input_dir}")
+        return 1
+
+    texts = load_texts(input_dir, args.limit)
+    if not texts:
+        print(f"No .txt files found in {input_dir}")
+        return 0
+
+    classifier = LegalRiskClassifier()
+    if not classifier.has_segmentation:
+        print("Error: Segmentation model not available (app/ml_models/legalbert_clause_segmentation_model/)")
+        return 1
+
+    num_sentences = sum(len(classifier._split_into_sentences(text)) for text in texts)
+    print(f"Documents: {len(texts)} | Sentences: {num_sentences} | Device: {classifier.device}")
+
+    # Warm up
+    classifier.segment_clauses(texts[0][:2000], batch_size=max(args.batch_sizes))
+
+    reference = None
+    baseline_s = None
+    print(f"\n{'Batch size':>10} {'Seconds':>9} {'Sentences/s':>12} {'Speedup':>8} {'Identical':>10}")
+    print("-" * 54)
+    for batch_size in args.batch_sizes:
+        t0 = time.perf_counter()
+        results = [classifier.segment_clauses(text, batch_size=batch_size) for text in texts]
+        elapsed = time.perf_counter() - t0
+
+        if reference is None:
+            reference, baseline_s = results, elapsed
+            identical = '-'
+        else:
+            identical = 'yes' if results == reference else 'NO'
+        print(f"{batch_size:>10} {elapsed:>9.2f} {num_sentences / elapsed:>12.1f} "
+              f"{baseline_s / elapsed:>8.2f} {identical:>10}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
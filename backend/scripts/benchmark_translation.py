@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Translation Throughput Benchmark
+Measures mBART sentence throughput (sentences/sec) of _translate_texts for
+several generate() batch sizes over paragraphs of the judgment corpus.
+Batch size 1 is the old one-sentence-per-generate behaviour; every other
+batch size is checked to produce the same translation for every paragraph.
+The translation memory is bypassed so every run measures the model.
+
+Usage:
+    python scripts/benchmark_translation.py
+    python scripts/benchmark_translation.py --target ta --paragraphs 20 --batch-sizes 1 4 8 16
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.translation_service import _chunk_text, _model_key, _split_sentences, _translate_texts, load_models
+
+
+def load_paragraphs(input_dir: Path, count: int):
+    """Take ~400-char chunks (as translate_raw_text does) from the judgment corpus."""
+    paragraphs = []
+    for path in sorted(input_dir.glob('*.txt')):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            text = ' '.join(f.read().split())
+        paragraphs.extend(_chunk_text(text, max_chars=400))
+        if len(paragraphs) >= count:
+            break
+    return paragraphs[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark batched mBART sentence translation (sentences/sec)'
+    )
+    parser.add_argument(
+        '--input',
+        type=str,
+        default=os.path.join(os.path.dirname(__file__), '..', 'app', 'casefiles'),
+        help='Directory containing judgment .txt files (default: casefiles folder)'
+    )
+    parser.add_argument('--target', choices=['si', 'ta'], default='si', help='Target language')
+    parser.add_argument('--paragraphs', type=int, default=10, help='Number of ~400-char paragraphs')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 4, 8, 16],
+                        help='Sentences per generate() call (1 = one sentence at a time)')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    input_dir = Path(args.input)
+    if not input_dir.exists():
+        print(f"Error: Input directory not found - {input_dir}")
+        return 1
+
+    paragraphs = load_paragraphs(input_dir, args.paragraphs)
+    if not paragraphs:
+        print(f"No .txt files found in {input_dir}")
+        return 0
+
+    key = _model_key('en', args.target)
+    models = load_models()
+    if key not in models:
+        print(f"Error: {key} model not available (app/ml_models/)")
+        return 1
+
+    num_sentences = sum(len(_split_sentences(p)) for p in paragraphs)
+    print(f"Paragraphs: {len(paragraphs)} | Sentences: {num_sentences} | Device: {models.get('device')}")
+
+    # Warm up
+    _translate_texts(paragraphs[:1], key, batch_size=max(args.batch_sizes), use_memory=False)
+
+    reference = None
+    baseline_s = None
+    print(f"\n{'Batch size':>10} {'Seconds':>9} {'Sentences/s':>12} {'Speedup':>8} {'Identical':>10}")
+    print("-" * 54)
+    for batch_size in args.batch_sizes:
+        t0 = time.perf_counter()
+        results = _translate_texts(paragraphs, key, batch_size=batch_size, use_memory=False)
+        elapsed = time.perf_counter() - t0
+
+        translations = [text for text, _ in results]
+        if reference is None:
+            reference, baseline_s = translations, elapsed
+            identical = '-'
+        else:
+            same = sum(1 for a, b in zip(reference, translations) if a == b)
+            identical = 'yes' if same == len(reference) else f"{same}/{len(reference)}"
+        print(f"{batch_size:>10} {elapsed:>9.2f} {num_sentences / elapsed:>12.1f} "
+              f"{baseline_s / elapsed:>8.2f} {identical:>10}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Inference Backend Comparison
+Compares the ONNX Runtime backends (FP32 and dynamic INT8) with eager PyTorch
+for every Legal-BERT model: the clause detector behind MLClauseDetectionService
+and the segmentation, risk-classification and lineage models loaded by
+ModelLoader.
+
+For each model and backend it reports:
+  - accuracy delta: prediction agreement with PyTorch and max |Δ probability|
+  - latency: mean / p95 ms for single inputs
+  - throughput: inputs/sec with padded batches
+
+Inputs are taken from the judgment corpus (whole documents for the clause
+detector, sentences for the other models). Missing models are skipped.
+
+Usage:
+    python scripts/compare_inference_backends.py
+    python scripts/compare_inference_backends.py --models classification lineage --samples 200
+    python scripts/compare_inference_backends.py --backends onnx_int8 --batch-size 32
+"""
+
+import argparse
+import logging
+import os
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import torch
+from transformers import AutoModelForSequenceClassification, AutoModelForTokenClassification, AutoTokenizer
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.ml_clause_detection_service import MLClauseDetectionService
+from app.services.onnx_inference import (
+    BACKEND_ONNX,
+    BACKEND_ONNX_INT8,
+    OnnxClauseDetector,
+    load_onnx_model,
+    onnx_available,
+)
+
+MODELS_DIR = BACKEND_DIR / "app" / "ml_models"
+
+# name -> (model directory, model class, per-token output, max_length)
+HF_MODELS = {
+    'segmentation': ("legalbert_clause_segmentation_model", AutoModelForTokenClassification, True, 512),
+    'classification': ("legalbert_risk_classification_model", AutoModelForSequenceClassification, False, 512),
+    'lineage': ("act_treatment_classifier", AutoModelForSequenceClassification, False, 256),
+}
+
+
+def load_corpus(input_dir: Path):
+    """Return (documents, sentences) from the judgment corpus."""
+    documents = []
+    for path in sorted(input_dir.glob('*.txt')):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            documents.append(f.read())
+    sentences = []
+    for doc in documents:
+        for sentence in re.split(r'(?<=[.!?])\s+', ' '.join(doc.split())):
+            if len(sentence.split()) >= 6:
+                sentences.append(sentence)
+    return documents, sentences
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def run_hf(model, tokenizer, texts, max_length: int, batch_size: int):
+    """Return (per-input probability tensors, single-input latencies, batched seconds)."""
+    probs = []
+    latencies = []
+    with torch.no_grad():
+        for text in texts:
+            inputs = tokenizer(text, return_tensors='pt', truncation=True, max_length=max_length)
+            t0 = time.perf_counter()
+            logits = model(**inputs).logits
+            latencies.append(time.perf_counter() - t0)
+            probs.append(torch.softmax(logits, dim=-1)[0])
+
+        t0 = time.perf_counter()
+        for start in range(0, len(texts), batch_size):
+            inputs = tokenizer(texts[start:start + batch_size], return_tensors='pt',
+                               truncation=True, max_length=max_length, padding=True)
+            model(**inputs)
+        batched_s = time.perf_counter() - t0
+    return probs, latencies, batched_s
+
+
+def run_detector(service, documents, batch_size: int):
+    """Return (per-document (28, 3) probability tensors, single latencies, batched seconds)."""
+    probs = []
+    latencies = []
+    for doc in documents:
+        t0 = time.perf_counter()
+        result = service.predict(doc, sliding_window=False)
+        latencies.append(time.perf_counter() - t0)
+        if not result.get('success'):
+            raise RuntimeError(result.get('error'))
+        probs.append(torch.tensor([
+            [c['probabilities']['missing'], c['probabilities']['present'], c['probabilities']['corrupted']]
+            for c in result['clauses']
+        ]))
+
+    t0 = time.perf_counter()
+    service.predict_batch(documents, batch_size=batch_size, sliding_window=False)
+    batched_s = time.perf_counter() - t0
+    return probs, latencies, batched_s
+
+
+def compare(reference, candidate):
+    """Return (agreement %, max |Δ probability|) of two lists of probability tensors."""
+    agree = total = 0
+    max_delta = 0.0
+    for ref, cand in zip(reference, candidate):
+        ref_labels = ref.argmax(dim=-1)
+        cand_labels = cand.argmax(dim=-1)
+        agree += int((ref_labels == cand_labels).sum())
+        total += ref_labels.numel()
+        max_delta = max(max_delta, float((ref - cand).abs().max()))
+    return 100.0 * agree / max(total, 1), max_delta
+
+
+def report_row(model_name, backend, latencies, batched_s, count, agreement=None, max_delta=None):
+    agreement_col = f"{agreement:>9.2f}%" if agreement is not None else f"{'-':>10}"
+    delta_col = f"{max_delta:>10.5f}" if max_delta is not None else f"{'-':>10}"
+    print(f"{model_name:<15} {backend:<10} {statistics.mean(latencies) * 1000:>9.2f} "
+          f"{percentile(latencies, 95) * 1000:>9.2f} {count / batched_s:>10.1f} {agreement_col} {delta_col}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare ONNX Runtime / INT8 inference with PyTorch for accuracy and speed'
+    )
+    parser.add_argument(
+        '--input',
+        type=str,
+        default=os.path.join(os.path.dirname(__file__), '..', 'app', 'casefiles'),
+        help='Directory containing judgment .txt files (default: casefiles folder)'
+    )
+    parser.add_argument(
+        '--models',
+        nargs='+',
+        choices=['detector'] + list(HF_MODELS),
+        default=['detector'] + list(HF_MODELS),
+        help='Models to compare'
+    )
+    parser.add_argument(
+        '--backends',
+        nargs='+',
+        choices=[BACKEND_ONNX, BACKEND_ONNX_INT8],
+        default=[BACKEND_ONNX, BACKEND_ONNX_INT8],
+        help='Backends to compare against PyTorch'
+    )
+    parser.add_argument(
+        '--checkpoint',
+        type=str,
+        default='app/ml_models/clause_detection_model.pt',
+        help='Clause detection checkpoint'
+    )
+    parser.add_argument('--samples', type=int, default=100, help='Sentences per sentence-level model')
+    parser.add_argument('--documents', type=int, default=16, help='Documents for the clause detector')
+    parser.add_argument('--batch-size', type=int, default=16, help='Batch size for the throughput run')
+    parser.add_argument('--threads', type=int, default=None, help='torch intra-op threads (default: torch default)')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    if not onnx_available():
+        print("Error: onnxruntime is not installed (pip install onnxruntime)")
+        return 1
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    input_dir = Path(args.input)
+    if not input_dir.exists():
+        print(f"Error: Input directory not found - {input_dir}")
+        return 1
+    documents, sentences = load_corpus(input_dir)
+    if not documents:
+        print(f"No .txt files found in {input_dir}")
+        return 0
+    sentences = sentences[:args.samples]
+    documents = [documents[i % len(documents)] for i in range(args.documents)]
+
+    print(f"{'Model':<15} {'Backend':<10} {'Mean ms':>9} {'p95 ms':>9} {'Inputs/s':>10} "
+          f"{'Agreement':>10} {'Max |Δp|':>10}")
+    print("-" * 80)
+
+    if 'detector' in args.models:
+        reference = MLClauseDetectionService(checkpoint_path=args.checkpoint, inference_backend='pytorch')
+        if reference.model is None:
+            print(f"{'detector':<15} (checkpoint not found - skipped)")
+        else:
+            ref_probs, latencies, batched_s = run_detector(reference, documents, args.batch_size)
+            report_row('detector', 'pytorch', latencies, batched_s, len(documents))
+            for backend in args.backends:
+                service = MLClauseDetectionService(checkpoint_path=args.checkpoint, inference_backend=backend)
+                if not isinstance(service.model, OnnxClauseDetector):
+                    print(f"{'detector':<15} {backend:<10} (ONNX backend failed to load - skipped)")
+                    continue
+                probs, latencies, batched_s = run_detector(service, documents, args.batch_size)
+                agreement, max_delta = compare(ref_probs, probs)
+                report_row('detector', backend, latencies, batched_s, len(documents), agreement, max_delta)
+
+    for name in [m for m in args.models if m in HF_MODELS]:
+        dirname, model_cls, per_token, max_length = HF_MODELS[name]
+        model_path = MODELS_DIR / dirname
+        if not model_path.exists():
+            print(f"{name:<15} (model not found at {model_path} - skipped)")
+            continue
+
+        tokenizer = AutoTokenizer.from_pretrained(str(model_path))
+        model = model_cls.from_pretrained(str(model_path)).eval()
+
+        ref_probs, latencies, batched_s = run_hf(model, tokenizer, sentences, max_length, args.batch_size)
+        report_row(name, 'pytorch', latencies, batched_s, len(sentences))
+
+        dummy_inputs = tokenizer("The appeal is allowed with costs.", return_tensors='pt')
+        for backend in args.backends:
+            onnx_model = load_onnx_model(model, dummy_inputs, model_path, backend=backend,
+                                         per_token_output=per_token)
+            if onnx_model is None:
+                print(f"{name:<15} {backend:<10} (ONNX backend failed to load - skipped)")
+                continue
+            probs, latencies, batched_s = run_hf(onnx_model, tokenizer, sentences, max_length, args.batch_size)
+            agreement, max_delta = compare(ref_probs, probs)
+            report_row(name, backend, latencies, batched_s, len(sentences), agreement, max_delta)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
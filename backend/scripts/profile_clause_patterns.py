@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Clause Pattern Profiler
+Runs every main/fallback pattern in CLAUSE_DEFINITIONS over its search region
+in a directory of case texts and ranks the patterns by worst-case and p99
+search time, so expensive expressions can be fixed before they hit production.
+
+Patterns are timed on their own (no prefilters, no search-window cap) on the
+engine detection uses: stdlib re by default, regex with
+CLAUSE_PATTERN_BUDGET=true. With --engine regex each search is bounded by
+--timeout-ms and overruns are counted instead of hanging the run; the worst
+time on that engine is what CLAUSE_PATTERN_TIMEOUT_MS must stay above.
+
+Usage:
+    python scripts/profile_clause_patterns.py
+    python scripts/profile_clause_patterns.py --input path/to/texts --top 20 --sort p99
+    python scripts/profile_clause_patterns.py --output pattern_profile.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from tqdm import tqdm
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.clause_patterns import (
+    CLAUSE_DEFINITIONS,
+    PATTERN_BUDGET_ENABLED,
+    PATTERN_TIMEOUT_MS,
+    get_search_region,
+    preprocess_text,
+)
+
+try:
+    import regex
+except ImportError:
+    regex = None
+
+
+def compile_patterns(engine: str):
+    """Compile every clause pattern with the flags detection uses.
+
+    Returns:
+        List of dicts: clause_key, kind ("main"/"fallback"), index, source, compiled
+    """
+    lib = regex if engine == 'regex' else re
+    entries = []
+    for clause_key, clause_def in CLAUSE_DEFINITIONS.items():
+        for kind, key in (('main', 'patterns'), ('fallback', 'fallback_patterns')):
+            for idx, source in enumerate(clause_def.get(key, []), 1):
+                try:
+                    compiled = lib.compile(source, lib.MULTILINE | lib.IGNORECASE)
+                except Exception as e:
+                    print(f"⚠️ Cannot compile {clause_key} {kind} #{idx}: {e}")
+                    continue
+                entries.append({
+                    'clause_key': clause_key,
+                    'kind': kind,
+                    'index': idx,
+                    'source': source,
+                    'compiled': compiled,
+                    'timings': [],
+                    'timeouts': 0,
+                })
+    return entries
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def profile(entries, texts, engine: str, timeout_ms: float):
+    """Time every pattern over every document's search region."""
+    timeout = timeout_ms / 1000.0 if engine == 'regex' and timeout_ms > 0 else None
+
+    for text in tqdm(texts, desc="Profiling documents"):
+        for entry in entries:
+            region_start, region_end = get_search_region(text, entry['clause_key'])
+            t0 = time.perf_counter()
+            try:
+                if timeout is not None:
+                    entry['compiled'].search(text, region_start, region_end, timeout=timeout)
+                else:
+                    entry['compiled'].search(text, region_start, region_end)
+            except TimeoutError:
+                entry['timeouts'] += 1
+            entry['timings'].append(time.perf_counter() - t0)
+
+
+def summarize(entries):
+    """Reduce raw timings to per-pattern statistics (milliseconds)."""
+    rows = []
+    for entry in entries:
+        timings = entry['timings']
+        rows.append({
+            'clause_key': entry['clause_key'],
+            'pattern': f"{entry['kind']} #{entry['index']}",
+            'worst_ms': round(max(timings) * 1000, 3),
+            'p99_ms': round(percentile(timings, 99) * 1000, 3),
+            'mean_ms': round(sum(timings) / len(timings) * 1000, 3),
+            'timeouts': entry['timeouts'],
+            'source': entry['source'],
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Rank clause regex patterns by worst-case and p99 search time'
+    )
+    parser.add_argument(
+        '--input',
+        type=str,
+        default=os.path.join(os.path.dirname(__file__), '..', 'app', 'casefiles'),
+        help='Directory containing judgment .txt files (default: casefiles folder)'
+    )
+    parser.add_argument('--sort', choices=['worst', 'p99'], default='worst', help='Ranking key')
+    parser.add_argument('--top', type=int, default=15, help='Number of patterns to print')
+    parser.add_argument(
+        '--engine',
+        choices=['regex', 're'],
+        default='regex' if PATTERN_BUDGET_ENABLED else 're',
+        help='Regex engine to profile (default: the engine detection runs - '
+             'regex with CLAUSE_PATTERN_BUDGET=true, otherwise re)'
+    )
+    parser.add_argument(
+        '--timeout-ms',
+        type=float,
+        default=PATTERN_TIMEOUT_MS,
+        help='Per-search time budget with the regex engine (default: CLAUSE_PATTERN_TIMEOUT_MS)'
+    )
+    parser.add_argument('--output', type=str, default=None, help='Write the full ranking to a JSON file')
+
+    args = parser.parse_args()
+
+    if args.engine == 'regex' and regex is None:
+        print("Error: the 'regex' package is not installed (pip install regex)")
+        return 1
+
+    input_dir = Path(args.input)
+    if not input_dir.exists():
+        print(f"Error: Input directory not found - {input_dir}")
+        return 1
+
+    files = sorted(input_dir.glob('*.txt'))
+    if not files:
+        print(f"No .txt files found in {input_dir}")
+        return 0
+
+    texts = []
+    for path in files:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            texts.append(preprocess_text(f.read()))
+
+    entries = compile_patterns(args.engine)
+    print(f"Profiling {len(entries)} patterns over {len(texts)} documents ({args.engine} engine)")
+    profile(entries, texts, args.engine, args.timeout_ms)
+
+    sort_key = 'worst_ms' if args.sort == 'worst' else 'p99_ms'
+    rows = sorted(summarize(entries), key=lambda r: r[sort_key], reverse=True)
+
+    print(f"\n{'#':>3}  {'Clause':<22} {'Pattern':<12} {'Worst ms':>9} {'p99 ms':>9} "
+          f"{'Mean ms':>9} {'Timeouts':>8}  Source")
+    print("-" * 110)
+    for rank, row in enumerate(rows[:args.top], 1):
+        print(f"{rank:>3}  {row['clause_key']:<22} {row['pattern']:<12} {row['worst_ms']:>9.2f} "
+              f"{row['p99_ms']:>9.2f} {row['mean_ms']:>9.2f} {row['timeouts']:>8}  {row['source'][:40]}")
+
+    total_timeouts = sum(r['timeouts'] for r in rows)
+    if total_timeouts:
+        print(f"\n⏱️ {total_timeouts} searches exceeded the {args.timeout_ms:g} ms budget")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'documents': len(texts),
+                'engine': args.engine,
+                'timeout_ms': args.timeout_ms,
+                'patterns': rows,
+            }, f, indent=2, ensure_ascii=False)
+        print(f"\n✅ Full ranking saved to {args.output}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
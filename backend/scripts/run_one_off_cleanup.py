@@ -50,6 +50,7 @@ for filename in os.listdir(uploads):
             pdf_base,  # The actual PDF file itself
             f'{pdf_base}.clean.txt',
             f'{pdf_base}.clean.txt.original',
+            f'{pdf_base}.clean.txt.clauses.json',
             f'{pdf_base}.tagged.txt',
             f'{pdf_base}_finalized.clean.txt',
             f'{pdf_base}_finalized.tagged.txt'
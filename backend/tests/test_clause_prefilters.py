@@ -0,0 +1,68 @@
+"""Clause pattern prefilters must never reject a region where the full pattern matches."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from app.services import clause_patterns
+from app.services.clause_patterns import (
+    _COMPILED_CLAUSES,
+    _PrefilterIndex,
+    _pattern_prefilter,
+    _resolve_region,
+    preprocess_text,
+)
+
+CASEFILES = sorted((Path(__file__).parent.parent / "app" / "casefiles").glob("*.txt"))
+
+
+def _all_patterns():
+    for clause_key, compiled in _COMPILED_CLAUSES.items():
+        for kind in ("patterns", "fallback_patterns"):
+            for index, (pattern, prefilter) in enumerate(compiled[kind], 1):
+                yield clause_key, kind, index, re.compile(pattern.pattern, pattern.flags), prefilter
+
+
+@pytest.mark.parametrize("path", CASEFILES, ids=lambda p: p.name)
+def test_prefilters_agree_with_full_patterns(path):
+    text = preprocess_text(path.read_text(encoding="utf-8", errors="replace"))
+    prefilters = _PrefilterIndex(text)
+    for clause_key, kind, index, pattern, prefilter in _all_patterns():
+        region_start, region_end = _resolve_region(len(text), _COMPILED_CLAUSES[clause_key]["region"])
+        match = pattern.search(text, region_start, region_end)
+        if match is None:
+            continue
+        label = f"{clause_key} {kind} #{index}"
+        # The region check, and the tightest window around the match
+        assert prefilters.may_match(prefilter, region_start, region_end), label
+        assert prefilters.may_match(prefilter, match.start(), match.end()), label
+        keyword_groups, fragment = prefilter
+        if fragment is not None:
+            assert fragment.search(text, match.start(), match.end()) is not None, label
+
+
+def test_casefiles_exercise_the_prefilters():
+    assert CASEFILES
+    assert any(fragment is not None for *_, (_, fragment) in _all_patterns())
+    assert any(groups for *_, (groups, _) in _all_patterns())
+
+
+def test_parser_failure_means_no_prefilter(monkeypatch):
+    pattern = re.compile(r"Argued\s+on")
+
+    def broken_parse(*args, **kwargs):
+        raise AttributeError("parser internals changed")
+
+    monkeypatch.setattr(clause_patterns._sre_parse, "parse", broken_parse)
+    assert _pattern_prefilter(pattern) == ((), None)
+
+
+def test_missing_parser_means_no_prefilter(monkeypatch):
+    monkeypatch.setattr(clause_patterns, "_sre_parse", None)
+    assert _pattern_prefilter(re.compile(r"Argued\s+on")) == ((), None)
+
+
+def test_pattern_without_prefilter_always_runs():
+    prefilters = _PrefilterIndex("nothing relevant here")
+    assert prefilters.may_match(((), None), 0, 21)
@@ -0,0 +1,55 @@
+"""Search-window cap and time budget of clause detection."""
+
+import importlib
+
+import pytest
+
+from app.services import clause_patterns
+
+FILLER = "The learned trial judge considered the evidence placed before court.\n"
+
+
+def _statuses(module, text):
+    return {r["clause_key"]: r["status"] for r in module.detect_all_clauses(text)}
+
+
+def test_capped_search_reports_truncated_not_missing():
+    assert not clause_patterns.PATTERN_BUDGET_ENABLED
+    short = _statuses(clause_patterns, FILLER * 10)
+    long = _statuses(clause_patterns, FILLER * (clause_patterns._MAX_SEARCH_LEN // len(FILLER) + 10))
+    # Whole-document clauses cannot be ruled out past the cap
+    assert short["LegalProvisionsCited"] == "Missing"
+    assert long["LegalProvisionsCited"] == clause_patterns.TRUNCATED_STATUS
+    # Clauses whose region fits in the cap are still Missing
+    assert long["CourtTitle"] == "Missing"
+
+
+def test_match_past_the_cap_needs_the_budget():
+    text = FILLER * (clause_patterns._MAX_SEARCH_LEN // len(FILLER) + 10) + "Section 12 of the Act applies.\n"
+    assert _statuses(clause_patterns, text)["LegalProvisionsCited"] == clause_patterns.TRUNCATED_STATUS
+
+
+@pytest.fixture
+def budgeted(monkeypatch):
+    pytest.importorskip("regex")
+    monkeypatch.setenv("CLAUSE_PATTERN_BUDGET", "true")
+    module = importlib.reload(clause_patterns)
+    yield module
+    monkeypatch.delenv("CLAUSE_PATTERN_BUDGET")
+    importlib.reload(clause_patterns)
+
+
+def test_budget_searches_whole_region_with_every_pattern_timed(budgeted):
+    assert budgeted.PATTERN_BUDGET_ENABLED
+    for compiled in budgeted._COMPILED_CLAUSES.values():
+        for pattern, _ in compiled["patterns"] + compiled["fallback_patterns"]:
+            assert not isinstance(pattern, budgeted.re.Pattern)
+
+    text = FILLER * (budgeted._MAX_SEARCH_LEN // len(FILLER) + 10) + "Section 12 of the Act applies.\n"
+    assert _statuses(budgeted, text)["LegalProvisionsCited"] == "Present"
+
+
+def test_overrun_reports_timeout(budgeted, monkeypatch):
+    monkeypatch.setattr(budgeted, "PATTERN_TIMEOUT_MS", 1e-6)
+    statuses = _statuses(budgeted, FILLER * 2000)
+    assert budgeted.TIMEOUT_STATUS in statuses.values()
@@ -0,0 +1,73 @@
+"""GlossaryMatcher: \\b word boundaries and leftmost-longest matching, checked against regex."""
+
+import random
+import re
+
+from app.services.glossary_matcher import GlossaryMatcher
+
+TERMS = ["petit", "petitioner", "vice", "tribunal", "labour tribunal", "labour",
+         "court", "court of appeal", "appeal", "s.c.", "act", "o'brien"]
+
+
+def regex_find_all(terms, text):
+    """Every \\b-bounded occurrence of every term, overlapping ones included."""
+    lower = text.lower()
+    return sorted(
+        (m.start(1), m.end(1), term)
+        for term in terms
+        for m in re.finditer(r"(?=(\b" + re.escape(term) + r"\b))", lower)
+    )
+
+
+def test_term_inside_longer_word_is_not_matched():
+    matcher = GlossaryMatcher(TERMS)
+    assert matcher.find("The petitioner said the services were fine.") == [(4, 14, "petitioner")]
+    assert matcher.find_all("Petit jury; vice-chairman") == [(0, 5, "petit"), (12, 16, "vice")]
+    assert matcher.find("contracts, enacted, actors") == []
+
+
+def test_matching_is_case_insensitive():
+    matcher = GlossaryMatcher(["Labour Tribunal"])
+    assert matcher.find("before the LABOUR TRIBUNAL") == [(11, 26, "labour tribunal")]
+
+
+def test_leftmost_longest():
+    matcher = GlossaryMatcher(TERMS)
+    text = "the labour tribunal and the court of appeal"
+    assert matcher.find(text) == [(4, 19, "labour tribunal"), (28, 43, "court of appeal")]
+    # find_all still reports the shorter, overlapping terms
+    assert {m[2] for m in matcher.find_all(text)} == {
+        "labour", "labour tribunal", "tribunal", "court", "court of appeal", "appeal"
+    }
+
+
+def test_leftmost_wins_over_longer_later_overlap():
+    matcher = GlossaryMatcher(["a b", "b c d"])
+    assert matcher.find("a b c d") == [(0, 3, "a b")]
+
+
+def test_find_filters():
+    matcher = GlossaryMatcher(TERMS)
+    text = "the labour tribunal heard the appeal"
+    assert matcher.find(text, terms={"labour", "appeal"}) == [(4, 10, "labour"), (30, 36, "appeal")]
+    assert matcher.find(text, min_length=7) == [(4, 19, "labour tribunal")]
+    assert matcher.find_terms("appeal, appeal and labour") == ["appeal", "labour"]
+
+
+def test_terms_ending_in_punctuation_follow_regex_boundaries():
+    matcher = GlossaryMatcher(["s.c."])
+    # \b after "." needs a word character next, as with re
+    assert matcher.find_all("in s.c.appeal") == [(3, 7, "s.c.")]
+    assert matcher.find_all("in s.c. appeal") == []
+    assert [m.span() for m in re.finditer(r"\bs\.c\.\b", "in s.c.appeal")] == [(3, 7)]
+    assert list(re.finditer(r"\bs\.c\.\b", "in s.c. appeal")) == []
+
+
+def test_find_all_matches_regex_word_boundaries():
+    rng = random.Random(3)
+    vocabulary = TERMS + ["petitioners", "services", "tribunals", "of", "the", "x"]
+    separators = [" ", "  ", ", ", ".", "-", "_", "'", "\n", ""]
+    matcher = GlossaryMatcher(TERMS)
+    for _ in range(500):
+        text = "".join(rng.choice(vocabulary) + rng.choice(separators) for _ in range(rng.randint(1, 12)))
+        assert sorted(matcher.find_all(text)) == regex_find_all(TERMS, text), text
@@ -0,0 +1,113 @@
+"""GrammarRuleEngine: required-literal extraction and equivalence with the rule-by-rule loop."""
+
+import random
+import re
+
+import pytest
+
+from app.services.grammar_rule_engine import GrammarRuleEngine, _required_literal
+from app.services.translation_correction_service import (
+    SINHALA_GRAMMAR_RULES,
+    SINHALA_PHRASE_CORRECTIONS,
+    TAMIL_GRAMMAR_RULES,
+    TAMIL_PHRASE_CORRECTIONS,
+    apply_sinhala_grammar_correction,
+    apply_tamil_grammar_correction,
+)
+
+TABLES = {
+    "si": (SINHALA_GRAMMAR_RULES, SINHALA_PHRASE_CORRECTIONS, apply_sinhala_grammar_correction),
+    "ta": (TAMIL_GRAMMAR_RULES, TAMIL_PHRASE_CORRECTIONS, apply_tamil_grammar_correction),
+}
+
+
+def legacy_correction(text, rules, phrases):
+    """The apply_*_grammar_correction loops before GrammarRuleEngine."""
+    if not text or not isinstance(text, str):
+        return text, 0
+    corrected = text
+    corrections_count = 0
+    for pattern, replacement in rules:
+        new_text = re.sub(pattern, replacement, corrected)
+        if new_text != corrected:
+            corrections_count += 1
+            corrected = new_text
+    for incorrect, correct in phrases.items():
+        if incorrect in corrected:
+            corrected = corrected.replace(incorrect, correct)
+            corrections_count += 1
+    return corrected.strip(), corrections_count
+
+
+def sample_texts(rules, phrases, count=300, seed=7):
+    """Texts built from the tables' own vocabulary, seeded with the artifacts the rules target."""
+    rng = random.Random(seed)
+    words = sorted({w for text in list(phrases) + list(phrases.values()) for w in text.split()})
+    artifacts = list(phrases) + [f"{w} {w}" for w in words[:30]]
+    artifacts += ["  ", " ,", " .", ";x", "..", "\u200d", " \u200d", "12 වැනි වැනි", "12 வது வது"]
+    texts = []
+    for _ in range(count):
+        tokens = [rng.choice(artifacts) if rng.random() < 0.15 else rng.choice(words)
+                  for _ in range(rng.randint(1, 40))]
+        texts.append(" ".join(tokens) + rng.choice(["", ".", " ", " ."]))
+    return texts
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    (r"\bකරන්න\s+කරන්න\b", "කරන්න"),
+    (r"\s+,", ","),
+    (r"abc?d", "ab"),
+    (r"x{2}yz", "yz"),
+    (r"[abc]def", "def"),
+    (r"(foo)bar", "bar"),
+    (r"^\s+$", None),
+    (r".*", None),
+    (r"a+", None),
+    (r"foo|bar", None),
+    (r"(?i)legal", None),
+    (r"[\]]x", None),
+])
+def test_required_literal(pattern, expected):
+    assert _required_literal(pattern) == expected
+
+
+@pytest.mark.parametrize("lang", sorted(TABLES))
+def test_required_literal_is_in_every_match(lang):
+    rules, phrases, _ = TABLES[lang]
+    texts = sample_texts(rules, phrases)
+    for pattern, _ in rules:
+        literal = _required_literal(pattern)
+        if literal is None:
+            continue
+        compiled = re.compile(pattern)
+        for text in texts:
+            for match in compiled.finditer(text):
+                assert literal in match.group(0), (pattern, match.group(0))
+
+
+@pytest.mark.parametrize("lang", sorted(TABLES))
+def test_engine_matches_rule_by_rule_loop(lang):
+    rules, phrases, apply_correction = TABLES[lang]
+    texts = sample_texts(rules, phrases) + ["", " ", "\u200d"] + list(phrases)
+    corrected_texts = 0
+    for text in texts:
+        expected = legacy_correction(text, rules, phrases)
+        assert apply_correction(text) == expected, text
+        corrected_texts += expected[1] > 0
+    # The sample actually exercises the rules
+    assert corrected_texts > len(texts) // 4
+
+
+def test_engine_applies_rules_in_order_and_counts_changes():
+    engine = GrammarRuleEngine(
+        [(r"\bab\b", "cd"), (r"\bcd\s+cd\b", "cd"), (r"zz", "yy")],
+        {"cd x": "done", "missing": "never"},
+    )
+    # Rule 2 only matches after rule 1 rewrote the text; rule 3 never matches
+    assert engine.apply("ab ab x") == ("done", 3)
+    assert engine.apply("nothing here") == ("nothing here", 0)
+
+
+def test_non_text_input_is_returned_unchanged():
+    assert apply_sinhala_grammar_correction("") == ("", 0)
+    assert apply_tamil_grammar_correction(None) == (None, 0)
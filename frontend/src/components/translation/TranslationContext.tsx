@@ -4,6 +4,8 @@
  * Global state that tracks every in-flight (and recently finished) translation
  * job.  Any component can call `startDocumentJob` / `startTextJob`; the context
  * polls `/api/translate/progress/:id` every 2 s and notifies subscribers.
+ * Polls pass the section cursor from the previous response (`since`), so each
+ * translated section is downloaded once and appended to `partialSections`.
  *
  * The <TranslationFloatingWidget /> reads this context to render the corner
  * popup so the user can roam freely across pages while translations run.
@@ -83,6 +85,17 @@ interface TranslationContextValue {
 
 const Ctx = createContext<TranslationContextValue | null>(null);
 
+/** Append the sections a cursor poll returned (or start over after a reset). */
+function mergePartialSections(
+  current: TranslationSection[] | undefined,
+  p: TranslationProgress,
+): TranslationSection[] | undefined {
+  const fresh = p.partial_translated_sections;
+  if (p.reset) return fresh ?? [];
+  if (!fresh || fresh.length === 0) return current;
+  return [...(current ?? []), ...fresh];
+}
+
 export function useTranslation() {
   const c = useContext(Ctx);
   if (!c)
@@ -100,6 +113,8 @@ export function TranslationProvider({
   const [jobs, setJobs] = useState<TrackedJob[]>([]);
   const [viewingJobId, setViewingJobId] = useState<string | null>(null);
   const pollRef = useRef<ReturnType<typeof setInterval> | null>(null);
+  /** next `since` cursor per job */
+  const cursorsRef = useRef<Record<string, number>>({});
 
   // ── polling active jobs ────────────────────────────────────────────────
   useEffect(() => {
@@ -126,7 +141,11 @@ export function TranslationProvider({
       for (const j of active) {
         if (j.status !== "processing") continue;
         try {
-          const p: TranslationProgress = await getTranslationProgress(j.jobId);
+          const since = cursorsRef.current[j.jobId] ?? 0;
+          const p: TranslationProgress = await getTranslationProgress(j.jobId, since);
+          // an overlapping poll already consumed these sections
+          if ((cursorsRef.current[j.jobId] ?? 0) !== since) continue;
+          cursorsRef.current[j.jobId] = p.cursor ?? since;
           setJobs((prev) =>
             prev.map((x) => {
               if (x.jobId !== j.jobId) return x;
@@ -159,7 +178,7 @@ export function TranslationProvider({
                 return {
                   ...x,
                   status: "stopped" as const,
-                  partialSections: p.partial_translated_sections || x.partialSections,
+                  partialSections: mergePartialSections(x.partialSections, p),
                 };
               }
               return {
@@ -167,7 +186,7 @@ export function TranslationProvider({
                 progress: p.progress,
                 completedSections: p.completed_sections,
                 totalSections: p.total_sections,
-                partialSections: p.partial_translated_sections || x.partialSections,
+                partialSections: mergePartialSections(x.partialSections, p),
               };
             }),
           );
@@ -1170,7 +1170,12 @@ export interface TranslationProgress {
   completed_sections: number;
   total_sections: number;
   error?: string | null;
+  /** sections completed since the `since` cursor of the request */
   partial_translated_sections?: TranslationSection[];
+  /** pass as `since` on the next poll */
+  cursor?: number;
+  /** job restarted: partial_translated_sections starts over from the first section */
+  reset?: boolean;
 }
 
 export interface TranslationStartResult {
@@ -1269,11 +1274,12 @@ export async function translateText(
   return res.json();
 }
 
-/** Poll translation progress (light-weight). */
+/** Poll translation progress (light-weight); only sections after `since` are returned. */
 export async function getTranslationProgress(
   jobId: string,
+  since = 0,
 ): Promise<TranslationProgress> {
-  const res = await fetch(`${T_BASE}/progress/${jobId}`);
+  const res = await fetch(`${T_BASE}/progress/${jobId}?since=${since}`);
   if (!res.ok) throw new Error("Progress fetch failed");
   return res.json();
 }